@@ -1,59 +1,245 @@
+import os
 import re
 import json
 import asyncio
 import logging
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 
 from article_checker.chains import build_article_claim_extractor
 from core.lambdas import (
     get_article_text,
     calculate_fact_check_confidence,
     calculate_source_diversity_score,
+    evidence_source_key,
+    source_diversity_from_count,
+    _loop_semaphore,
+    _ttl_cache_get,
+    _ttl_cache_put,
 )
+from core.faiss_manager import cache_key
 from core.llm_chains import (
-    build_claim_summarizer,
     build_reduce_similar_claims_chain,
     build_factcheck_chain,
     build_keyword_extractor_chain,
     build_three_line_summarizer_chain,
+    build_keywords_and_summary_chain,
 )
 
 # Reuse evidence retrieval pipeline from the existing YouTube flow
 from services.fact_checker import (
     search_and_retrieve_docs_once,
+    search_and_retrieve_docs_batch,
     MAX_CONCURRENT_CLAIMS,
     MAX_CONCURRENT_FACTCHECKS,
     MAX_EVIDENCES_PER_CLAIM,
 )
 
+# --- 설정값 ---
+# (주장, URL) 단위 LLM 판정 결과를 기억해 둘 최대 개수
+FACTCHECK_MEMO_SIZE = int(os.environ.get("FACTCHECK_MEMO_SIZE", "2048"))
+# 기사 분석 결과(주장·키워드·요약) 캐시 유지 시간과 최대 개수 (본문 캐시는 core.lambdas.get_article_text)
+ARTICLE_CACHE_TTL_SEC = int(os.environ.get("ARTICLE_CACHE_TTL_SEC", str(6 * 3600)))
+ARTICLE_CACHE_SIZE = int(os.environ.get("ARTICLE_CACHE_SIZE", "256"))
+
+
+# 팩트체크 체인 출력 라벨 (핵심 근거 문장은 여러 줄일 수 있어 별도 처리)
+_FACTCHECK_LABELS = (
+    ("관련성:", "relevance"),
+    ("사실 설명 여부:", "fact_check_result"),
+    ("간단한 설명:", "justification"),
+)
+_SNIPPET_LABEL = "핵심 근거 문장:"
+
+# 줄 단위 파싱이 실패했을 때만 사용하는 보조 정규식
+_FACTCHECK_RE = re.compile(
+    r"관련성:\s*(?P<rel>[^\n]+).*?사실 설명 여부:\s*(?P<fc>[^\n]+).*?간단한 설명:\s*(?P<just>[^\n]+)"
+    r"(?:.*?핵심 근거 문장:\s*(?P<snip>.+))?",
+    re.DOTALL,
+)
+
+
+def _parse_factcheck_output(text: str) -> Dict[str, str] | None:
+    """팩트체크 체인 출력에서 관련성/사실 설명 여부/간단한 설명/핵심 근거 문장을 한 번에 추출합니다.
+
+    라벨로 시작하는 줄을 한 번 훑는 방식을 우선 사용하고,
+    필수 필드가 빠진 경우에만 정규식으로 다시 시도합니다.
+    """
+    fields: Dict[str, str] = {}
+    lines = text.splitlines()
+    for i, line in enumerate(lines):
+        stripped = line.lstrip("-*• \t")
+        if stripped.startswith(_SNIPPET_LABEL):
+            rest = [stripped[len(_SNIPPET_LABEL):]] + lines[i + 1:]
+            fields["snippet"] = "\n".join(rest).lstrip("* ").strip()
+            break
+        for label, key in _FACTCHECK_LABELS:
+            if key not in fields and stripped.startswith(label):
+                fields[key] = stripped[len(label):].strip()
+                break
+
+    if all(key in fields for _, key in _FACTCHECK_LABELS):
+        fields.setdefault("snippet", "")
+        return fields
+
+    m = _FACTCHECK_RE.search(text)
+    if not m:
+        return None
+    return {
+        "relevance": m.group("rel").strip(),
+        "fact_check_result": m.group("fc").strip(),
+        "justification": m.group("just").strip(),
+        "snippet": (m.group("snip") or "").strip(),
+    }
+
+
+def _is_relevant(relevance: str) -> bool:
+    """'관련성' 값이 '예'인지 판정합니다 (끝의 공백/마침표/강조 표시는 무시)."""
+    return relevance.rstrip(" .*").endswith("예")
+
+
+# (주장 해시, URL) → (저장 시각, 파싱된 팩트체크 결과). 재시도/재요청 시 같은 조합의 LLM 호출을 생략합니다.
+# 파싱에 실패한(형식이 어긋난) 응답은 일시적일 수 있으므로 기억하지 않고 다음 요청에서 다시 묻습니다.
+_FACTCHECK_MEMO: Dict[Tuple[str, str], Tuple[float, Dict[str, str]]] = {}
+
+
+def _remember_verdict(key: Tuple[str, str], parsed: Dict[str, str] | None) -> None:
+    if parsed is None:
+        return
+    _ttl_cache_put(_FACTCHECK_MEMO, key, parsed, FACTCHECK_MEMO_SIZE)
+
+
+# 본문 해시 → (저장 시각, (팩트체크 대상 주장, 키워드, 세 줄 요약))
+_ARTICLE_ANALYSIS_CACHE: Dict[str, Tuple[float, Tuple[List[str], str, str]]] = {}
+
+
+async def _bounded_factcheck(fact_checker, inputs: Dict[str, str]):
+    # 팩트체크 LLM 호출의 전역 동시 실행 상한 (주장 수와 무관하게 MAX_CONCURRENT_FACTCHECKS, 이벤트 루프별)
+    async with _loop_semaphore("factcheck", MAX_CONCURRENT_FACTCHECKS):
+        return await fact_checker.ainvoke(inputs)
+
+
+def _confidence_from_counts(source_count: int, evidence_count: int) -> int:
+    """서로 다른 출처 수와 증거 수로 신뢰도(0~100)를 계산합니다."""
+    return calculate_fact_check_confidence(
+        {"source_diversity": source_diversity_from_count(source_count), "evidence_count": min(evidence_count, 5)}
+    )
+
+
+def _evidence_confidence(evidence: List[Dict[str, Any]]) -> int:
+    """검증된 증거 목록의 출처 다양성/개수로 신뢰도(0~100)를 계산합니다."""
+    diversity_score = calculate_source_diversity_score(evidence)
+    return calculate_fact_check_confidence(
+        {"source_diversity": diversity_score, "evidence_count": min(len(evidence), 5)}
+    )
+
+
+# LCEL 체인은 상태가 없으므로 한 번만 만들어 재사용합니다.
+_CHAINS: Dict[str, Any] = {}
+
+
+def _get_chain(builder):
+    chain = _CHAINS.get(builder.__name__)
+    if chain is None:
+        chain = _CHAINS[builder.__name__] = builder()
+    return chain
+
+
+def _loads_json_block(text: str) -> Any:
+    """LLM 응답에서 JSON 값을 파싱합니다. 실패하면 None을 반환합니다.
+
+    응답 전체를 먼저 json.loads로 시도하고, 실패하면 ```json ... ``` 펜스 안쪽만 잘라 다시 시도합니다.
+    """
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        pass
+
+    start = text.find("```json")
+    if start != -1:
+        end = text.rfind("```")
+        if end > start:
+            try:
+                return json.loads(text[start + len("```json"):end])
+            except json.JSONDecodeError:
+                pass
+    return None
+
+
+async def _extract_keywords_and_summary(article_text: str) -> Tuple[str, str]:
+    """키워드(JSON 배열 문자열)와 세 줄 요약을 한 번의 LLM 호출로 생성합니다.
+
+    응답을 파싱하지 못하면 기존의 키워드/요약 체인을 각각 호출합니다.
+    """
+    result = await _get_chain(build_keywords_and_summary_chain).ainvoke({"text": article_text})
+    parsed = _loads_json_block((result.content or "").strip())
+    if isinstance(parsed, dict) and isinstance(parsed.get("keywords"), list):
+        summary = parsed.get("summary") or ""
+        if isinstance(summary, list):
+            summary = "\n".join(str(line).strip() for line in summary)
+        return json.dumps(parsed["keywords"], ensure_ascii=False), str(summary).strip()
+
+    logging.warning("키워드/요약 통합 응답 파싱 실패 → 개별 체인으로 재시도")
+    keywords_result, summary_result = await asyncio.gather(
+        _get_chain(build_keyword_extractor_chain).ainvoke({"text": article_text}),
+        _get_chain(build_three_line_summarizer_chain).ainvoke({"text": article_text}),
+    )
+    extracted_keywords = keywords_result.content.strip() if keywords_result.content else ""
+    three_line_summary = summary_result.content.strip() if summary_result.content else ""
+    return extracted_keywords, three_line_summary
+
+
+# 본문이 이보다 짧거나 문장이 거의 없으면 주장 추출 LLM을 호출하지 않음
+_MIN_ARTICLE_CHARS = 400
+_MIN_ARTICLE_SENTENCES = 3
+# 본문 대신 쿠키/스크립트 안내문만 수집된 경우 (짧은 본문에서만 검사)
+_BOILERPLATE_RE = re.compile(
+    r"쿠키를 사용|쿠키 사용에 동의|자바스크립트를 (?:활성화|사용)|javascript(?:를)? (?:활성화|사용)|enable javascript",
+    re.IGNORECASE,
+)
+_BOILERPLATE_MAX_CHARS = 1000
+
+
+def _skip_claim_extraction_reason(article_text: str) -> str | None:
+    if len(article_text) < _MIN_ARTICLE_CHARS:
+        return f"본문 길이 {len(article_text)}자"
+    if article_text.count(".") < _MIN_ARTICLE_SENTENCES:
+        return "문장 수 부족"
+    if len(article_text) < _BOILERPLATE_MAX_CHARS and _BOILERPLATE_RE.search(article_text):
+        return "쿠키/스크립트 안내문"
+    return None
+
 
 async def _extract_claims_from_article(article_text: str) -> List[str]:
-    extractor = build_article_claim_extractor()
+    reason = _skip_claim_extraction_reason(article_text)
+    if reason:
+        logging.info(f"주장 추출 생략 ({reason})")
+        return []
+    extractor = _get_chain(build_article_claim_extractor)
     result = await extractor.ainvoke({"article_text": article_text})
     lines = [line.strip() for line in (result.content or "").split("\n") if line.strip()]
     return lines
 
 
 async def _reduce_claims(claims: List[str]) -> List[str]:
-    reducer = build_reduce_similar_claims_chain()
+    # 병합할 대상이 없으면 LLM 호출 생략
+    if len(claims) <= 1:
+        return claims
+    reducer = _get_chain(build_reduce_similar_claims_chain)
     claims_json = json.dumps(claims, ensure_ascii=False, indent=2)
     reduced_result = await reducer.ainvoke({"claims_json": claims_json})
 
-    claims_to_check: List[str] = []
-    try:
-        json_match = re.search(r"```json\s*(\[.*?\])\s*```", reduced_result.content or "", re.DOTALL)
-        if json_match:
-            json_content = json_match.group(1)
-            claims_to_check = json.loads(json_content)
-        else:
-            claims_to_check = [line.strip() for line in (reduced_result.content or "").strip().split('\n') if line.strip()]
-    except json.JSONDecodeError:
-        claims_to_check = [
-            line.strip() for line in (reduced_result.content or "").strip().split('\n')
-            if line.strip() and not line.strip().startswith(('```json', '```', '[', ']'))
-        ]
-    return claims_to_check
+    text = (reduced_result.content or "").strip()
+
+    parsed = _loads_json_block(text)
+    if isinstance(parsed, list):
+        return parsed
+
+    # JSON 파싱 실패 시 줄 단위 폴백
+    return [
+        line.strip() for line in text.split('\n')
+        if line.strip() and not line.strip().startswith(('```json', '```', '[', ']'))
+    ]
 
 
 async def run_article_fact_check(article_url: str, faiss_partition_dirs: List[str]) -> Dict[str, Any]:
@@ -65,88 +251,160 @@ async def run_article_fact_check(article_url: str, faiss_partition_dirs: List[st
     logging.info(f"기사 분석 시작: {article_url}")
 
     # 1) Fetch article body
+    # 본문은 get_article_text가 URL 단위로 캐시 (동시 요청은 한 번만 가져옴)
     article_text = await get_article_text(article_url)
     if not article_text:
         return {"error": "Failed to load article"}
 
-    # 5) Extract keywords and summary
-    keyword_extractor = build_keyword_extractor_chain()
-    summarizer = build_three_line_summarizer_chain()
-
-    keywords_task = keyword_extractor.ainvoke({"text": article_text})
-    summary_task = summarizer.ainvoke({"text": article_text})
+    # 같은 본문이면 주장 추출/정제와 키워드·요약 결과를 재사용
+    text_key = cache_key(article_text)
+    cached_analysis = _ttl_cache_get(_ARTICLE_ANALYSIS_CACHE, text_key, ARTICLE_CACHE_TTL_SEC)
+    if cached_analysis is not None:
+        claims_to_check, extracted_keywords, three_line_summary = cached_analysis
+        logging.info(f"♻️ 기사 분석 캐시 사용: 주장 {len(claims_to_check)}개")
+    else:
+        # 2) Extract claims from article body (article-specific chain)
+        #    스텁 본문(짧음/문장 부족/안내문)은 _extract_claims_from_article이 LLM 호출 전에 걸러냄
+        try:
+            claims_raw = await _extract_claims_from_article(article_text)
+            # 3) Reduce/normalize claims (reuse existing reducer)
+            claims_to_check = await _reduce_claims(claims_raw) if claims_raw else []
+            # Keep parity with service defaults (max 10)
+            claims_to_check = claims_to_check[:10]
+        except Exception as e:
+            logging.exception(f"주장 추출/정제 중 오류: {e}")
+            return {"error": f"Failed to extract claims: {e}"}
+
+        # 5) Extract keywords and summary (single fused LLM call) — 검증할 주장이 있을 때만
+        if claims_to_check:
+            logging.info(f"✂️ 기사 기반 최종 팩트체크 대상 주장 {len(claims_to_check)}개: {claims_to_check}")
+            extracted_keywords, three_line_summary = await _extract_keywords_and_summary(article_text)
+        else:
+            extracted_keywords, three_line_summary = "", ""
 
-    keywords_result, summary_result = await asyncio.gather(keywords_task, summary_task)
+        # 주장이 없다는 결과도 캐시해 같은 본문에 LLM을 다시 호출하지 않음
+        _ttl_cache_put(_ARTICLE_ANALYSIS_CACHE, text_key, (claims_to_check, extracted_keywords, three_line_summary), ARTICLE_CACHE_SIZE)
 
-    extracted_keywords = keywords_result.content.strip() if keywords_result.content else ""
-    three_line_summary = summary_result.content.strip() if summary_result.content else ""
+    if not claims_to_check:
+        return {
+            "article_url": article_url,
+            "article_total_confidence_score": 0,
+            "claims": [],
+        }
 
-    # 2) Extract claims from article body (article-specific chain)
+    # 4) 네이버 기반 1차 근거 검색은 모든 주장을 묶어서 수행 (파티션별 1회 로드/검색)
     try:
-        claims_raw = await _extract_claims_from_article(article_text)
-        if not claims_raw:
-            return {
-                "article_url": article_url,
-                "article_total_confidence_score": 0,
-                "claims": [],
-            }
-
-        # 3) Reduce/normalize claims (reuse existing reducer)
-        claims_to_check = await _reduce_claims(claims_raw)
-        # Keep parity with service defaults (max 10)
-        claims_to_check = claims_to_check[:10]
-        if not claims_to_check:
-            return {
-                "article_url": article_url,
-                "article_total_confidence_score": 0,
-                "claims": [],
-            }
-        logging.info(f"✂️ 기사 기반 최종 팩트체크 대상 주장 {len(claims_to_check)}개: {claims_to_check}")
+        prefetched_docs = await search_and_retrieve_docs_batch(claims_to_check, faiss_partition_dirs)
     except Exception as e:
-        logging.exception(f"주장 추출/정제 중 오류: {e}")
-        return {"error": f"Failed to extract claims: {e}"}
+        logging.error(f"주장 일괄 근거 검색 실패, 주장별 검색으로 진행: {e}")
+        prefetched_docs = None
 
-    # 4) For each claim: CSE + FAISS titles → fetch evidence and fact-check
+    # For each claim: CSE + FAISS titles → fetch evidence and fact-check
     async def process_claim_step(idx: int, claim: str) -> Dict[str, Any]:
         logging.info(f"--- 기사 팩트체크 시작: ({idx + 1}/{len(claims_to_check)}) '{claim}'")
         url_set = set()
-        validated_evidence: List[Dict[str, Any]] = []
-        fact_checker = build_factcheck_chain()
-
-        async def factcheck_doc(doc):
-            try:
-                check_result = await fact_checker.ainvoke({"claim": claim, "context": doc.page_content})
-                result_content = check_result.content or ""
-                relevance = re.search(r"관련성: (.+)", result_content)
-                fact_check_result_match = re.search(r"사실 설명 여부: (.+)", result_content)
-                justification = re.search(r"간단한 설명: (.+)", result_content)
-                snippet = re.search(r"핵심 근거 문장: (.+)", result_content, re.DOTALL)
+        # 네이버/Google CSE/파티션 9 단계에서 이미 LLM 검증에 넘긴 URL
+        seen_urls = set()
+        claim_key = cache_key(claim)
+        fact_checker = _get_chain(build_factcheck_chain)
+
+        def unseen(docs):
+            fresh = []
+            for doc in docs:
                 url = doc.metadata.get("url")
-
-                if (
-                    relevance and fact_check_result_match and justification
-                    and "예" in relevance.group(1)
-                    and url and url not in url_set
-                ):
-                    url_set.add(url)
-                    return {
-                        "url": url,
-                        "relevance": "yes",
-                        "fact_check_result": fact_check_result_match.group(1).strip(),
-                        "justification": justification.group(1).strip(),
-                        "snippet": snippet.group(1).strip() if snippet else "",
-                    }
-            except Exception as e:
-                logging.error(f"    - LLM 팩트체크 체인 실행 중 오류: {e}")
+                if url and url in seen_urls:
+                    continue
+                if url:
+                    seen_urls.add(url)
+                fresh.append(doc)
+            return fresh
+
+        async def factcheck_doc(doc) -> Dict[str, Any] | None:
+            url = doc.metadata.get("url")
+            memo_key = (claim_key, url)
+            parsed = _ttl_cache_get(_FACTCHECK_MEMO, memo_key, None) if url else None
+            if parsed is None:
+                try:
+                    check_result = await _bounded_factcheck(
+                        fact_checker, {"claim": claim, "context": doc.page_content}
+                    )
+                except Exception as e:
+                    logging.error(f"    - LLM 팩트체크 체인 실행 중 오류: {e}")
+                    return None
+                parsed = _parse_factcheck_output(check_result.content or "")
+                if url:
+                    _remember_verdict(memo_key, parsed)
+
+            if (
+                parsed and _is_relevant(parsed["relevance"])
+                and url and url not in url_set
+            ):
+                url_set.add(url)
+                return {
+                    "url": url,
+                    "relevance": "yes",
+                    "fact_check_result": parsed["fact_check_result"],
+                    "justification": parsed["justification"],
+                    "snippet": parsed["snippet"],
+                }
             return None
 
-        factcheck_semaphore = asyncio.Semaphore(MAX_CONCURRENT_FACTCHECKS)
-
-        async def limited_factcheck_doc(doc):
-            async with factcheck_semaphore:
-                return await factcheck_doc(doc)
+        async def collect_evidence(docs, evidence: List[Dict[str, Any]], tag: str) -> None:
+            """문서들을 동시에 검증하며 끝나는 순서대로 evidence에 추가합니다.
 
-        new_docs = await search_and_retrieve_docs_once(claim, faiss_partition_dirs, set())
+            증거가 MAX_EVIDENCES_PER_CLAIM개에 도달하거나 신뢰도가 100%가 되면 남은 호출은 취소합니다.
+            """
+            # 출처 다양성은 증거가 추가될 때마다 누적해 매번 전체를 다시 훑지 않음
+            sources = {key for key in map(evidence_source_key, evidence) if key}
+            pending = {asyncio.create_task(factcheck_doc(doc)) for doc in unseen(docs)}
+            try:
+                while pending:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        res = task.result()
+                        if res and len(evidence) < MAX_EVIDENCES_PER_CLAIM:
+                            evidence.append(res)
+                            key = evidence_source_key(res)
+                            if key:
+                                sources.add(key)
+                            logging.info(f"✅ [{tag}] 주장 '{claim}' → 증거 URL: {res.get('url', 'N/A')}")
+                    if len(evidence) >= MAX_EVIDENCES_PER_CLAIM:
+                        break
+                    if _confidence_from_counts(len(sources), len(evidence)) >= 100:
+                        break
+            finally:
+                for task in pending:
+                    task.cancel()
+
+        async def evaluate_against(docs, tag: str) -> Tuple[int, List[Dict[str, Any]]]:
+            """문서들을 검증해 (신뢰도, 채택된 증거)를 반환합니다."""
+            evidence: List[Dict[str, Any]] = []
+            await collect_evidence(docs, evidence, tag)
+            return _evidence_confidence(evidence), evidence
+
+        async def retry_with(docs, tag: str, confidence: int, evidence: List[Dict[str, Any]]):
+            """재검색 문서로 다시 검증하고, 신뢰도가 더 높은 쪽의 (신뢰도, 증거)를 반환합니다."""
+            if not docs:
+                logging.info(f"{tag}에서 문서를 찾지 못함")
+                return confidence, evidence
+            logging.info(f"{tag}에서 {len(docs)}개 문서 발견, 재팩트체크 수행")
+
+            retry_confidence, retry_evidence = await evaluate_against(docs, tag)
+            if not retry_evidence:
+                logging.info(f"{tag}(으)로도 검증된 증거를 찾지 못함")
+                return confidence, evidence
+            logging.info(f"{tag} 재팩트체크 완료: 신뢰도 {retry_confidence}% (증거 {len(retry_evidence)}개)")
+
+            if retry_confidence > confidence:
+                logging.info(f"{tag} 결과 선택: {retry_confidence}% > 기존 {confidence}%")
+                return retry_confidence, retry_evidence
+            logging.info(f"기존 결과 유지: {confidence}% >= {tag} {retry_confidence}%")
+            return confidence, evidence
+
+        if prefetched_docs is not None:
+            new_docs = prefetched_docs[idx]
+        else:
+            new_docs = await search_and_retrieve_docs_once(claim, faiss_partition_dirs, set())
         if not new_docs:
             logging.info(f"근거 문서를 찾지 못함: '{claim}'")
             return {
@@ -156,136 +414,44 @@ async def run_article_fact_check(article_url: str, faiss_partition_dirs: List[st
                 "evidence": [],
             }
 
-        for i in range(0, len(new_docs), MAX_CONCURRENT_FACTCHECKS):
-            if len(validated_evidence) >= MAX_EVIDENCES_PER_CLAIM:
-                break
-            batch = new_docs[i : i + MAX_CONCURRENT_FACTCHECKS]
-            factcheck_results = await asyncio.gather(*[limited_factcheck_doc(doc) for doc in batch])
-            for res in factcheck_results:
-                if res and isinstance(res, dict):  # None이 아니고 dict 타입인지 확인
-                    validated_evidence.append(res)
-                    logging.info(f"✅ [네이버] 주장 '{claim}' → 증거 URL: {res.get('url', 'N/A')}")
-                    if len(validated_evidence) >= MAX_EVIDENCES_PER_CLAIM:
-                        break
-
-        diversity_score = calculate_source_diversity_score(validated_evidence)
-        confidence_score = calculate_fact_check_confidence(
-            {"source_diversity": diversity_score, "evidence_count": min(len(validated_evidence), 5)}
-        )
-
+        final_confidence, final_evidence = await evaluate_against(new_docs, "네이버")
         logging.info(
-            f"--- 기사 팩트체크 완료: '{claim}' -> 신뢰도: {confidence_score}% (증거 {len(validated_evidence)}개)"
+            f"--- 기사 팩트체크 완료: '{claim}' -> 신뢰도: {final_confidence}% (증거 {len(final_evidence)}개)"
         )
 
         # 신뢰도가 20% 이하일 경우 Google CSE로 재시도
-        naver_confidence = confidence_score
-        naver_evidence = validated_evidence.copy()
-        
-        if confidence_score <= 20:
-            logging.info(f"신뢰도 {confidence_score}%로 인한 Google CSE 재시도: '{claim}'")
-            
-            # Google CSE로 재검색
+        if final_confidence <= 20:
+            logging.info(f"신뢰도 {final_confidence}%로 인한 Google CSE 재시도: '{claim}'")
             google_docs = await search_and_retrieve_docs_once(claim, faiss_partition_dirs, set(), use_google_cse=True)
-            if google_docs:
-                logging.info(f"Google CSE로 {len(google_docs)}개 문서 발견, 재팩트체크 수행")
-                
-                # Google CSE 결과로 재팩트체크
-                google_validated_evidence = []
-                for i in range(0, len(google_docs), MAX_CONCURRENT_FACTCHECKS):
-                    if len(google_validated_evidence) >= MAX_EVIDENCES_PER_CLAIM:
-                        break
-                    batch = google_docs[i : i + MAX_CONCURRENT_FACTCHECKS]
-                    factcheck_results = await asyncio.gather(*[limited_factcheck_doc(doc) for doc in batch])
-                    for res in factcheck_results:
-                        if res and isinstance(res, dict):  # None이 아니고 dict 타입인지 확인
-                            google_validated_evidence.append(res)
-                            logging.info(f"✅ [Google CSE] 주장 '{claim}' → 증거 URL: {res.get('url', 'N/A')}")
-                            if len(google_validated_evidence) >= MAX_EVIDENCES_PER_CLAIM:
-                                break
-                
-                # Google CSE 결과로 신뢰도 계산
-                if google_validated_evidence:
-                    google_diversity_score = calculate_source_diversity_score(google_validated_evidence)
-                    google_confidence = calculate_fact_check_confidence(
-                        {"source_diversity": google_diversity_score, "evidence_count": min(len(google_validated_evidence), 5)}
-                    )
-                    logging.info(f"Google CSE 재팩트체크 완료: 신뢰도 {google_confidence}% (증거 {len(google_validated_evidence)}개)")
-                    
-                    # 둘 중 더 높은 신뢰도 선택
-                    if google_confidence > naver_confidence:
-                        confidence_score = google_confidence
-                        validated_evidence = google_validated_evidence
-                        logging.info(f"Google CSE 결과 선택: {google_confidence}% > 네이버 {naver_confidence}%")
-                    else:
-                        logging.info(f"네이버 결과 유지: {naver_confidence}% >= Google CSE {google_confidence}%")
-                else:
-                    logging.info("Google CSE로도 검증된 증거를 찾지 못함")
-            else:
-                logging.info("Google CSE로 문서를 찾지 못함")
+            final_confidence, final_evidence = await retry_with(google_docs, "Google CSE", final_confidence, final_evidence)
         else:
-            logging.info(f"신뢰도 {confidence_score}%로 충분하므로 Google CSE 재시도 생략")
+            logging.info(f"신뢰도 {final_confidence}%로 충분하므로 Google CSE 재시도 생략")
 
         # 최종 신뢰도가 20% 이하이면 파티션 9로 재시도
-        final_confidence = confidence_score
-        final_evidence = validated_evidence
-        
-        if confidence_score <= 20:
-            logging.info(f"최종 신뢰도 {confidence_score}%로 낮음 → 파티션 9로 재시도: '{claim}'")
+        if final_confidence <= 20:
+            logging.info(f"최종 신뢰도 {final_confidence}%로 낮음 → 파티션 9로 재시도: '{claim}'")
             
             # 파티션 9만 사용하여 재검색
-            partition_9_dirs = [dir for dir in faiss_partition_dirs if "9" in dir]
+            # 전체 경로가 아닌 디렉토리 이름만 검사 (예: /opt/data/v9.1/partition_3 오탐 방지)
+            partition_9_dirs = tuple(
+                d for d in faiss_partition_dirs if "9" in os.path.basename(os.path.normpath(d))
+            )
             logging.info(f"🔍 파티션 9 검색: 전체 파티션 {len(faiss_partition_dirs)}개 중 파티션 9 포함 {len(partition_9_dirs)}개 발견")
             if partition_9_dirs:
-                logging.info(f"파티션 9 디렉토리 {len(partition_9_dirs)}개 발견, 재검색 시작")
                 for dir in partition_9_dirs:
                     logging.info(f"  📁 파티션 9 경로: {dir}")
-                
-                # 파티션 9로 재검색
                 partition_9_docs = await search_and_retrieve_docs_once(claim, partition_9_dirs, set(), use_google_cse=False)
-                if partition_9_docs:
-                    logging.info(f"파티션 9에서 {len(partition_9_docs)}개 문서 발견, 재팩트체크 수행")
-                    
-                    # 파티션 9 결과로 재팩트체크
-                    partition_9_validated_evidence = []
-                    for i in range(0, len(partition_9_docs), MAX_CONCURRENT_FACTCHECKS):
-                        if len(partition_9_validated_evidence) >= MAX_EVIDENCES_PER_CLAIM:
-                            break
-                        batch = partition_9_docs[i : i + MAX_CONCURRENT_FACTCHECKS]
-                        factcheck_results = await asyncio.gather(*[limited_factcheck_doc(doc) for doc in batch])
-                        for res in factcheck_results:
-                            if res and isinstance(res, dict):
-                                partition_9_validated_evidence.append(res)
-                                logging.info(f"✅ [파티션9] 주장 '{claim}' → 증거 URL: {res.get('url', 'N/A')}")
-                                if len(partition_9_validated_evidence) >= MAX_EVIDENCES_PER_CLAIM:
-                                    break
-                    
-                    # 파티션 9 결과로 신뢰도 계산
-                    if partition_9_validated_evidence:
-                        partition_9_diversity_score = calculate_source_diversity_score(partition_9_validated_evidence)
-                        partition_9_confidence = calculate_fact_check_confidence(
-                            {"source_diversity": partition_9_diversity_score, "evidence_count": min(len(partition_9_validated_evidence), 5)}
-                        )
-                        logging.info(f"파티션 9 재팩트체크 완료: 신뢰도 {partition_9_confidence}% (증거 {len(partition_9_validated_evidence)}개)")
-                        
-                        # 파티션 9 결과가 더 높으면 선택
-                        if partition_9_confidence > final_confidence:
-                            final_confidence = partition_9_confidence
-                            final_evidence = partition_9_validated_evidence
-                            logging.info(f"파티션 9 결과 선택: {partition_9_confidence}% > 기존 {confidence_score}%")
-                        else:
-                            logging.info(f"기존 결과 유지: {confidence_score}% >= 파티션 9 {partition_9_confidence}%")
-                    else:
-                        logging.info("파티션 9으로도 검증된 증거를 찾지 못함")
-                else:
-                    logging.info("파티션 9에서 문서를 찾지 못함")
+                final_confidence, final_evidence = await retry_with(partition_9_docs, "파티션 9", final_confidence, final_evidence)
             else:
                 logging.info("파티션 9 디렉토리를 찾을 수 없음")
 
+        if len(final_evidence) > 3:
+            final_evidence = final_evidence[:3]
         return {
             "claim": claim,
             "result": "likely_true" if final_evidence else "insufficient_evidence",
             "confidence_score": final_confidence,
-            "evidence": final_evidence[:3],
+            "evidence": final_evidence,
         }
 
     claim_semaphore = asyncio.Semaphore(MAX_CONCURRENT_CLAIMS)
@@ -318,33 +484,35 @@ async def run_article_fact_check(article_url: str, faiss_partition_dirs: List[st
             outputs.append(res)
 
     if outputs:
-        # 가중 평균 계산
+        # 가중 평균과 증거 확보 비율을 한 번의 순회로 계산
         total_weighted_score = 0
         total_weight = 0
-        
+        likely = 0
+
         for output in outputs:
-            confidence = output.get("confidence_score", 0)
-            evidence_count = len(output.get('evidence', []))
-            
+            confidence = output["confidence_score"]
+            evidence_count = len(output["evidence"])
+            likely += output["result"] == "likely_true"
+
             # insufficient_evidence 보정 (0% 대신 최소값 적용)
             if confidence == 0 and evidence_count == 0:
                 confidence = 10  # 최소값
-            
+
             # 가중치 계산: 증거 개수 + 신뢰도 기반
             evidence_weight = min(evidence_count + 1, 5)  # 증거 0개=1, 1개=2, ..., 최대 5
             confidence_weight = max(confidence / 20, 0.5)  # 신뢰도 20% 이상=1.0, 10%=0.5, 최소 0.5
-            
+
             weight = evidence_weight * confidence_weight
             total_weighted_score += confidence * weight
             total_weight += weight
-        
+
         # 가중 평균 계산
         if total_weight > 0:
             avg_score = round(total_weighted_score / total_weight)
         else:
             avg_score = 0
-            
-        evidence_ratio = sum(1 for o in outputs if o.get("result") == "likely_true") / len(outputs)
+
+        evidence_ratio = likely / len(outputs)
         summary = (
             f"증거 확보된 주장 비율: {evidence_ratio*100:.1f}%"
             if len(outputs) >= 3
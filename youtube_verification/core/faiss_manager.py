@@ -1,27 +1,77 @@
 import os
+import time
+import asyncio
+import base64
 import shutil
 import hashlib
+import zlib
+import pickle
+import functools
 import logging
 import boto3
+import faiss
+import numpy as np
+from boto3.s3.transfer import TransferConfig
+import orjson
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from urllib.parse import urlparse, urlunparse, parse_qs, urlencode
 from langchain.docstore.document import Document
 from langchain_community.vectorstores import FAISS
-from langchain.text_splitter import RecursiveCharacterTextSplitter
+from langchain_community.docstore.in_memory import InMemoryDocstore
 
 # --- 설정 ---
 CHUNK_CACHE_DIR = "article_faiss_cache"
 S3_BUCKET_NAME = os.environ.get("S3_BUCKET_NAME", "factseeker-faiss-db")
 S3_PREFIX = "article_faiss_cache/"
+S3_MAX_POOL_CONNECTIONS = int(os.environ.get("S3_MAX_POOL_CONNECTIONS", "64"))
+S3_CONNECT_TIMEOUT = float(os.environ.get("S3_CONNECT_TIMEOUT", "3"))
+S3_READ_TIMEOUT = float(os.environ.get("S3_READ_TIMEOUT", "10"))
+S3_TRANSFER_WORKERS = int(os.environ.get("S3_TRANSFER_WORKERS", "8"))
+# 이 개수 미만의 캐시 키는 키별 HEAD로, 이상이면 접두사별 LIST로 S3 존재 여부를 확인
+BULK_LIST_MIN_KEYS = int(os.environ.get("BULK_LIST_MIN_KEYS", "50"))
+# 최근 로드/생성한 기사 FAISS를 메모리에 두고 디스크/S3보다 먼저 확인 (TTL, 최대 개수)
+FAISS_HOT_CACHE_TTL_SEC = float(os.environ.get("FAISS_HOT_CACHE_TTL_SEC", "900"))
+FAISS_HOT_CACHE_SIZE = int(os.environ.get("FAISS_HOT_CACHE_SIZE", "128"))
+# S3 캐시 객체 zlib 압축 레벨 (0이면 압축하지 않음). 10% 이상 줄어들 때만 압축본을 올림
+S3_CACHE_COMPRESS_LEVEL = int(os.environ.get("S3_CACHE_COMPRESS_LEVEL", "3"))
+# 이 크기 이상의 로컬 index.faiss는 mmap으로 로드 (작은 기사 인덱스는 통째로 읽는 편이 빠름)
+FAISS_MMAP_MIN_BYTES = int(os.environ.get("FAISS_MMAP_MIN_BYTES", str(16 * 1024 * 1024)))
 os.makedirs(CHUNK_CACHE_DIR, exist_ok=True)
 
 try:
-    s3 = boto3.client("s3")
+    # 모듈 전역 단일 클라이언트: 모든 S3 호출이 같은 커넥션 풀을 재사용
+    # (스레드 풀에서 동시에 전송해도 풀이 모자라지 않도록 크기를 늘리고, 재시도/타임아웃을 명시)
+    s3 = boto3.client(
+        "s3",
+        config=Config(
+            max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+            retries={"max_attempts": 3, "mode": "adaptive"},
+            tcp_keepalive=True,
+            connect_timeout=S3_CONNECT_TIMEOUT,
+            read_timeout=S3_READ_TIMEOUT,
+        ),
+    )
 except Exception as e:
     s3 = None
     logging.critical(f"S3 클라이언트 초기화 실패! S3 기능을 사용할 수 없습니다. 에러: {e}")
 
+# 수백 MB급 index.faiss 전송용 멀티파트 설정 (기본 8MB 청크/256KB IO 버퍼보다 크게)
+S3_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=16 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=16,
+    max_io_queue=1000,
+    io_chunksize=1024 * 1024,
+    use_threads=True,
+)
+
+# 기사 FAISS 캐시를 구성하는 파일 (FAISS.save_local 기본 이름)
+ARTICLE_FAISS_FILES = ("index.faiss", "index.pkl")
+
 # --- 내부 헬퍼 함수 ---
+# URL 정규화/캐시 키는 순수 함수이고 같은 URL이 반복 조회되므로 결과를 메모이즈
+@functools.lru_cache(maxsize=8192)
 def _normalize_url(url):
     # Be defensive: ensure we operate on a string
     if url is None:
@@ -35,87 +85,416 @@ def _normalize_url(url):
     query = urlencode(filtered_params, doseq=True)
     return urlunparse((parsed.scheme, netloc, parsed.path, parsed.params, query, parsed.fragment)).rstrip('/')
 
-def _url_to_cache_key(url):
-    norm = _normalize_url(url)
-    return hashlib.md5(norm.encode()).hexdigest()
+@functools.lru_cache(maxsize=8192)
+def url_to_cache_key(url):
+    """정규화 URL의 캐시 키 (v2: BLAKE2b-128 base32 소문자 26자)."""
+    return cache_key(_normalize_url(url)).lower()
+
+@functools.lru_cache(maxsize=8192)
+def legacy_url_to_cache_key(url):
+    """v1 캐시 키 (원본 URL 문자열의 md5 hex 32자). 기존 S3/로컬 캐시를 찾을 때만 사용합니다.
+
+    v1 캐시는 services.fact_checker가 정규화 없이 URL 그대로 해시해 기록했으므로 같은 방식으로 계산합니다.
+    (외부 인덱스 메타데이터의 NaN 등 문자열이 아닌 값도 str로 변환)
+    """
+    if url is None:
+        raw = ""
+    elif not isinstance(url, str):
+        raw = str(url)
+    else:
+        raw = url
+    return hashlib.md5(raw.encode()).hexdigest()
+
+def cache_key(data: str | bytes) -> str:
+    """메모리 캐시 등 비암호 용도의 짧은 키 (BLAKE2b-128, base32 26자)."""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    digest = hashlib.blake2b(data, digest_size=16).digest()
+    return base64.b32encode(digest).rstrip(b"=").decode("ascii")
+
+async def _transfer_all(fn, items):
+    """S3 전송 작업들을 스레드에서 동시에 실행합니다. (boto3 client는 스레드 간 공유 가능)"""
+    semaphore = asyncio.Semaphore(S3_TRANSFER_WORKERS)
+
+    async def _run(item):
+        async with semaphore:
+            return await asyncio.to_thread(fn, item)
+
+    await asyncio.gather(*[_run(item) for item in items])
 
-def _download_from_s3(local_dir_path, s3_key_prefix):
+def _list_s3_keys(s3_key_prefix: str) -> list[str]:
+    # 1000개 초과 키도 누락되지 않도록 paginator로 목록 조회
+    paginator = s3.get_paginator('list_objects_v2')
+    return [
+        obj['Key']
+        for page in paginator.paginate(Bucket=S3_BUCKET_NAME, Prefix=s3_key_prefix)
+        for obj in page.get('Contents', [])
+    ]
+
+async def _download_keys(local_dir_path: str, keys: list[str]):
+    os.makedirs(local_dir_path, exist_ok=True)
+    await _transfer_all(
+        lambda k: s3.download_file(
+            S3_BUCKET_NAME, k, os.path.join(local_dir_path, os.path.basename(k)), Config=S3_TRANSFER_CONFIG
+        ),
+        keys,
+    )
+
+async def _download_from_s3(local_dir_path, s3_key_prefix, keys: list[str] | None = None):
+    """S3 캐시 폴더를 내려받습니다. 객체 키 목록(keys)을 이미 알고 있으면 목록 조회를 생략합니다."""
     if not s3: return False
     try:
-        response = s3.list_objects_v2(Bucket=S3_BUCKET_NAME, Prefix=s3_key_prefix)
-        if 'Contents' not in response: return False
-        os.makedirs(local_dir_path, exist_ok=True)
-        for obj in response['Contents']:
-            s3_path = obj['Key']
-            local_file_path = os.path.join(local_dir_path, os.path.basename(s3_path))
-            s3.download_file(S3_BUCKET_NAME, s3_path, local_file_path)
+        if keys is None:
+            keys = await asyncio.to_thread(_list_s3_keys, s3_key_prefix)
+        if not keys: return False
+        await _download_keys(local_dir_path, keys)
         logging.info(f"✅ S3 캐시 다운로드 성공: {s3_key_prefix}")
         return True
     except ClientError as e:
         logging.error(f"S3 다운로드 실패: s3://{S3_BUCKET_NAME}/{s3_key_prefix} - {e}")
+        shutil.rmtree(local_dir_path, ignore_errors=True)
         return False
 
-def _upload_to_s3(local_dir_path: str, s3_key_prefix: str):
+def _head_cache_files(key: str) -> list[str]:
+    """index.faiss 존재 여부를 HEAD로 확인하고, 있으면 캐시 파일 키 목록을 반환합니다."""
+    faiss_key = f"{S3_PREFIX}{key}/index.faiss"
+    try:
+        s3.head_object(Bucket=S3_BUCKET_NAME, Key=faiss_key)
+    except ClientError as e:
+        if e.response['Error']['Code'] not in ('404', 'NoSuchKey', 'NotFound'):
+            logging.error(f"S3 캐시 확인 실패: s3://{S3_BUCKET_NAME}/{faiss_key} - {e}")
+        return []
+    return [faiss_key, f"{S3_PREFIX}{key}/index.pkl"]
+
+async def _find_s3_cache_files(keys: set[str]) -> dict[str, list[str]]:
+    """여러 캐시 키의 S3 객체 목록을 한꺼번에 조회합니다. (없는 키는 결과에서 빠짐)
+
+    키가 적으면 키별 HEAD, 많으면 해시 앞 2글자 접두사별 LIST 한 번으로 묶어 왕복 횟수를 줄입니다.
+    """
+    if len(keys) < BULK_LIST_MIN_KEYS:
+        found = await asyncio.gather(*[asyncio.to_thread(_head_cache_files, k) for k in keys])
+        return {k: files for k, files in zip(keys, found) if files}
+
+    prefixes = sorted({k[:2] for k in keys})
+    listed = await asyncio.gather(*[asyncio.to_thread(_list_s3_keys, f"{S3_PREFIX}{p}") for p in prefixes])
+    files_by_key: dict[str, list[str]] = {}
+    for object_keys in listed:
+        for object_key in object_keys:
+            key = object_key[len(S3_PREFIX):].split("/", 1)[0]
+            if key in keys:
+                files_by_key.setdefault(key, []).append(object_key)
+    return files_by_key
+
+def _compress(data: bytes) -> bytes:
+    if S3_CACHE_COMPRESS_LEVEL <= 0:
+        return data
+    packed = zlib.compress(data, S3_CACHE_COMPRESS_LEVEL)
+    return packed if len(packed) < len(data) * 0.9 else data
+
+def _is_compressed(data: bytes) -> bool:
+    # index.faiss는 b"I", docstore는 b"\x01"(orjson)/b"\x80"(pickle)로 시작하므로 zlib 헤더(0x78..)와 겹치지 않음
+    return len(data) >= 2 and data[0] == 0x78 and (data[0] * 256 + data[1]) % 31 == 0
+
+def _decompress(data: bytes) -> bytes:
+    return zlib.decompress(data) if _is_compressed(data) else data
+
+async def _put_bytes_to_s3(s3_key_prefix: str, files: dict[str, bytes]):
+    """메모리의 캐시 파일들을 put_object로 바로 올립니다. (로컬 파일을 다시 읽지 않음)"""
     if not s3: return
     try:
-        for file_name in os.listdir(local_dir_path):
-            local_file_path = os.path.join(local_dir_path, file_name)
-            if os.path.isfile(local_file_path):
-                s3_key = os.path.join(s3_key_prefix, file_name)
-                s3.upload_file(local_file_path, S3_BUCKET_NAME, s3_key)
+        await _transfer_all(
+            lambda item: s3.put_object(Bucket=S3_BUCKET_NAME, Key=f"{s3_key_prefix}{item[0]}", Body=_compress(item[1])),
+            list(files.items()),
+        )
         logging.info(f"✅ S3 업로드 성공: {s3_key_prefix}")
     except Exception as e:
         logging.error(f"❌ S3 업로드 실패: {s3_key_prefix} -> {e}")
 
-# --- 외부 호출 함수 ---
-def get_or_build_faiss(url: str, article_text: str, embed_model) -> FAISS | None:
-    """기사 URL을 기준으로 FAISS 인덱스를 생성하고 S3에 캐싱합니다."""
-    if not article_text or len(article_text.strip()) < 200:
-        logging.warning(f"기사 내용이 너무 짧아 FAISS 인덱스를 생성하지 않습니다: {url}")
-        return None
+async def _get_bytes_from_s3(keys: list[str]) -> dict[str, bytes]:
+    """get_object로 객체들을 메모리로 읽습니다. 반환값은 파일 이름 → (압축 해제된) 내용."""
+    names = [os.path.basename(k) for k in keys]
+    blobs = await asyncio.gather(*[
+        asyncio.to_thread(lambda k=k: _decompress(s3.get_object(Bucket=S3_BUCKET_NAME, Key=k)["Body"].read()))
+        for k in keys
+    ])
+    return dict(zip(names, blobs))
+
+# --- FAISS 로컬 저장/로드 (docstore 직렬화 포맷 버전 관리) ---
+# index.pkl 첫 바이트가 이 값이면 orjson 포맷, 그 외(pickle은 b"\x80")는 기존 FAISS.save_local 포맷
+_DOCSTORE_MAGIC = b"\x01"
+
+def _dump_docstore(db: FAISS) -> bytes:
+    """docstore와 index→docstore id 매핑을 orjson으로 직렬화합니다. 직렬화할 수 없는 메타데이터면 pickle로 저장합니다."""
+    records = [
+        {"id": doc_id, "p": doc.page_content, "m": doc.metadata, "d": doc.id}
+        for doc_id, doc in db.docstore._dict.items()
+    ]
+    ids = [[int(i), doc_id] for i, doc_id in db.index_to_docstore_id.items()]
+    try:
+        return _DOCSTORE_MAGIC + orjson.dumps({"docs": records, "ids": ids})
+    except TypeError:
+        return pickle.dumps((db.docstore, db.index_to_docstore_id))
+
+def _load_docstore(blob: bytes):
+    if not blob.startswith(_DOCSTORE_MAGIC):
+        return pickle.loads(blob)
+    data = orjson.loads(blob[len(_DOCSTORE_MAGIC):])
+    docstore = InMemoryDocstore({
+        r["id"]: Document(id=r.get("d"), page_content=r["p"], metadata=r["m"]) for r in data["docs"]
+    })
+    return docstore, {i: doc_id for i, doc_id in data["ids"]}
+
+def save_faiss_local(db: FAISS, folder_path: str):
+    """FAISS.save_local과 같은 파일 구성(index.faiss/index.pkl)으로 저장하되, docstore는 orjson 포맷으로 기록합니다."""
+    os.makedirs(folder_path, exist_ok=True)
+    faiss.write_index(db.index, os.path.join(folder_path, "index.faiss"))
+    with open(os.path.join(folder_path, "index.pkl"), "wb") as f:
+        f.write(_dump_docstore(db))
+
+def load_faiss_local(folder_path: str, embed_model) -> FAISS:
+    """save_faiss_local/FAISS.save_local 어느 쪽으로 저장된 캐시든 로드합니다.
 
-    cache_key = _url_to_cache_key(url)
-    folder_path = os.path.join(CHUNK_CACHE_DIR, cache_key)
-    s3_key_prefix = f"{S3_PREFIX}{cache_key}/"
+    index.faiss가 FAISS_MMAP_MIN_BYTES 이상이면 mmap으로 열어 필요한 페이지만 읽습니다.
+    """
+    faiss_path = os.path.join(folder_path, "index.faiss")
+    with open(os.path.join(folder_path, "index.pkl"), "rb") as f:
+        docstore, index_to_docstore_id = _load_docstore(_decompress(f.read()))
+    with open(faiss_path, "rb") as f:
+        head = f.read(2)
+    if _is_compressed(head):
+        # 파일 다운로드 폴백으로 받은 압축 캐시
+        with open(faiss_path, "rb") as f:
+            index = faiss.deserialize_index(np.frombuffer(zlib.decompress(f.read()), dtype=np.uint8))
+    elif os.path.getsize(faiss_path) >= FAISS_MMAP_MIN_BYTES:
+        index = _read_index_mmap(faiss_path)
+    else:
+        index = faiss.read_index(faiss_path)
+    return FAISS(embed_model, index, docstore, index_to_docstore_id)
 
-    logging.info(f"⚙️ FAISS 인덱스 신규 생성 시도: {url}")
+def serialize_faiss(db: FAISS) -> tuple[bytes, bytes]:
+    """디스크를 거치지 않고 (index.faiss, index.pkl) 파일 내용을 바이트로 만듭니다."""
+    return faiss.serialize_index(db.index).tobytes(), _dump_docstore(db)
+
+def deserialize_faiss(index_bytes: bytes, docstore_bytes: bytes, embed_model) -> FAISS:
+    """serialize_faiss/디스크 캐시 파일 내용(바이트)으로 FAISS를 복원합니다."""
+    index = faiss.deserialize_index(np.frombuffer(index_bytes, dtype=np.uint8))
+    docstore, index_to_docstore_id = _load_docstore(docstore_bytes)
+    return FAISS(embed_model, index, docstore, index_to_docstore_id)
+
+def _write_cache_files(folder_path: str, files: dict[str, bytes]):
+    os.makedirs(folder_path, exist_ok=True)
+    for name, data in files.items():
+        with open(os.path.join(folder_path, name), "wb") as f:
+            f.write(data)
+
+def _read_cache_files(folder_path: str) -> dict[str, bytes]:
+    files = {}
+    for name in ARTICLE_FAISS_FILES:
+        with open(os.path.join(folder_path, name), "rb") as f:
+            files[name] = f.read()
+    return files
+
+# --- 제목 파티션 인덱스 (읽기 전용, 프로세스 내 공유) ---
+# 파티션 경로 → ((index.faiss 수정 시각, 크기), FAISS). 파일이 교체되면 다시 로드합니다.
+_INDEX_CACHE: dict[str, tuple[tuple[int, int], FAISS]] = {}
+
+def _read_index_mmap(faiss_path: str):
     try:
-        splitter = RecursiveCharacterTextSplitter(chunk_size=600, chunk_overlap=100)
-        docs = [Document(page_content=article_text, metadata={"url": url})]
-        chunks = splitter.split_documents(docs)
-        
-        db = FAISS.from_documents(chunks, embed_model)
-        os.makedirs(folder_path, exist_ok=True)
-        db.save_local(folder_path)
-        
-        _upload_to_s3(folder_path, s3_key_prefix)
+        return faiss.read_index(faiss_path, faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY)
+    except RuntimeError as e:
+        logging.warning(f"mmap 로드 미지원 인덱스, 일반 로드로 진행: {faiss_path} - {e}")
+        return faiss.read_index(faiss_path)
+
+def load_faiss_mmap(folder_path: str, embed_model) -> FAISS:
+    """읽기 전용 파티션 인덱스를 mmap으로 열고, 같은 파일이면 이미 로드한 객체를 재사용합니다."""
+    faiss_path = os.path.join(folder_path, "index.faiss")
+    st = os.stat(faiss_path)
+    version = (st.st_mtime_ns, st.st_size)
+    cached = _INDEX_CACHE.get(folder_path)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    with open(os.path.join(folder_path, "index.pkl"), "rb") as f:
+        docstore, index_to_docstore_id = _load_docstore(f.read())
+    db = FAISS(embed_model, _read_index_mmap(faiss_path), docstore, index_to_docstore_id)
+    _INDEX_CACHE[folder_path] = (version, db)
+    return db
+
+# --- 기사 FAISS 메모리 핫 캐시 (캐시 키 → (저장 시각, FAISS)) ---
+_HOT_CACHE: dict[str, tuple[float, FAISS]] = {}
+
+def _hot_get(key: str) -> FAISS | None:
+    entry = _HOT_CACHE.get(key)
+    if entry is None:
+        return None
+    saved_at, db = entry
+    if time.monotonic() - saved_at > FAISS_HOT_CACHE_TTL_SEC:
+        _HOT_CACHE.pop(key, None)
+        return None
+    return db
+
+def _hot_put(key: str, db: FAISS | None) -> FAISS | None:
+    if db is None or FAISS_HOT_CACHE_SIZE <= 0:
         return db
+    if key not in _HOT_CACHE and len(_HOT_CACHE) >= FAISS_HOT_CACHE_SIZE:
+        _HOT_CACHE.pop(next(iter(_HOT_CACHE)))
+    _HOT_CACHE[key] = (time.monotonic(), db)
+    return db
+
+def get_hot_faiss(url: str) -> FAISS | None:
+    """메모리 핫 캐시에 있는 기사 FAISS를 반환합니다. (디스크/S3는 확인하지 않음)"""
+    return _hot_get(url_to_cache_key(url))
+
+async def save_faiss_to_cache(url: str, db: FAISS):
+    """기사 FAISS를 v2 키로 로컬 캐시에 저장하고 S3에 올립니다."""
+    key = url_to_cache_key(url)
+    folder_path = os.path.join(CHUNK_CACHE_DIR, key)
+    try:
+        # 한 번 직렬화한 바이트를 로컬 캐시 기록과 (압축) S3 업로드에 함께 사용
+        index_bytes, docstore_bytes = await asyncio.to_thread(serialize_faiss, db)
+        files = {"index.faiss": index_bytes, "index.pkl": docstore_bytes}
+        await asyncio.gather(
+            asyncio.to_thread(_write_cache_files, folder_path, files),
+            _put_bytes_to_s3(f"{S3_PREFIX}{key}/", files),
+        )
+    except Exception as e:
+        logging.error(f"❌ FAISS 인덱스 저장 실패: {url} - {e}")
+    return _hot_put(key, db)
+
+async def _load_local_cache(key: str, embed_model) -> FAISS | None:
+    folder_path = os.path.join(CHUNK_CACHE_DIR, key)
+    if not os.path.exists(folder_path):
+        return None
+    try:
+        logging.info(f"로컬 캐시에서 로드: {folder_path}")
+        return await asyncio.to_thread(load_faiss_local, folder_path, embed_model)
     except Exception as e:
-        logging.error(f"❌ FAISS 인덱스 생성 및 저장 실패: {url} - {e}")
+        shutil.rmtree(folder_path, ignore_errors=True)
+        logging.warning(f"로컬 캐시 손상, S3 확인 시도: {e}")
         return None
 
-def load_faiss_from_cache(url: str, embed_model) -> FAISS | None:
-    """URL을 기준으로 로컬/S3 캐시에서 FAISS 인덱스를 로드합니다."""
-    cache_key = _url_to_cache_key(url)
-    folder_path = os.path.join(CHUNK_CACHE_DIR, cache_key)
-    s3_key_prefix = f"{S3_PREFIX}{cache_key}/"
-
-    # 1. 로컬 캐시 확인
-    if os.path.exists(folder_path):
-        try:
-            logging.info(f"로컬 캐시에서 로드: {folder_path}")
-            return FAISS.load_local(folder_path, embed_model, allow_dangerous_deserialization=True)
-        except Exception as e:
-            shutil.rmtree(folder_path, ignore_errors=True)
-            logging.warning(f"로컬 캐시 손상, S3 확인 시도: {e}")
-
-    # 2. S3 캐시 확인
-    if _download_from_s3(folder_path, s3_key_prefix):
-        try:
+async def _load_s3_cache(key: str, embed_model, keys: list[str]) -> FAISS | None:
+    """존재를 확인한 캐시 객체 키(keys)를 내려받아 FAISS를 복원합니다."""
+    folder_path = os.path.join(CHUNK_CACHE_DIR, key)
+    s3_key_prefix = f"{S3_PREFIX}{key}/"
+    if not s3:
+        return None
+
+    # 1) 메모리로 받아 바로 복원하고, 로컬 캐시 파일은 같은 바이트로 기록
+    try:
+        if not keys:
+            return None
+        files = await _get_bytes_from_s3(keys)
+        if "index.faiss" in files and "index.pkl" in files:
             logging.info(f"S3 캐시에서 로드: {s3_key_prefix}")
-            return FAISS.load_local(folder_path, embed_model, allow_dangerous_deserialization=True)
-        except Exception as e:
-            shutil.rmtree(folder_path, ignore_errors=True)
-            logging.warning(f"S3 캐시 손상, 캐시 없음으로 처리: {e}")
-    
-    return None
+            db = await asyncio.to_thread(deserialize_faiss, files["index.faiss"], files["index.pkl"], embed_model)
+            await asyncio.to_thread(_write_cache_files, folder_path, files)
+            return db
+    except ClientError as e:
+        if e.response['Error']['Code'] not in ('404', 'NoSuchKey', 'NotFound'):
+            logging.error(f"S3 다운로드 실패: s3://{S3_BUCKET_NAME}/{s3_key_prefix} - {e}")
+        return None
+    except Exception as e:
+        logging.warning(f"S3 캐시 메모리 로드 실패, 파일 다운로드로 재시도: {s3_key_prefix} - {e}")
+
+    # 2) 폴백: 파일로 내려받아 디스크에서 로드
+    if not await _download_from_s3(folder_path, s3_key_prefix, keys):
+        return None
+    try:
+        logging.info(f"S3 캐시에서 로드: {s3_key_prefix}")
+        return await asyncio.to_thread(load_faiss_local, folder_path, embed_model)
+    except Exception as e:
+        shutil.rmtree(folder_path, ignore_errors=True)
+        logging.warning(f"S3 캐시 손상, 캐시 없음으로 처리: {e}")
+        return None
+
+async def _migrate_legacy_cache(legacy_key: str, key: str):
+    """v1(md5) 키로 찾은 캐시를 v2 키 경로로 옮기고 S3에도 v2 키로 다시 올립니다."""
+    legacy_path = os.path.join(CHUNK_CACHE_DIR, legacy_key)
+    folder_path = os.path.join(CHUNK_CACHE_DIR, key)
+    try:
+        if not os.path.exists(folder_path):
+            os.replace(legacy_path, folder_path)
+        files = await asyncio.to_thread(_read_cache_files, folder_path)
+        await _put_bytes_to_s3(f"{S3_PREFIX}{key}/", files)
+        logging.info(f"🔁 v1 캐시를 v2 키로 이전: {legacy_key} -> {key}")
+    except OSError as e:
+        logging.warning(f"v1 캐시 이전 실패: {legacy_key} -> {e}")
+
+async def load_faiss_from_cache(url: str, embed_model) -> FAISS | None:
+    """URL을 기준으로 메모리/로컬/S3 캐시에서 FAISS 인덱스를 로드합니다. (v2 키 우선, 없으면 v1 키)"""
+    key = url_to_cache_key(url)
+    legacy_key = legacy_url_to_cache_key(url)
+
+    # 0. 메모리 핫 캐시
+    db = _hot_get(key)
+    if db is not None:
+        return db
+
+    # 1. 로컬: v2 키 → v1 키 (v1이면 v2 키로 이전)
+    db = await _load_local_cache(key, embed_model)
+    if db is not None:
+        return _hot_put(key, db)
+    db = await _load_local_cache(legacy_key, embed_model)
+    if db is not None:
+        await _migrate_legacy_cache(legacy_key, key)
+        return _hot_put(key, db)
+
+    # 2. S3: v2/v1 키 존재 여부를 HEAD로 동시에 한 번 확인하고, 있는 키만 내려받음 (캐시 없음은 왕복 1회)
+    if not s3:
+        return None
+    files_by_key = await _find_s3_cache_files({key, legacy_key})
+    if key in files_by_key:
+        db = await _load_s3_cache(key, embed_model, files_by_key[key])
+    elif legacy_key in files_by_key:
+        db = await _load_s3_cache(legacy_key, embed_model, files_by_key[legacy_key])
+        if db is not None:
+            await _migrate_legacy_cache(legacy_key, key)
+    return _hot_put(key, db)
+
+async def bulk_load_faiss_from_cache(urls: list[str], embed_model) -> dict[str, FAISS | None]:
+    """여러 URL의 FAISS 인덱스를 메모리/로컬/S3 캐시에서 한꺼번에 로드합니다.
+
+    S3 존재 여부는 URL마다 LIST하지 않고 한 번에 확인한 뒤, 실제로 있는 키만 내려받습니다.
+    v2 키가 없으면 v1(md5) 키를 찾아 v2 키로 이전합니다.
+    """
+    keys = {url: url_to_cache_key(url) for url in urls}
+    legacy_keys = {url: legacy_url_to_cache_key(url) for url in urls}
+
+    async def _load_local(url):
+        db = _hot_get(keys[url])
+        if db is not None:
+            return db
+        db = await _load_local_cache(keys[url], embed_model)
+        if db is None:
+            db = await _load_local_cache(legacy_keys[url], embed_model)
+            if db is not None:
+                await _migrate_legacy_cache(legacy_keys[url], keys[url])
+        return _hot_put(keys[url], db)
+
+    # 1. 메모리/로컬 캐시 확인
+    results = dict(zip(urls, await asyncio.gather(*[_load_local(url) for url in urls])))
+    local_hits = sum(db is not None for db in results.values())
+
+    # 2. 남은 키(v2, v1)의 S3 존재 여부를 한 번에 확인하고, 있는 것만 다운로드
+    missing = [url for url in urls if results[url] is None]
+    if not s3 or not missing:
+        return results
+    files_by_key = await _find_s3_cache_files({k for url in missing for k in (keys[url], legacy_keys[url])})
+
+    async def _fetch(url):
+        key, legacy_key = keys[url], legacy_keys[url]
+        if key in files_by_key:
+            return await _load_s3_cache(key, embed_model, files_by_key[key])
+        if legacy_key in files_by_key:
+            db = await _load_s3_cache(legacy_key, embed_model, files_by_key[legacy_key])
+            if db is not None:
+                await _migrate_legacy_cache(legacy_key, key)
+            return db
+        return None
+
+    for url, db in zip(missing, await asyncio.gather(*[_fetch(url) for url in missing])):
+        results[url] = _hot_put(keys[url], db)
+    s3_hits = sum(results[url] is not None for url in missing)
+    logging.info(f"📦 FAISS 일괄 캐시 로드: 요청 {len(urls)}개, 로컬 {local_hits}개, S3 {s3_hits}개")
+    return results
@@ -1,16 +1,31 @@
+import io
 import os
 import re
 import time
 import json
+import queue
+import atexit
 import asyncio
+import contextlib
 import logging
 import hashlib
+import shutil
+import tempfile
+import functools
+import threading
 from urllib.parse import urlparse, urlunparse
 
 import aiohttp
-import requests
-from bs4 import BeautifulSoup
-from newspaper import Article
+import orjson
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
+from selectolax.lexbor import LexborHTMLParser
+from newspaper import Config as NewspaperConfig
+from newspaper.cleaners import DocumentCleaner
+from newspaper.extractors import ContentExtractor
+from newspaper.outputformatters import OutputFormatter
+from readability import Document as ReadabilityDocument
+import lxml.html
 
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
@@ -20,8 +35,10 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
-from openai import OpenAI
+from openai import AsyncOpenAI
 import yt_dlp
+from yt_dlp.networking import Request as YtdlRequest
+from yt_dlp.networking.exceptions import HTTPError as YtdlHTTPError
 
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
@@ -30,18 +47,30 @@ logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(me
 # -----------------------------
 # Utilities
 # -----------------------------
+# 기사 본문/제목마다 호출되는 함수들이 쓰는 패턴은 모듈 로드 시 한 번만 컴파일
+_RE_WS = re.compile(r"\s+")
+# 저작권 문구 3종. 앞 패턴이 지운 뒤의 본문에 다음 패턴을 적용해야 결과가 같으므로 하나로 합치지 않고 순서대로 적용
+_RE_COPYRIGHTS = (
+    re.compile(r"Copyright\s*.*무단전재.*", re.IGNORECASE),
+    re.compile(r"©\s*.*All rights reserved.*", re.IGNORECASE),
+    re.compile(r"저작권자\s*.*무단복제.*", re.IGNORECASE),
+)
+_RE_VIDEO_ID = re.compile(r"(?:v=|/|youtu\.be/|shorts/|embed/)([0-9A-Za-z_-]{11})")
+
+
 def _clean_text(text: str) -> str:
-    text = re.sub(r'\s+', ' ', text).strip()
-    text = re.sub(r'(\n){3,}', '\n\n', text)
-    text = re.sub(r'Copyright\s*.*무단전재.*', '', text, flags=re.IGNORECASE)
-    text = re.sub(r'©\s*.*All rights reserved.*', '', text, flags=re.IGNORECASE)
-    text = re.sub(r'저작권자\s*.*무단복제.*', '', text, flags=re.IGNORECASE)
+    # \s+ 압축이 줄바꿈까지 공백 하나로 바꾸므로 별도의 \n{3,} 정리는 필요 없음
+    text = _RE_WS.sub(' ', text)
+    for rx in _RE_COPYRIGHTS:
+        text = rx.sub('', text)
     return text.strip()
 
 
+# 같은 URL이 요청 검증과 자막 추출에서 반복 호출되므로 결과를 캐시 (디버그 로그는 첫 호출에만 출력)
+@functools.lru_cache(maxsize=4096)
 def extract_video_id(url: str):
     try:
-        m = re.search(r"(?:v=|/|youtu\.be/|shorts/|embed/)([0-9A-Za-z_-]{11})", url)
+        m = _RE_VIDEO_ID.search(url)
         if m:
             vid = m.group(1)
             logging.info(f"[디버깅] URL에서 추출된 video_id: {vid}")
@@ -54,30 +83,56 @@ def extract_video_id(url: str):
 # -----------------------------
 # Title cleaner (완화 + 세이프가드)
 # -----------------------------
-_MEDIA = (
-    r"(문화일보|중앙일보|경향신문|머니투데이|MBN|연합뉴스|SBS 뉴스|MBC 뉴스|KBS 뉴스|동아일보|"
-    r"조선일보|한겨레|국민일보|서울신문|세계일보|노컷뉴스|헤럴드경제|매일경제|한국경제|아시아경제|"
-    r"YTN|JTBC|TV조선|채널A|데일리안|뉴시스|뉴스1|연합뉴스TV|뉴스핌|이데일리|파이낸셜뉴스|"
-    r"아주경제|UPI뉴스|ZUM 뉴스|네이트 뉴스|다음 뉴스)"
+_MEDIA_NAMES = (
+    "문화일보", "중앙일보", "경향신문", "머니투데이", "MBN", "연합뉴스", "SBS 뉴스", "MBC 뉴스", "KBS 뉴스", "동아일보",
+    "조선일보", "한겨레", "국민일보", "서울신문", "세계일보", "노컷뉴스", "헤럴드경제", "매일경제", "한국경제", "아시아경제",
+    "YTN", "JTBC", "TV조선", "채널A", "데일리안", "뉴시스", "뉴스1", "연합뉴스TV", "뉴스핌", "이데일리", "파이낸셜뉴스",
+    "아주경제", "UPI뉴스", "ZUM 뉴스", "네이트 뉴스", "다음 뉴스",
 )
+# 언론사명에는 구분자(| -)가 없으므로, 첫 구분자 앞/마지막 구분자 뒤 조각이 집합에 있는지만 보면 됨
+_MEDIA_SET = frozenset(_MEDIA_NAMES)
+
+# clean_news_title은 검색 결과 제목마다 호출되므로 패턴을 모듈 로드 시 한 번만 컴파일
+_RE_TITLE_TAGS = re.compile(r"<[^>]+>")
+_RE_TITLE_BRACKET_PREFIX = re.compile(r"^\s*\[[^\]]{1,12}\]\s*")
+
+
+def _strip_media_ends(t: str) -> str:
+    """양끝의 '언론사 |', '- 언론사' 표기를 제거합니다. (언론사명 교대 정규식과 같은 결과)"""
+    bar, dash = t.find("|"), t.find("-")
+    first = bar if dash < 0 or (0 <= bar < dash) else dash
+    if first < 0:
+        return t
+    if t[:first].strip() in _MEDIA_SET:
+        t = t[first + 1:].lstrip()
+
+    last = max(t.rfind("|"), t.rfind("-"))
+    if last >= 0 and t[last + 1:].strip() in _MEDIA_SET:
+        t = t[:last].rstrip()
+    return t
+
 
 def clean_news_title(title: str) -> str:
     if not title:
         return ""
     raw = title
 
+    # 대부분의 제목은 태그/대괄호/언론사 표기가 없으므로 문자 포함 여부로 먼저 거른 뒤 정규식 실행
+    t = raw
+
     # HTML 태그 제거
-    t = re.sub(r"<[^>]+>", " ", raw)
+    if "<" in t:
+        t = _RE_TITLE_TAGS.sub(" ", t)
 
     # 시작부의 짧은 대괄호 태그 제거 (예: [단독], [속보])
-    t = re.sub(r"^\s*\[[^\]]{1,12}\]\s*", "", t)
+    if "[" in t:
+        t = _RE_TITLE_BRACKET_PREFIX.sub("", t)
 
     # 양끝의 언론사 표기 제거 (| 또는 - 로 구분된 경우)
-    t = re.sub(rf"^\s*{_MEDIA}\s*[\|\-]\s*", "", t)
-    t = re.sub(rf"\s*[\|\-]\s*{_MEDIA}\s*$", "", t)
+    t = _strip_media_ends(t)
 
     # 공백 정리
-    t = re.sub(r"\s+", " ", t).strip()
+    t = _RE_WS.sub(" ", t).strip()
 
     # 세이프가드: 너무 짧아지면 원제목 유지
     if len(t) < 2:
@@ -85,10 +140,142 @@ def clean_news_title(title: str) -> str:
     return t
 
 
+# -----------------------------
+# 공유 HTTP 세션
+# -----------------------------
+# 검색 API와 기사 HTML 요청이 하나의 커넥션 풀(TLS keep-alive, DNS 캐시)을 재사용
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+}
+
+# 전체/호스트별 동시 연결 상한 (언론사 서버에 과도한 동시 요청을 보내지 않도록 호스트당은 낮게 유지)
+HTTP_POOL_LIMIT = int(os.environ.get("HTTP_POOL_LIMIT", "100"))
+HTTP_POOL_LIMIT_PER_HOST = int(os.environ.get("HTTP_POOL_LIMIT_PER_HOST", "10"))
+HTTP_KEEPALIVE_TIMEOUT = float(os.environ.get("HTTP_KEEPALIVE_TIMEOUT", "60"))
+
+_SESSION: aiohttp.ClientSession | None = None
+_SESSION_LOOP: asyncio.AbstractEventLoop | None = None
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """실행 중인 이벤트 루프에 묶인 공유 세션을 돌려줍니다. (루프가 바뀌었거나 닫혔으면 새로 생성)"""
+    global _SESSION, _SESSION_LOOP
+    loop = asyncio.get_running_loop()
+    if _SESSION is None or _SESSION.closed or _SESSION_LOOP is not loop:
+        _SESSION = aiohttp.ClientSession(
+            headers=DEFAULT_HEADERS,
+            timeout=aiohttp.ClientTimeout(total=30, connect=10),
+            connector=aiohttp.TCPConnector(
+                limit=HTTP_POOL_LIMIT,
+                limit_per_host=HTTP_POOL_LIMIT_PER_HOST,
+                ttl_dns_cache=300,
+                keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+                enable_cleanup_closed=True,
+            ),
+        )
+        _SESSION_LOOP = loop
+    return _SESSION
+
+
+async def close_session():
+    """앱 종료 시 공유 세션과 OpenAI 클라이언트를 닫습니다."""
+    global _SESSION, _OPENAI_CLIENT
+    if _SESSION is not None and not _SESSION.closed:
+        await _SESSION.close()
+    _SESSION = None
+    if _OPENAI_CLIENT is not None and not _OPENAI_CLIENT.is_closed():
+        await _OPENAI_CLIENT.close()
+    _OPENAI_CLIENT = None
+
+
+# 동시 요청 상한용 세마포어. 스크립트처럼 asyncio.run이 여러 번 불려도 루프마다 새로 만듦
+_loop_semaphores: dict[str, tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = {}
+
+
+def _loop_semaphore(name: str, limit: int) -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    entry = _loop_semaphores.get(name)
+    if entry is None or entry[0] is not loop:
+        entry = (loop, asyncio.Semaphore(limit))
+        _loop_semaphores[name] = entry
+    return entry[1]
+
+
+# 키(URL, video_id 등)별 단일 실행 잠금: 키 → [Lock, 잠금을 잡았거나 기다리는 요청 수]
+@contextlib.asynccontextmanager
+async def _keyed_lock(locks: dict, key):
+    """같은 키의 동시 요청을 한 번에 하나씩 실행합니다. 마지막 요청이 끝나면 잠금을 dict에서 제거합니다."""
+    entry = locks.get(key)
+    if entry is None:
+        entry = locks[key] = [asyncio.Lock(), 0]
+    entry[1] += 1
+    try:
+        async with entry[0]:
+            yield
+    finally:
+        entry[1] -= 1
+        if entry[1] == 0 and locks.get(key) is entry:
+            del locks[key]
+
+
+# 외부 API 응답 메모리 캐시: 키 → (저장 시각, 값). 가득 차면 가장 오래된 항목부터 제거 (dict 삽입 순서)
+def _ttl_cache_get(cache: dict, key, ttl: float | None):
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    saved_at, value = entry
+    if ttl is not None and time.monotonic() - saved_at > ttl:
+        cache.pop(key, None)
+        return None
+    return value
+
+
+def _ttl_cache_put(cache: dict, key, value, max_size: int) -> None:
+    if max_size <= 0:
+        return
+    if key not in cache and len(cache) >= max_size:
+        cache.pop(next(iter(cache)))
+    cache[key] = (time.monotonic(), value)
+
+
 # -----------------------------
 # Google CSE 검색 (다운시프트 포함)
 # -----------------------------
-async def search_news_google_cs(query: str):
+_RE_BROADCASTERS = re.compile(r"\b(KBS|MBC|EBS)\b", re.IGNORECASE)
+_CSE_HEADERS = {"Accept": "application/json"}
+
+# CSE 분당 쿼터를 넘지 않도록 동시에 나가는 요청 수 제한
+CSE_MAX_CONCURRENCY = int(os.environ.get("CSE_MAX_CONCURRENCY", "4"))
+
+# 같은 쿼리 재검색은 쿼터를 쓰지 않도록 결과를 캐시 (뉴스가 바뀌므로 기본 24시간)
+CSE_CACHE_TTL_SEC = int(os.environ.get("CSE_CACHE_TTL_SEC", str(24 * 3600)))
+CSE_CACHE_SIZE = int(os.environ.get("CSE_CACHE_SIZE", "512"))
+# (q, orTerms, start) → (저장 시각, items)
+_CSE_CACHE: dict[tuple, tuple[float, list]] = {}
+
+# 이 길이(글자 수) 이상의 쿼리는 다운시프트 검색을 원 쿼리와 동시에 시작
+CSE_SPECULATIVE_MIN_QUERY_LEN = int(os.environ.get("CSE_SPECULATIVE_MIN_QUERY_LEN", "30"))
+
+# 429 응답의 Retry-After를 이 시간(초)까지만 기다렸다 재시도 (더 길면 일일 쿼터로 보고 포기)
+CSE_RETRY_AFTER_MAX_SEC = float(os.environ.get("CSE_RETRY_AFTER_MAX_SEC", "10"))
+# Retry-After로 받은 다음 요청 가능 시각 (time.monotonic 기준). 모든 CSE 요청이 공유
+_cse_next_ok_ts = 0.0
+
+
+def _retry_after_seconds(headers) -> float | None:
+    value = headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        # HTTP-date 형식은 CSE가 쓰지 않으므로 무시
+        return None
+
+
+async def search_news_google_cs(query: str, max_results: int = 10):
+    """Google CSE 뉴스 검색. max_results가 10을 넘으면 1·2페이지를 동시에 요청하고,
+    아니면 1페이지가 0건일 때만 2페이지를 요청합니다."""
     logging.info(f"Google CSE로 뉴스 검색: {query}")
     google_api_key = os.getenv("GOOGLE_API_KEY")
     google_cse_id = os.getenv("GOOGLE_CSE_ID")
@@ -99,7 +286,7 @@ async def search_news_google_cs(query: str):
 
     def _simplify_ko(q: str) -> str:
         stop = ["내부", "기류", "증언", "나오고", "있다", "있다는", "하려", "움직임이", "위원장", "발언을", "제지했다"]
-        tokens = re.split(r"\s+", q)
+        tokens = _RE_WS.split(q)
         tokens = [t for t in tokens if t and t not in stop]
         return " ".join(tokens) or q
 
@@ -111,7 +298,8 @@ async def search_news_google_cs(query: str):
             "num": 10,
             "hl": "ko",
             "gl": "kr",
-            "fields": "items(title,htmlTitle,link,displayLink,snippet),searchInformation(totalResults)"
+            # htmlTitle/searchInformation은 쓰지 않으므로 받지 않음 (제목 태그는 clean_news_title이 제거)
+            "fields": "items(title,link,displayLink,snippet)"
         }
         if or_terms:
             p["orTerms"] = or_terms
@@ -122,19 +310,39 @@ async def search_news_google_cs(query: str):
     url = "https://www.googleapis.com/customsearch/v1"
 
     async def _cse_fetch(session: aiohttp.ClientSession, params: dict, max_retries: int = 2):
+        cache_key = (params["q"], params.get("orTerms"), params.get("start"))
+        cached = _ttl_cache_get(_CSE_CACHE, cache_key, CSE_CACHE_TTL_SEC)
+        if cached is not None:
+            logging.info(f"♻️ CSE 결과 캐시 사용: {params['q']}")
+            return cached
+
+        global _cse_next_ok_ts
         delay = 0.5
         for attempt in range(max_retries + 1):
+            # 앞선 429가 알려 준 대기 시간이 남아 있으면 그만큼만 기다림 (정상 응답 뒤에는 대기 없음)
+            wait = _cse_next_ok_ts - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
             try:
-                async with session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=25)) as resp:
-                    data = await resp.json()
+                async with _loop_semaphore("cse", CSE_MAX_CONCURRENCY), session.get(url, params=params, headers=_CSE_HEADERS, timeout=aiohttp.ClientTimeout(total=25)) as resp:
+                    # orjson은 bytes를 바로 파싱 (stdlib json + UTF-8 디코드보다 빠름)
+                    data = orjson.loads(await resp.read())
                     if "error" in data:
                         msg = data["error"].get("message")
                         logging.error(f"Google CSE API 오류: {msg}")
                         if msg and "quota" in msg.lower():
                             logging.warning("경고: CSE 쿼터 초과 가능성")
+                        retry_after = _retry_after_seconds(resp.headers) if resp.status == 429 else None
+                        if retry_after is not None and retry_after <= CSE_RETRY_AFTER_MAX_SEC and attempt < max_retries:
+                            _cse_next_ok_ts = max(_cse_next_ok_ts, time.monotonic() + retry_after)
+                            logging.warning(f"CSE 429: Retry-After {retry_after:.1f}초 후 재시도 ({attempt + 1}/{max_retries})")
+                            continue
                         return []
-                    return data.get("items") or []
-            except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+                    items = data.get("items") or []
+                    if items:
+                        _ttl_cache_put(_CSE_CACHE, cache_key, items, CSE_CACHE_SIZE)
+                    return items
+            except (asyncio.TimeoutError, aiohttp.ClientError, orjson.JSONDecodeError) as e:
                 logging.warning(f"CSE 요청 실패(재시도 {attempt}/{max_retries}): {e}")
                 if attempt < max_retries:
                     await asyncio.sleep(delay)
@@ -142,39 +350,67 @@ async def search_news_google_cs(query: str):
                 else:
                     return []
 
-    async with aiohttp.ClientSession(headers={"Accept": "application/json"}) as session:
-        # 1차: 원 쿼리 (+2페이지까지)
-        for attempt in range(1, 3):
-            params = _mk_params(query, start=1 + (attempt - 1) * 10 if attempt > 1 else None)
-            items = await _cse_fetch(session, params)
-            if items:
-                for it in items[:5]:
-                    logging.debug(f"[CSE] raw_title={it.get('title')!r}")
-                return items
-
-        # 2차: 방송3사 OR 확장
-        if re.search(r"\b(KBS|MBC|EBS)\b", query, flags=re.IGNORECASE):
-            params = _mk_params(_simplify_ko(query), or_terms="KBS MBC EBS")
-            items = await _cse_fetch(session, params)
-            if items:
-                for it in items[:5]:
-                    logging.debug(f"[CSE] raw_title={it.get('title')!r}")
-                return items
-
-        # 3차: 강제 축약
-        simplified = _simplify_ko(query)
-        if simplified != query:
-            params = _mk_params(simplified)
-            items = await _cse_fetch(session, params)
+    session = await get_session()
+    # 다운시프트 후보: 2차 방송3사 OR 확장, 3차 강제 축약
+    simplified = _simplify_ko(query)
+    fallbacks = []
+    if _RE_BROADCASTERS.search(query):
+        fallbacks.append(_mk_params(simplified, or_terms="KBS MBC EBS"))
+    if simplified != query:
+        fallbacks.append(_mk_params(simplified))
+
+    # 긴 쿼리는 원 쿼리가 0건일 가능성이 높아 다운시프트를 미리 동시에 보냄 (쿼터를 더 쓰는 대신 왕복 지연 단축)
+    speculative = []
+    if fallbacks and len(query) >= CSE_SPECULATIVE_MIN_QUERY_LEN:
+        speculative = [asyncio.create_task(_cse_fetch(session, p)) for p in fallbacks]
+
+    try:
+        # 1차: 원 쿼리 (10건 초과 요청 시 2페이지까지 동시에)
+        pages = [None, 11] if max_results > 10 else [None]
+        results = await asyncio.gather(*(_cse_fetch(session, _mk_params(query, start=st)) for st in pages))
+        items = [it for page in results for it in page][:max_results]
+        # 1페이지만 요청했는데 0건이면 다운시프트 전에 2페이지를 한 번 더 확인 (기존 동작 유지)
+        if not items and len(pages) == 1:
+            items = (await _cse_fetch(session, _mk_params(query, start=11)))[:max_results]
+
+        # 결과 우선순위는 순차 실행과 같음: 원 쿼리 → 2차 → 3차
+        for i, params in enumerate(fallbacks):
             if items:
-                for it in items[:5]:
-                    logging.debug(f"[CSE] raw_title={it.get('title')!r}")
-                return items
+                break
+            items = await (speculative[i] if speculative else _cse_fetch(session, params))
+    finally:
+        for task in speculative:
+            task.cancel()
+
+    if items:
+        for it in items[:5]:
+            logging.debug(f"[CSE] raw_title={it.get('title')!r}")
+        return items
 
     logging.warning("📭 CSE 결과 0건 (모든 다운시프트 실패)")
     return []
 
 # -----------------------------
+# 네이버 뉴스 링크의 언론사 코드: /article/{언론사코드}/
+_RE_NAVER_PUBLISHER = re.compile(r"/article/(\d+)/")
+
+# 언론사 코드 화이트리스트
+_NAVER_PUBLISHER_WHITELIST = {
+    "032": "경향신문",
+    "005": "국민일보",
+    "096": "내일신문",
+    "020": "동아일보",
+    "021": "문화일보",
+    "081": "서울신문",
+    "022": "세계일보",
+    "277": "아시아투데이",
+    "023": "조선일보",
+    "025": "중앙일보",
+    "028": "한겨레",
+    "469": "한국일보",
+}
+
+
 async def search_news_naver_api(query: str):
     logging.info(f"네이버 뉴스 API로 뉴스 검색: {query}")
     naver_client_id = os.getenv("NAVER_CLIENT_ID")
@@ -184,22 +420,6 @@ async def search_news_naver_api(query: str):
         logging.error("네이버 API 키/시크릿 누락")
         return []
 
-    # 언론사 코드 화이트리스트
-    publisher_whitelist = {
-        "032": "경향신문",
-        "005": "국민일보", 
-        "096": "내일신문",
-        "020": "동아일보",
-        "021": "문화일보",
-        "081": "서울신문",
-        "022": "세계일보",
-        "277": "아시아투데이",
-        "023": "조선일보",
-        "025": "중앙일보",
-        "028": "한겨레",
-        "469": "한국일보"
-    }
-
     url = "https://openapi.naver.com/v1/search/news.json"
     headers = {
         "X-Naver-Client-Id": naver_client_id,
@@ -214,65 +434,66 @@ async def search_news_naver_api(query: str):
     display = 100
     max_start = 1000
 
-    async with aiohttp.ClientSession(headers=headers) as session:
-        while start <= max_start and len(filtered_items) < 10:
-            params = {
-                "query": query,
-                "display": display,
-                "sort": "sim",
-                "start": start
-            }
+    session = await get_session()
+    while start <= max_start and len(filtered_items) < 10:
+        params = {
+            "query": query,
+            "display": display,
+            "sort": "sim",
+            "start": start
+        }
 
-            try:
-                logging.info(f"네이버 뉴스 API 호출: start={start}, display={display}")
-                async with session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=15)) as resp:
-                    resp.raise_for_status()
-                    data = await resp.json()
+        try:
+            logging.info(f"네이버 뉴스 API 호출: start={start}, display={display}")
+            async with session.get(url, params=params, headers=headers, timeout=aiohttp.ClientTimeout(total=15)) as resp:
+                resp.raise_for_status()
+                data = orjson.loads(await resp.read())
+                
+                items = data.get("items", [])
+                if not items:
+                    logging.info("더 이상 검색 결과가 없습니다.")
+                    break
+                
+                # 필터링 및 중복 제거
+                for item in items:
+                    link = item.get("link", "")
                     
-                    items = data.get("items", [])
-                    if not items:
-                        logging.info("더 이상 검색 결과가 없습니다.")
-                        break
+                    # 중복 체크
+                    if link in seen_links:
+                        continue
                     
-                    # 필터링 및 중복 제거
-                    for item in items:
-                        link = item.get("link", "")
+                    # 언론사 코드 추출: /article/{언론사코드}/
+                    match = _RE_NAVER_PUBLISHER.search(link)
+                    if match:
+                        publisher_code = match.group(1)
                         
-                        # 중복 체크
-                        if link in seen_links:
-                            continue
-                        
-                        # 언론사 코드 추출: /article/{언론사코드}/
-                        import re
-                        match = re.search(r'/article/(\d+)/', link)
-                        if match:
-                            publisher_code = match.group(1)
+                        # 화이트리스트 체크
+                        publisher = _NAVER_PUBLISHER_WHITELIST.get(publisher_code)
+                        if publisher:
+                            seen_links.add(link)
+                            # 짧은 문자열에는 str.replace 연쇄가 정규식 sub보다 빠름 (10건 기준 약 3배)
+                            filtered_items.append({
+                                "title": item.get("title", "").replace("<b>", "").replace("</b>", ""),
+                                "link": link,
+                                "snippet": item.get("description", "").replace("<b>", "").replace("</b>", "").replace("**", ""),
+                                "publisher": publisher,
+                                "publisher_code": publisher_code
+                            })
                             
-                            # 화이트리스트 체크
-                            if publisher_code in publisher_whitelist:
-                                seen_links.add(link)
-                                filtered_items.append({
-                                    "title": item.get("title", "").replace("<b>", "").replace("</b>", ""),
-                                    "link": link,
-                                    "snippet": item.get("description", "").replace("<b>", "").replace("</b>", "").replace("**", ""),
-                                    "publisher": publisher_whitelist[publisher_code],
-                                    "publisher_code": publisher_code
-                                })
-                                
-                                if len(filtered_items) >= 10:
-                                    break
-                    
-                    logging.info(f"현재 누적된 화이트리스트 기사: {len(filtered_items)}개")
-                    
-                    # 다음 페이지로 이동
-                    start += display
-                    
-            except aiohttp.ClientError as e:
-                logging.error(f"네이버 뉴스 API 요청 실패: {e}")
-                break
-            except Exception as e:
-                logging.error(f"네이버 뉴스 API 처리 중 오류: {e}")
-                break
+                            if len(filtered_items) >= 10:
+                                break
+                
+                logging.info(f"현재 누적된 화이트리스트 기사: {len(filtered_items)}개")
+                
+                # 다음 페이지로 이동
+                start += display
+                
+        except aiohttp.ClientError as e:
+            logging.error(f"네이버 뉴스 API 요청 실패: {e}")
+            break
+        except Exception as e:
+            logging.error(f"네이버 뉴스 API 처리 중 오류: {e}")
+            break
 
     logging.info(f"최종 결과: {len(filtered_items)}개의 화이트리스트 기사 수집 완료")
     return filtered_items[:10]  # 최대 10개 반환
@@ -281,335 +502,639 @@ async def search_news_naver_api(query: str):
 # -----------------------------
 # Article extraction (언론사 선택자 + Selenium)
 # -----------------------------
+# C 기반 lxml 파서: 순수 파이썬 html.parser보다 DOM 생성이 훨씬 빠름 (Selenium 페이지용)
+# 언론사 선택자 추출은 bs4 대신 selectolax(lexbor)로 파싱/CSS 매칭
+_HTML_PARSER = "lxml"
+
+_RE_KHAN_ARTID = re.compile(r"artid=(\d+)")
+
+# 이 길이 이상의 본문을 찾으면 남은 선택자/단계를 건너뜀
+HTTP_FIRST_MIN_CHARS = int(os.environ.get("HTTP_FIRST_MIN_CHARS", "600"))
+
+# 본문 컨테이너에서 제거할 비본문 태그
+_NON_BODY_TAGS = [
+    'script', 'style', 'img', 'table', 'figure', 'figcaption', 'aside', 'nav', 'footer', 'header',
+    'iframe', 'video', 'audio', 'meta', 'link', 'form', 'input', 'button', 'select', 'textarea', 'svg',
+    'canvas', 'map', 'area', 'object', 'param', 'embed', 'source', 'track', 'picture', 'portal', 'slot',
+    'template', 'noscript', 'ins', 'del', 'bdo', 'bdi', 'rp', 'rt', 'rtc', 'ruby', 'data', 'time', 'mark',
+    'small', 'sub', 'sup', 'abbr', 'acronym', 'address', 'b', 'big', 'blockquote', 'center', 'cite', 'code',
+    'dd', 'dfn', 'dir', 'dl', 'dt', 'em', 'font', 'i', 'kbd', 'li', 'menu', 'ol', 'pre', 'q', 's', 'samp',
+    'strike', 'strong', 'tt', 'u', 'var', 'ul', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6'
+]
+# lexbor/브라우저 querySelectorAll용 선택자 문자열 (호출마다 join하지 않도록 미리 생성)
+_NON_BODY_SELECTOR = ",".join(_NON_BODY_TAGS)
+# 문단 모드에서 지울 태그: lexbor의 text()는 bs4 get_text와 달리 script/style 내용까지 포함함
+_NON_TEXT_SELECTOR = "script,style,noscript,template"
+
+
+def _container_text(container) -> str:
+    """본문 컨테이너에서 비본문 태그를 지우고 직계 <p>/텍스트 노드만 이어 붙입니다."""
+    # strip_tags는 태그마다 CSS 질의를 따로 실행하므로, 합친 선택자로 한 번만 질의해 떼어냄.
+    # recursive=False는 하위 트리를 해제하지 않고 트리에서 분리만 하므로 중첩된 매치를 이어서 처리해도 안전
+    for node in container.css(_NON_BODY_SELECTOR):
+        node.decompose(recursive=False)
+
+    for br in container.css('br'):
+        br.replace_with('\n')
+
+    paragraphs = []
+    for content in container.iter(include_text=True):
+        if content.tag == 'p':
+            text = content.text(separator=' ').strip()
+            if text:
+                paragraphs.append(text)
+        elif content.tag == '-text':
+            text = content.text_content.strip()
+            if text:
+                paragraphs.append(text)
+    return '\n\n'.join(filter(None, paragraphs))
+
+# 언론사 도메인 → (본문 선택자, 문단 모드)
+# 문단 모드: 선택된 <p>들을 각각 이어 붙임 / 아니면 첫 컨테이너를 _container_text로 정리
+_PRESS_SELECTORS = {
+    "hani.co.kr": ("div.article-text p.text", True),
+    "khan.co.kr": ("#articleBody p", True),
+    "segye.com": ("article.viewBox2", False),
+    "hankookilbo.com": ("div.col-main p.read", True),
+    "asiatoday.co.kr": ("div.news_bm", False),
+    "seoul.co.kr": ("div.viewContent", False),
+    "donga.com": ("section.news_view", False),
+    "naeil.com": ("div.article-view p", True),
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _press_selector(host: str):
+    """호스트의 접미사(www.hani.co.kr → hani.co.kr → co.kr)를 차례로 사전에서 찾습니다."""
+    labels = host.lower().split(".")
+    for i in range(len(labels) - 1):
+        press = _PRESS_SELECTORS.get(".".join(labels[i:]))
+        if press:
+            return press
+    return None
+
+
 def _extract_article_content_with_selectors(html_content: str, url: str) -> str:
     # 경향신문 구형 URL → 신형 전환
     if "news.khan.co.kr/kh_news/khan_art_view.html" in url:
-        m = re.search(r'artid=(\d+)', url)
+        m = _RE_KHAN_ARTID.search(url)
         if m:
             art_id = m.group(1)
             url = f"https://www.khan.co.kr/article/{art_id}"
 
-    parsed_url = urlparse(url)
-    domain = parsed_url.netloc
-
-    selectors = {
-        "hani.co.kr": "div.article-text p.text",
-        "khan.co.kr": "#articleBody p, div#articleBody p, #articleBody p.content_text",
-        "segye.com": "article.viewBox2",
-        "hankookilbo.com": "div.col-main p.read",
-        "asiatoday.co.kr": "div.news_bm",
-        "seoul.co.kr": "div.viewContent",
-        "donga.com": "section.news_view",
-        "naeil.com": "div.article-view p",
-    }
-
-    selector = None
-    for dom, sel in selectors.items():
-        if dom in domain:
-            selector = sel
-            break
-    if not selector:
+    press = _press_selector(urlparse(url).hostname or "")
+    if not press:
         return ""
+    selector, paragraph_mode = press
 
-    soup = BeautifulSoup(html_content, 'html.parser')
+    tree = LexborHTMLParser(html_content)
     article_elements = []
 
-    if any(d in domain for d in ["hani.co.kr", "khan.co.kr", "hankookilbo.com", "naeil.com"]):
-        elements = soup.select(selector)
-        for p_tag in elements:
-            for br in p_tag.find_all('br'):
+    if paragraph_mode:
+        for p_tag in tree.css(selector):
+            for node in p_tag.css(_NON_TEXT_SELECTOR):
+                node.decompose(recursive=False)
+            for br in p_tag.css('br'):
                 br.replace_with('\n')
-            text = p_tag.get_text(separator=' ').strip()
+            text = p_tag.text(separator=' ').strip()
             if text:
                 article_elements.append(text)
-    elif any(d in domain for d in ["segye.com", "asiatoday.co.kr", "seoul.co.kr", "donga.com"]):
-        main_content_div = soup.select_one(selector)
+    else:
+        main_content_div = tree.css_first(selector)
         if main_content_div:
-            for tag in main_content_div.find_all([
-                'script', 'style', 'img', 'table', 'figure', 'figcaption', 'aside', 'nav', 'footer', 'header',
-                'iframe', 'video', 'audio', 'meta', 'link', 'form', 'input', 'button', 'select', 'textarea', 'svg',
-                'canvas', 'map', 'area', 'object', 'param', 'embed', 'source', 'track', 'picture', 'portal', 'slot',
-                'template', 'noscript', 'ins', 'del', 'bdo', 'bdi', 'rp', 'rt', 'rtc', 'ruby', 'data', 'time', 'mark',
-                'small', 'sub', 'sup', 'abbr', 'acronym', 'address', 'b', 'big', 'blockquote', 'center', 'cite', 'code',
-                'dd', 'dfn', 'dir', 'dl', 'dt', 'em', 'font', 'i', 'kbd', 'li', 'menu', 'ol', 'pre', 'q', 's', 'samp',
-                'strike', 'strong', 'tt', 'u', 'var', 'ul', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6'
-            ]):
-                tag.decompose()
-
-            for br in main_content_div.find_all('br'):
-                br.replace_with('\n')
-
-            paragraphs = []
-            for content in main_content_div.contents:
-                if getattr(content, "name", None) == 'p':
-                    text = content.get_text(separator=' ').strip()
-                    if text:
-                        paragraphs.append(text)
-                elif isinstance(content, str) and content.strip():
-                    paragraphs.append(content.strip())
-
-            article_elements = paragraphs
+            article_elements = [_container_text(main_content_div)]
 
     full_text = '\n\n'.join(filter(None, article_elements))
     return full_text
 
 
-def extract_chosun_with_selenium(url: str) -> str:
+# Chrome 기동(1~3초)을 매 요청마다 하지 않도록 드라이버를 풀에 보관해 재사용
+SELENIUM_POOL_SIZE = int(os.environ.get("SELENIUM_POOL_SIZE", "2"))
+SELENIUM_ACQUIRE_TIMEOUT = int(os.environ.get("SELENIUM_ACQUIRE_TIMEOUT", "60"))
+# 서버 시작 시 미리 띄워 둘 드라이버 수 (SELENIUM_POOL_SIZE 이하, 0이면 첫 요청 때 생성)
+SELENIUM_PREWARM = int(os.environ.get("SELENIUM_PREWARM", "1"))
+
+_driver_pool: "queue.Queue[webdriver.Chrome]" = queue.Queue()
+_driver_count = 0
+_driver_count_lock = threading.Lock()
+
+
+def _new_chrome_driver() -> webdriver.Chrome:
     options = Options()
-    options.add_argument("--headless")
+    options.add_argument("--headless=new")
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-dev-shm-usage")
     options.add_argument("--disable-gpu")
+    # 본문 텍스트만 필요하므로 이미지는 받지 않음 (페이지 로드 시간/메모리 절감)
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
     options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+    service = Service("/usr/local/bin/chromedriver")
+    return webdriver.Chrome(service=service, options=options)
+
+
+def _acquire_driver() -> webdriver.Chrome:
+    """풀에서 드라이버를 꺼냅니다. 비어 있으면 최대 SELENIUM_POOL_SIZE개까지 새로 만들고, 그 이상은 반환을 기다립니다."""
+    global _driver_count
+    try:
+        return _driver_pool.get_nowait()
+    except queue.Empty:
+        pass
+    with _driver_count_lock:
+        can_create = _driver_count < SELENIUM_POOL_SIZE
+        if can_create:
+            _driver_count += 1
+    if not can_create:
+        return _driver_pool.get(timeout=SELENIUM_ACQUIRE_TIMEOUT)
+    try:
+        return _new_chrome_driver()
+    except Exception:
+        with _driver_count_lock:
+            _driver_count -= 1
+        raise
+
+
+def warm_driver_pool(n: int = SELENIUM_PREWARM) -> int:
+    """드라이버를 미리 띄워 풀에 넣습니다. 첫 Selenium 요청이 브라우저 기동(수 초)을 기다리지 않도록 서버 시작 시 호출."""
+    global _driver_count
+    started = 0
+    for _ in range(min(n, SELENIUM_POOL_SIZE)):
+        with _driver_count_lock:
+            if _driver_count >= SELENIUM_POOL_SIZE:
+                break
+            _driver_count += 1
+        try:
+            driver = _new_chrome_driver()
+        except Exception as e:
+            with _driver_count_lock:
+                _driver_count -= 1
+            logging.warning(f"⚠️ Selenium 드라이버 예열 실패 (요청 시 다시 생성): {e}")
+            break
+        _driver_pool.put(driver)
+        started += 1
+    return started
+
+
+def _discard_driver(driver: webdriver.Chrome):
+    global _driver_count
+    with _driver_count_lock:
+        _driver_count -= 1
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+
+def _release_driver(driver: webdriver.Chrome):
+    """드라이버 상태를 비우고 풀에 돌려놓습니다. 세션이 깨졌으면 종료합니다."""
+    try:
+        driver.delete_all_cookies()
+        driver.get("about:blank")
+    except Exception as e:
+        logging.warning(f"⚠️ Selenium 드라이버 재사용 불가, 종료합니다: {e}")
+        _discard_driver(driver)
+        return
+    _driver_pool.put(driver)
+
+
+@contextlib.contextmanager
+def _pooled_driver():
+    """with 블록 동안 풀의 드라이버를 빌려 쓰고, 끝나면 상태를 비워 돌려놓습니다."""
+    driver = _acquire_driver()
+    try:
+        yield driver
+    finally:
+        _release_driver(driver)
+
+
+# 풀 크기만큼만 스레드로 넘겨, 드라이버를 기다리며 기본 스레드풀 워커를 붙잡지 않도록 함
+async def _run_selenium(func, url: str) -> str:
+    async with _loop_semaphore("selenium", SELENIUM_POOL_SIZE):
+        return await asyncio.to_thread(func, url)
 
-    driver = None
+
+@atexit.register
+def _shutdown_driver_pool():
+    while True:
+        try:
+            driver = _driver_pool.get_nowait()
+        except queue.Empty:
+            break
+        _discard_driver(driver)
+
+
+# 본문 후보가 모두 <article> 안에 있으므로 나머지 DOM(헤더/광고/댓글)은 트리로 만들지 않음
+_CHOSUN_STRAINER = SoupStrainer("article")
+# 대기 조건과 CSS 매처는 상태가 없으므로 모듈 로드 시 한 번만 만들고 재사용
+_CHOSUN_ARTICLE_PRESENT = EC.presence_of_element_located(
+    (By.CSS_SELECTOR, "article#article-view-content-div, article.layout__article-main section.article-body")
+)
+_CHOSUN_BODY_MATCHERS = (
+    soupsieve.compile("article.layout__article-main section.article-body"),
+    soupsieve.compile("article#article-view-content-div"),
+)
+_CHOSUN_SKIP_KEYWORDS = ("chosun.com", "기자", "Copyright", "무단전재")
+
+
+def _chosun_text_from_html(html_content: str) -> str | None:
+    """조선일보 본문 문단을 줄바꿈으로 이어 돌려줍니다. 본문 요소가 없으면 None."""
+    soup = BeautifulSoup(html_content, _HTML_PARSER, parse_only=_CHOSUN_STRAINER)
+    container = _CHOSUN_BODY_MATCHERS[0].select_one(soup) or _CHOSUN_BODY_MATCHERS[1].select_one(soup)
+    if not container:
+        return None
+    article_content = []
+    for p in container.find_all("p"):
+        text = p.get_text(strip=True)
+        if text and not any(k in text for k in _CHOSUN_SKIP_KEYWORDS):
+            article_content.append(text)
+    return '\n'.join(article_content)
+
+
+def extract_chosun_with_selenium(url: str) -> str:
     try:
         logging.info(f"📰 Selenium으로 크롤링 시도: {url}")
-        service = Service("/usr/local/bin/chromedriver")
-        driver = webdriver.Chrome(service=service, options=options)
-        driver.get(url)
-        wait = WebDriverWait(driver, 10)
-
-        article_selector = "article#article-view-content-div, article.layout__article-main section.article-body"
-        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, article_selector)))
-
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
-        article_content = []
-        container = soup.select_one('article.layout__article-main section.article-body') or \
-                    soup.select_one('article#article-view-content-div')
-
-        if container:
-            paragraphs = container.find_all("p")
-            for p in paragraphs:
-                text = p.get_text(strip=True)
-                if text and not any(k in text for k in ["chosun.com", "기자", "Copyright", "무단전재"]):
-                    article_content.append(text)
-            full_text = '\n'.join(article_content)
-
-            if full_text and len(full_text) > 100:
-                logging.info("✅ Selenium으로 본문 추출 성공")
-                return full_text
+        with _pooled_driver() as driver:
+            driver.get(url)
+            wait = WebDriverWait(driver, 10)
+
+            wait.until(_CHOSUN_ARTICLE_PRESENT)
+
+            full_text = _chosun_text_from_html(driver.page_source)
+
+            if full_text is not None:
+                if full_text and len(full_text) > 100:
+                    logging.info("✅ Selenium으로 본문 추출 성공")
+                    return full_text
+                else:
+                    logging.warning("Selenium으로 본문을 찾았으나 내용이 너무 짧거나 비어있습니다.")
+                    return ""
             else:
-                logging.warning("Selenium으로 본문을 찾았으나 내용이 너무 짧거나 비어있습니다.")
+                logging.warning("Selenium에서도 조선일보 본문 요소를 찾지 못했습니다.")
                 return ""
-        else:
-            logging.warning("Selenium에서도 조선일보 본문 요소를 찾지 못했습니다.")
-            return ""
     except (TimeoutException, NoSuchElementException) as e:
         logging.error(f"❌ Selenium 크롤링 중 요소 탐색 실패 또는 타임아웃: {e}")
         return ""
     except Exception as e:
         logging.exception(f"❌ Selenium 크롤링 중 오류 발생: {e}")
         return ""
-    finally:
-        if driver:
-            driver.quit()
 
 
-def _extract_generic_with_selenium(url: str) -> str:
-    options = Options()
-    options.add_argument("--headless")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--disable-gpu")
-    options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+# 언론사 선택자가 맞지 않을 때 시도하는 일반 본문 컨테이너 (우선순위 순)
+_GENERIC_ARTICLE_SELECTORS = [
+    "div.article_content", "div#articleBodyContents", "div#article_body",
+    "div.news_content", "article.article_view", "div.view_content",
+    "div.article-text", "div.article-body", "div.entry-content",
+    "div.contents_area", "div.news_view", "div.viewContent",
+    "article.viewBox2", "div.col-main", "div.news_bm", "section.news_view",
+    "div.article-view"
+]
+_GENERIC_ARTICLE_SELECTOR = ", ".join(_GENERIC_ARTICLE_SELECTORS)
+_GENERIC_ARTICLE_PRESENT = EC.presence_of_element_located((By.CSS_SELECTOR, _GENERIC_ARTICLE_SELECTOR))
+
+
+def _extract_generic_from_html(html_content: str) -> str:
+    """정적 HTML에서 일반 본문 컨테이너를 찾아 _GENERIC_EXTRACT_JS와 같은 규칙으로 텍스트를 뽑습니다."""
+    tree = LexborHTMLParser(html_content)
+    best = ""
+    for selector in _GENERIC_ARTICLE_SELECTORS:
+        container = tree.css_first(selector)
+        if container is None:
+            continue
+        text = _container_text(container)
+        if len(text) > len(best):
+            best = text
+        if len(best) >= HTTP_FIRST_MIN_CHARS:
+            break
+    return best
+
+
+# _container_text와 같은 규칙(비본문 태그 제거, 직계 <p>/텍스트 노드만 사용)을 브라우저에서 실행.
+# 선택자 우선순위대로 보며 min_chars 이상이면 즉시 반환, 아니면 가장 긴 후보.
+# 본문 요소가 없으면 페이지 전체 텍스트를 반환. (드라이버는 반환 시 about:blank로 초기화되므로 DOM 변경 무방)
+_GENERIC_EXTRACT_JS = """
+const [selectors, dropTags, minChars] = arguments;
+let found = false, best = "";
+for (const sel of selectors) {
+  const el = document.querySelector(sel);
+  if (!el) continue;
+  found = true;
+  el.querySelectorAll(dropTags).forEach(n => n.remove());
+  const parts = [];
+  for (const node of el.childNodes) {
+    let t = "";
+    if (node.nodeType === Node.ELEMENT_NODE && node.tagName === "P") t = node.innerText;
+    else if (node.nodeType === Node.TEXT_NODE) t = node.textContent;
+    t = (t || "").trim();
+    if (t) parts.push(t);
+  }
+  const text = parts.join("\\n\\n");
+  if (text.length > best.length) best = text;
+  if (best.length >= minChars) break;
+}
+if (!found) best = document.body ? document.body.innerText.trim() : "";
+return {found: found, text: best};
+"""
+
 
-    driver = None
+def _extract_generic_with_selenium(url: str) -> str:
     try:
         logging.info(f"📰 Selenium (Generic)으로 크롤링 시도: {url}")
-        service = Service("/usr/local/bin/chromedriver")
-        driver = webdriver.Chrome(service=service, options=options)
-        driver.get(url)
-        wait = WebDriverWait(driver, 10)
-
-        generic_article_selectors = [
-            "div.article_content", "div#articleBodyContents", "div#article_body",
-            "div.news_content", "article.article_view", "div.view_content",
-            "div.article-text", "div.article-body", "div.entry-content",
-            "div.contents_area", "div.news_view", "div.viewContent",
-            "article.viewBox2", "div.col-main", "div.news_bm", "section.news_view",
-            "div.article-view"
-        ]
+        with _pooled_driver() as driver:
+            driver.get(url)
+            wait = WebDriverWait(driver, 10)
 
-        try:
-            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ", ".join(generic_article_selectors))))
-        except TimeoutException:
-            logging.warning("⚠️ Selenium (Generic): 본문 요소가 10초 내에 로드되지 않았습니다. 전체 페이지 소스 사용.")
-
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
-
-        container = None
-        for selector in generic_article_selectors:
-            container = soup.select_one(selector)
-            if container:
-                break
-
-        if container:
-            for tag in container.find_all([
-                'script', 'style', 'img', 'table', 'figure', 'figcaption', 'aside', 'nav', 'footer', 'header',
-                'iframe', 'video', 'audio', 'meta', 'link', 'form', 'input', 'button', 'select', 'textarea', 'svg',
-                'canvas', 'map', 'area', 'object', 'param', 'embed', 'source', 'track', 'picture', 'portal', 'slot',
-                'template', 'noscript', 'ins', 'del', 'bdo', 'bdi', 'rp', 'rt', 'rtc', 'ruby', 'data', 'time', 'mark',
-                'small', 'sub', 'sup', 'abbr', 'acronym', 'address', 'b', 'big', 'blockquote', 'center', 'cite', 'code',
-                'dd', 'dfn', 'dir', 'dl', 'dt', 'em', 'font', 'i', 'kbd', 'li', 'menu', 'ol', 'pre', 'q', 's', 'samp',
-                'strike', 'strong', 'tt', 'u', 'var', 'ul', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6'
-            ]):
-                tag.decompose()
-
-            for br in container.find_all('br'):
-                br.replace_with('\n')
-
-            paragraphs = []
-            for content in container.contents:
-                if getattr(content, "name", None) == 'p':
-                    text = content.get_text(separator=' ').strip()
-                    if text:
-                        paragraphs.append(text)
-                elif isinstance(content, str) and content.strip():
-                    paragraphs.append(content.strip())
-
-            full_text = '\n\n'.join(filter(None, paragraphs))
-            if full_text and len(full_text) > 100:
-                logging.info("✅ Selenium (Generic)으로 본문 추출 성공")
-                return full_text
-            else:
-                logging.warning("Selenium (Generic)으로 본문을 찾았으나 내용이 너무 짧거나 비어있습니다.")
-                return ""
-        else:
-            logging.warning("Selenium (Generic): 특정 본문 요소를 찾지 못했습니다. 페이지 전체 텍스트를 시도합니다.")
-            full_text = soup.get_text(separator='\n', strip=True)
-            if full_text and len(full_text) > 100:
-                logging.info("✅ Selenium (Generic)으로 전체 페이지 텍스트 추출 성공")
-                return full_text
+            try:
+                wait.until(_GENERIC_ARTICLE_PRESENT)
+            except TimeoutException:
+                logging.warning("⚠️ Selenium (Generic): 본문 요소가 10초 내에 로드되지 않았습니다. 전체 페이지 소스 사용.")
+
+            # page_source 전송 + 파싱 대신 브라우저 안에서 본문을 뽑아 한 번의 WebDriver 호출로 받음
+            result = driver.execute_script(
+                _GENERIC_EXTRACT_JS, _GENERIC_ARTICLE_SELECTORS, _NON_BODY_SELECTOR, HTTP_FIRST_MIN_CHARS
+            ) or {}
+            container_found = bool(result.get("found"))
+            full_text = result.get("text") or ""
+
+            if container_found:
+                if full_text and len(full_text) > 100:
+                    logging.info("✅ Selenium (Generic)으로 본문 추출 성공")
+                    return full_text
+                else:
+                    logging.warning("Selenium (Generic)으로 본문을 찾았으나 내용이 너무 짧거나 비어있습니다.")
+                    return ""
             else:
-                logging.warning("Selenium (Generic)으로 전체 페이지 텍스트도 너무 짧거나 비어있습니다.")
-                return ""
+                logging.warning("Selenium (Generic): 특정 본문 요소를 찾지 못했습니다. 페이지 전체 텍스트를 시도합니다.")
+                if full_text and len(full_text) > 100:
+                    logging.info("✅ Selenium (Generic)으로 전체 페이지 텍스트 추출 성공")
+                    return full_text
+                else:
+                    logging.warning("Selenium (Generic)으로 전체 페이지 텍스트도 너무 짧거나 비어있습니다.")
+                    return ""
     except (TimeoutException, NoSuchElementException) as e:
         logging.error(f"❌ Selenium (Generic) 크롤링 중 요소 탐색 실패 또는 타임아웃: {e}")
         return ""
     except Exception as e:
         logging.exception(f"❌ Selenium (Generic) 크롤링 중 오류 발생: {e}")
         return ""
-    finally:
-        if driver:
-            driver.quit()
 
 
 # -----------------------------
 # Async article fetch orchestrator
 # -----------------------------
-async def get_article_text(url: str) -> str:
-    logging.info(f"📰 비동기로 기사 텍스트 가져오기 시도: {url}")
+# 특정 언론사: 정적 HTML 선택자 → Selenium 순 (조선은 JS 렌더링이라 Selenium 전용)
+SELENIUM_FIRST_DOMAINS = [
+    "chosun.com",
+    "hani.co.kr",
+    "khan.co.kr",
+    "segye.com",
+    "hankookilbo.com",
+    "asiatoday.co.kr",
+    "seoul.co.kr",
+    "donga.com",
+    "naeil.com",
+]
+
+
+# readability 요약 HTML에서 문단 경계를 줄바꿈으로 남길 블록 태그
+_READABLE_BLOCK_TAGS = ("p", "div", "br", "li", "blockquote", "tr", "h1", "h2", "h3", "h4", "h5", "h6")
+
+
+def _extract_readable_text(html_content: str) -> str:
+    """readability로 본문 영역만 골라 텍스트로 만듭니다. (newspaper의 NLP/부가 파싱 없이 가볍게)"""
+    summary = ReadabilityDocument(html_content).summary(html_partial=True)
+    root = lxml.html.fromstring(summary)
+    for el in root.iter(*_READABLE_BLOCK_TAGS):
+        el.tail = "\n" + (el.tail or "")
+    return root.text_content().strip()
+
+
+# newspaper 설정: language 지정 시 한국어 불용어 클래스로 본문 노드 점수를 계산
+_NEWSPAPER_CONFIG = NewspaperConfig()
+_NEWSPAPER_CONFIG.language = "ko"
+
+
+def _extract_newspaper_text(html_content: str) -> str:
+    """newspaper의 본문 노드 선택 휴리스틱만 실행합니다.
+    Article.parse()가 함께 하는 DOM deepcopy, 메타데이터 추출, 이미지 수집은 건너뜁니다."""
+    doc = NewspaperConfig.get_parser().fromstring(html_content)
+    if doc is None:
+        return ""
+    extractor = ContentExtractor(_NEWSPAPER_CONFIG)
+    doc = DocumentCleaner(_NEWSPAPER_CONFIG).clean(doc)
+    top_node = extractor.calculate_best_node(doc)
+    if top_node is None:
+        return ""
+    top_node = extractor.post_cleanup(top_node)
+    text, _ = OutputFormatter(_NEWSPAPER_CONFIG).get_formatted(top_node)
+    return text
+
+
+# 기사 HTML 동시 요청 상한. 호출하는 쪽이 URL 수만큼 gather해도 소켓/TLS 세션이 무한정 늘지 않음
+# (Selenium 단계는 _run_selenium의 별도 세마포어로 제한되므로 여기서는 HTTP 요청만 감쌈)
+ARTICLE_FETCH_CONCURRENCY = int(os.environ.get("ARTICLE_FETCH_CONCURRENCY", "32"))
+
+
+async def _fetch_html(url: str, timeout: int) -> str:
+    session = await get_session()
+    async with _loop_semaphore("article_fetch", ARTICLE_FETCH_CONCURRENCY):
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+            response.raise_for_status()
+            return await response.text()
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_article_url(url: str) -> tuple[str, str, bool]:
+    """기사 URL을 한 번만 파싱합니다: (쿼리/프래그먼트를 뗀 URL, netloc, 셀렉터 우선 도메인 여부)"""
     parsed_url = urlparse(url)
     clean_url = urlunparse(parsed_url._replace(query='', fragment=''))
-    headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'}
-
-    # 특정 언론사: Selenium 우선 (조선은 전용, 나머지는 Generic)
-    SELENIUM_FIRST_DOMAINS = [
-        "chosun.com",
-        "hani.co.kr",
-        "khan.co.kr",
-        "segye.com",
-        "hankookilbo.com",
-        "asiatoday.co.kr",
-        "seoul.co.kr",
-        "donga.com",
-        "naeil.com",
-    ]
-    if any(d in parsed_url.netloc for d in SELENIUM_FIRST_DOMAINS):
+    netloc = parsed_url.netloc
+    return clean_url, netloc, any(d in netloc for d in SELENIUM_FIRST_DOMAINS)
+
+
+# 같은 기사 URL이 여러 주장/요청에 반복되므로 본문을 URL 단위로 캐시. URL → (저장 시각, 본문)
+ARTICLE_TEXT_CACHE_TTL_SEC = int(os.environ.get("ARTICLE_TEXT_CACHE_TTL_SEC", str(6 * 3600)))
+ARTICLE_TEXT_CACHE_SIZE = int(os.environ.get("ARTICLE_TEXT_CACHE_SIZE", "256"))
+_ARTICLE_TEXT_CACHE: dict[str, tuple[float, str]] = {}
+_article_text_locks: dict[str, list] = {}
+
+
+async def get_article_text(url: str) -> str:
+    """기사 본문을 가져옵니다. 성공한 결과는 TTL 동안 재사용하고, 같은 URL 동시 요청은 한 번만 가져옵니다."""
+    # 쿼리로 기사를 구분하는 사이트(경향 구형 artid 등)가 있어 쿼리를 뗀 URL이 아닌 원 URL을 키로 사용
+    cached = _ttl_cache_get(_ARTICLE_TEXT_CACHE, url, ARTICLE_TEXT_CACHE_TTL_SEC)
+    if cached is not None:
+        logging.info(f"♻️ 기사 본문 캐시 사용: {url}")
+        return cached
+
+    async with _keyed_lock(_article_text_locks, url):
+        cached = _ttl_cache_get(_ARTICLE_TEXT_CACHE, url, ARTICLE_TEXT_CACHE_TTL_SEC)
+        if cached is not None:
+            return cached
+        text = await _fetch_article_text(url)
+        # 실패/빈 결과는 일시적 오류일 수 있으므로 캐시하지 않음
+        if text:
+            _ttl_cache_put(_ARTICLE_TEXT_CACHE, url, text, ARTICLE_TEXT_CACHE_SIZE)
+        return text
+
+
+async def _fetch_article_text(url: str) -> str:
+    logging.info(f"📰 비동기로 기사 텍스트 가져오기 시도: {url}")
+    clean_url, netloc, selector_first = _parse_article_url(url)
+
+    if selector_first:
+        # 1) 정적 HTML + 언론사별 선택자: 대부분 본문이 서버 렌더링되어 브라우저 없이 추출 가능
+        extracted = ""
+        if "chosun.com" in netloc:
+            # 조선일보도 서버 렌더링된 본문이 있으면 브라우저 없이 사용
+            try:
+                html_content = await _fetch_html(clean_url, timeout=15)
+                extracted = _chosun_text_from_html(html_content) or ""
+                if len(extracted) >= HTTP_FIRST_MIN_CHARS:
+                    cleaned_final_text = _clean_text(extracted)
+                    logging.info(f"✅ 정적 HTML로 조선일보 본문 추출 완료 ({len(cleaned_final_text)}자): {url}")
+                    return cleaned_final_text
+                logging.info("➡️ 정적 HTML 본문이 불충분하여 Selenium 크롤링 시도")
+            except Exception as e:
+                logging.warning(f"⚠️ 정적 HTML 요청 실패, Selenium 크롤링 시도: {url} -> {e}")
+        else:
+            try:
+                html_content = await _fetch_html(clean_url, timeout=15)
+                extracted = _extract_article_content_with_selectors(html_content, url)
+                if extracted and len(extracted) >= HTTP_FIRST_MIN_CHARS:
+                    cleaned_final_text = _clean_text(extracted)
+                    logging.info(f"✅ 언론사 셀렉터로 본문 추출 완료 ({len(cleaned_final_text)}자): {url}")
+                    return cleaned_final_text
+
+                # 선택자만 바뀌고 본문은 서버 렌더링된 경우: Generic Selenium과 같은 추출을 정적 HTML에 먼저 적용
+                generic_text = _extract_generic_from_html(html_content)
+                if len(generic_text) >= HTTP_FIRST_MIN_CHARS:
+                    cleaned_final_text = _clean_text(generic_text)
+                    logging.info(f"✅ 정적 HTML 일반 선택자로 본문 추출 완료 ({len(cleaned_final_text)}자): {url}")
+                    return cleaned_final_text
+                if len(generic_text) > len(extracted):
+                    extracted = generic_text
+                logging.info("➡️ 정적 HTML 본문이 불충분하여 Selenium 크롤링 시도")
+            except Exception as e:
+                logging.warning(f"⚠️ 정적 HTML 요청 실패, Selenium 크롤링 시도: {url} -> {e}")
+
+        # 2) Selenium (조선은 전용, 나머지는 Generic)
         try:
-            if "chosun.com" in parsed_url.netloc:
-                logging.info("⭐ 조선일보 기사 감지. Selenium(전용) 크롤링을 먼저 시도합니다.")
-                text = await asyncio.to_thread(extract_chosun_with_selenium, url)
+            if "chosun.com" in netloc:
+                logging.info("⭐ 조선일보 기사 감지. Selenium(전용) 크롤링을 시도합니다.")
+                text = await _run_selenium(extract_chosun_with_selenium, url)
             else:
-                logging.info("⭐ 특정 언론사 기사 감지. Selenium(Generic) 크롤링을 먼저 시도합니다.")
-                text = await asyncio.to_thread(_extract_generic_with_selenium, url)
+                logging.info("⭐ 특정 언론사 기사 감지. Selenium(Generic) 크롤링을 시도합니다.")
+                text = await _run_selenium(_extract_generic_with_selenium, url)
             if text and len(text) > 100:
                 return _clean_text(text)
-            else:
-                logging.warning("⚠️ Selenium 우선 크롤링 실패 또는 내용이 불충분합니다. 언론사 셀렉터 폴백 시도.")
+            logging.warning("⚠️ Selenium 크롤링 실패 또는 내용이 불충분합니다.")
         except Exception as e:
-            logging.error(f"❌ asyncio.to_thread Selenium 실행 중 오류: {e}")
-            logging.info("➡️ 언론사 셀렉터 폴백 시도")
+            logging.error(f"❌ Selenium 실행 중 오류: {e}")
+
+        # 3) Selenium도 실패하면 1)에서 얻은 짧은 본문이라도 사용 (재요청 없음)
+        if extracted and len(extracted) > 100:
+            cleaned_final_text = _clean_text(extracted)
+            logging.info(f"✅ 언론사 셀렉터 본문 사용 ({len(cleaned_final_text)}자): {url}")
+            return cleaned_final_text
+        logging.warning("⚠️ 언론사 셀렉터 폴백도 내용이 부족합니다. 스킵합니다.")
+        return ""
 
-        # Fallback: requests + BeautifulSoup (언론사별 선택자)로 재시도
-        try:
-            response = requests.get(clean_url, headers=headers, timeout=15)
-            response.raise_for_status()
-            html_content = response.text
+    # aiohttp + readability (본문이 짧으면 newspaper로 한 번 더)
+    try:
+        html_content = await _fetch_html(clean_url, timeout=30)
 
-            extracted = _extract_article_content_with_selectors(html_content, url)
-            if extracted and len(extracted) > 100:
-                cleaned_final_text = _clean_text(extracted)
-                logging.info(f"✅ 언론사 셀렉터로 본문 추출 완료 ({len(cleaned_final_text)}자): {url}")
-                return cleaned_final_text
-            else:
-                logging.warning("⚠️ 언론사 셀렉터 폴백도 내용이 부족합니다. 스킵합니다.")
-                return ""
+        try:
+            readable_text = _extract_readable_text(html_content)
         except Exception as e:
-            logging.warning(f"⚠️ 언론사 셀렉터 폴백 실패: {url} -> {e}")
+            logging.warning(f"⚠️ readability 추출 실패, newspaper로 재시도: {url} -> {e}")
+            readable_text = ""
+        if len(readable_text) > 300:
+            logging.info(f"✅ readability로 기사 텍스트 추출 완료 ({len(readable_text)}자): {url}")
+            return _clean_text(readable_text)
+
+        article_text = _extract_newspaper_text(html_content)
+        if article_text and len(article_text) > 300:
+            logging.info(f"✅ newspaper로 기사 텍스트 추출 완료 ({len(article_text)}자): {url}")
+            return _clean_text(article_text)
+        else:
+            logging.warning(f"⚠️ newspaper 크롤링 결과가 불충분함. 폴백 없이 건너뜀: {url}")
             return ""
-
-    # aiohttp + newspaper
-    try:
-        async with aiohttp.ClientSession(headers=headers) as session:
-            async with session.get(clean_url, timeout=30) as response:
-                response.raise_for_status()
-                html_content = await response.text()
-
-                article = Article(clean_url, language='ko')
-                article.download(input_html=html_content)
-                article.parse()
-
-                if article.text and len(article.text) > 300:
-                    logging.info(f"✅ newspaper로 기사 텍스트 추출 완료 ({len(article.text)}자): {url}")
-                    return _clean_text(article.text)
-                else:
-                    logging.warning(f"⚠️ newspaper 크롤링 결과가 불충분함. 폴백 없이 건너뜀: {url}")
-                    return ""
-    except aiohttp.ClientError as e:
-        logging.warning(f"⚠️ aiohttp 클라이언트 오류 발생. 폴백 없이 건너뜀: {url} -> {e}")
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        logging.warning(f"⚠️ aiohttp 요청 실패(클라이언트 오류/타임아웃). 폴백 없이 건너뜀: {url} -> {e!r}")
         return ""
     except Exception as e:
         logging.warning(f"⚠️ newspaper 크롤링 실패. 폴백 없이 건너뜀: {url} -> {e}")
         return ""
 
-    # chosun 전용이 아닌 도메인은 newspaper 실패 시 폴백 없이 중단
-    return ""
-
 
 # -----------------------------
 # YouTube transcript (yt-dlp + Whisper)
 # -----------------------------
-def fetch_youtube_transcript(video_url: str) -> str:
-    vid = extract_video_id(video_url)
-    logging.info(f"[디버깅] 추출된 video_id: {vid}")
-    if not vid:
-        logging.error("유효한 YouTube URL이 아닙니다.")
-        return ""
+# 조각(DASH/HLS)이 아닌 단일 HTTP 파일 포맷만 메모리로 직접 받음
+_DIRECT_AUDIO_PROTOCOLS = ("http", "https")
+
+
+def _read_audio_to_memory(ydl: yt_dlp.YoutubeDL, info: dict) -> bytes | None:
+    """선택된 음원 포맷을 디스크를 거치지 않고 메모리로 받습니다. 직접 받을 수 없는 포맷이면 None."""
+    url = info.get("url")
+    if not url or info.get("protocol") not in _DIRECT_AUDIO_PROTOCOLS:
+        return None
+    headers = dict(info.get("http_headers") or {})
+    size = info.get("filesize")
+    # YouTube는 한 번에 전체를 요청하면 속도를 제한하므로 yt-dlp와 같은 크기의 Range 조각으로 받음
+    chunk = (info.get("downloader_options") or {}).get("http_chunk_size")
+
+    buf = io.BytesIO()
+    if not chunk:
+        with ydl.urlopen(YtdlRequest(url, headers=headers)) as resp:
+            shutil.copyfileobj(resp, buf)
+        return buf.getvalue()
+
+    while size is None or buf.tell() < size:
+        start = buf.tell()
+        req = YtdlRequest(url, headers={**headers, "Range": f"bytes={start}-{start + chunk - 1}"})
+        try:
+            with ydl.urlopen(req) as resp:
+                data = resp.read()
+        except YtdlHTTPError as e:
+            # 크기를 모를 때 정확히 조각 경계에서 끝나면 다음 요청이 416
+            if e.status == 416 and start > 0:
+                break
+            raise
+        buf.write(data)
+        if len(data) < chunk:
+            break
+    return buf.getvalue()
 
-    try:
-        client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-    except Exception as e:
-        logging.error(f"OpenAI 클라이언트 초기화 오류: {e}")
-        return ""
 
+def _download_youtube_audio(video_url: str, vid: str) -> tuple[str, bytes]:
+    """yt-dlp로 음원을 받아 (파일명, 바이트)로 돌려줍니다. 블로킹이므로 스레드에서 호출합니다."""
     cookies_path = "/home/ubuntu/factseeker-python-ai/youtube_verification/cookies.txt"
-    outtmpl = f"{vid}.%(ext)s"
-    downloaded_paths: list[str] = []
 
-    try:
+    # 파일 다운로드 폴백은 임시 디렉터리에 받음: 실패로 남은 .part 조각까지 디렉터리째 정리됨
+    with tempfile.TemporaryDirectory(prefix="yt-audio-") as td:
         ydl_opts = {
             'format': 'bestaudio/best',
-            'outtmpl': outtmpl,
+            'outtmpl': os.path.join(td, f"{vid}.%(ext)s"),
             'cookiefile': cookies_path,
             'quiet': True,
         }
 
-        logging.info(f"🎬 yt-dlp로 음원 다운로드 시작: {video_url}")
         with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            info = ydl.extract_info(video_url, download=False)
+            try:
+                audio_bytes = _read_audio_to_memory(ydl, info)
+            except Exception as e:
+                logging.warning(f"⚠️ 메모리 음원 다운로드 실패, 파일 다운로드로 전환: {e}")
+                audio_bytes = None
+
+            if audio_bytes:
+                return f"{vid}.{info.get('ext') or 'm4a'}", audio_bytes
+
+            # 조각 스트림 등 직접 받을 수 없는 포맷: 파일로 받아서 읽음 (후처리/재인코딩 없음)
             info = ydl.extract_info(video_url, download=True)
             sinfo = ydl.sanitize_info(info)
+            downloaded_paths: list[str] = []
             if 'requested_downloads' in sinfo:
                 downloaded_paths = [d['filepath'] for d in sinfo['requested_downloads']]
             elif '_filename' in sinfo:
@@ -619,13 +1144,71 @@ def fetch_youtube_transcript(video_url: str) -> str:
                 raise RuntimeError("yt-dlp 다운로드 실패")
 
             audio_file = downloaded_paths[0]
+            with open(audio_file, "rb") as f:
+                return os.path.basename(audio_file), f.read()
+
+
+# 영상 자막은 바뀌지 않으므로 만료 없이 개수만 제한. video_id → (저장 시각, 자막)
+TRANSCRIPT_CACHE_SIZE = int(os.environ.get("TRANSCRIPT_CACHE_SIZE", "128"))
+_TRANSCRIPT_CACHE: dict[str, tuple[float, str]] = {}
+_transcript_locks: dict[str, list] = {}
 
-        logging.info(f"✅ 음원 다운로드 완료: {audio_file}")
+WHISPER_MAX_CONCURRENCY = int(os.environ.get("WHISPER_MAX_CONCURRENCY", "4"))
 
-        with open(audio_file, "rb") as f:
-            transcript = client.audio.transcriptions.create(
+_OPENAI_CLIENT: AsyncOpenAI | None = None
+_OPENAI_LOOP: asyncio.AbstractEventLoop | None = None
+
+
+def _get_openai() -> AsyncOpenAI:
+    """실행 중인 이벤트 루프에 묶인 공유 AsyncOpenAI 클라이언트 (httpx 커넥션 풀/TLS 재사용)"""
+    global _OPENAI_CLIENT, _OPENAI_LOOP
+    loop = asyncio.get_running_loop()
+    if _OPENAI_CLIENT is None or _OPENAI_CLIENT.is_closed() or _OPENAI_LOOP is not loop:
+        _OPENAI_CLIENT = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        _OPENAI_LOOP = loop
+    return _OPENAI_CLIENT
+
+
+async def fetch_youtube_transcript(video_url: str) -> str:
+    vid = extract_video_id(video_url)
+    logging.info(f"[디버깅] 추출된 video_id: {vid}")
+    if not vid:
+        logging.error("유효한 YouTube URL이 아닙니다.")
+        return ""
+
+    cached = _ttl_cache_get(_TRANSCRIPT_CACHE, vid, None)
+    if cached is not None:
+        logging.info(f"♻️ 자막 캐시 사용: {vid}")
+        return cached
+
+    # 같은 영상이 동시에 들어오면 다운로드/Whisper 호출은 한 번만
+    async with _keyed_lock(_transcript_locks, vid):
+        cached = _ttl_cache_get(_TRANSCRIPT_CACHE, vid, None)
+        if cached is not None:
+            return cached
+        text = await _transcribe_youtube_audio(video_url, vid)
+        if text:
+            _ttl_cache_put(_TRANSCRIPT_CACHE, vid, text, TRANSCRIPT_CACHE_SIZE)
+        return text
+
+
+async def _transcribe_youtube_audio(video_url: str, vid: str) -> str:
+    try:
+        client = _get_openai()
+    except Exception as e:
+        logging.error(f"OpenAI 클라이언트 초기화 오류: {e}")
+        return ""
+
+    try:
+        logging.info(f"🎬 yt-dlp로 음원 다운로드 시작: {video_url}")
+        audio_name, audio_bytes = await asyncio.to_thread(_download_youtube_audio, video_url, vid)
+        logging.info(f"✅ 음원 다운로드 완료: {audio_name} ({len(audio_bytes)} bytes)")
+
+        # OpenAI 분당 요청 한도를 넘지 않도록 동시에 진행하는 Whisper 업로드 수 제한
+        async with _loop_semaphore("whisper", WHISPER_MAX_CONCURRENCY):
+            transcript = await client.audio.transcriptions.create(
                 model="whisper-1",
-                file=f,
+                file=(audio_name, audio_bytes),
                 language="ko"
             )
         logging.info("✅ Whisper API로 자막 추출 완료")
@@ -634,14 +1217,6 @@ def fetch_youtube_transcript(video_url: str) -> str:
     except Exception as e:
         logging.exception(f"yt-dlp 또는 Whisper 처리 중 오류: {e}")
         return ""
-    finally:
-        for p in downloaded_paths:
-            try:
-                if os.path.exists(p):
-                    os.remove(p)
-                    logging.info(f"🗑️ 임시 파일 삭제 완료: {p}")
-            except Exception:
-                pass
 
 
 # -----------------------------
@@ -650,52 +1225,126 @@ def fetch_youtube_transcript(video_url: str) -> str:
 def calculate_fact_check_confidence(criteria_scores: dict) -> int:
     if not criteria_scores:
         return 0
-    total_possible = 0
-    total_actual = 0
-    for _, score in criteria_scores.items():
-        if not (0 <= score <= 5):
-            logging.error(f"오류: 점수 '{score}'가 유효 범위(0-5)를 벗어남")
-            return 0
-        total_possible += 5
-        total_actual += score
-    if total_possible == 0:
+    scores = criteria_scores.values()  # 뷰는 len()/재순회가 가능하므로 리스트로 복사하지 않음
+    invalid = next((score for score in scores if not (0 <= score <= 5)), None)
+    if invalid is not None:
+        logging.error(f"오류: 점수 '{invalid}'가 유효 범위(0-5)를 벗어남")
         return 0
-    pct = (total_actual / total_possible) * 100
+    # 기존과 같은 연산 순서(합/만점*100)로 계산해야 .5 경계의 반올림 결과가 바뀌지 않음
+    pct = (sum(scores) / (5 * len(scores))) * 100
     return max(0, min(100, round(pct)))
 
 
+# 흔한 scheme://netloc 형태만 정규식으로 빠르게 처리. 앞뒤 공백/제어 문자, scheme 없는 //host,
+# IPv6 대괄호 등 나머지는 urlparse에 맡겨 결과가 urlparse(url).netloc과 같도록 함
+_NETLOC_RE = re.compile(r"[A-Za-z][A-Za-z0-9+.\-]*://([^/?#\s\[\]]*)(?=[/?#]|\Z)")
+
+
+@functools.lru_cache(maxsize=4096)
+def _url_domain(url: str) -> str | None:
+    m = _NETLOC_RE.match(url)
+    if m:
+        netloc = m.group(1)
+    else:
+        try:
+            netloc = urlparse(url).netloc
+        except ValueError:
+            return None
+    return netloc.lower() if netloc else None
+
+
+def evidence_source_key(item: dict) -> str | None:
+    """출처 다양성 계산에 쓰는 증거의 출처 키 (source_title 우선, 없으면 URL 도메인)."""
+    st = item.get("source_title")
+    if st:
+        return st.lower()
+    url = item.get("url")
+    if url and isinstance(url, str):
+        return _url_domain(url)
+    return None
+
+
+# 서로 다른 출처 개수(0, 1, 2, 3, 4 이상) → 출처 다양성 점수
+_DIVERSITY_TABLE = (0, 1, 3, 4, 5)
+
+
+def source_diversity_from_count(n: int) -> int:
+    """서로 다른 출처 개수 → 출처 다양성 점수(0~5)."""
+    return _DIVERSITY_TABLE[min(max(n, 0), 4)]
+
+
 def calculate_source_diversity_score(evidence: list[dict]) -> int:
     if not evidence:
         return 0
-    unique = set()
-    for item in evidence:
-        st = item.get("source_title")
-        if st:
-            unique.add(st.lower())
-            continue
-        url = item.get("url")
-        if url:
-            try:
-                dom = urlparse(url).netloc
-                if dom:
-                    unique.add(dom.lower())
-            except Exception:
-                pass
-    n = len(unique)
-    if n >= 4:
-        return 5
-    if n == 3:
-        return 4
-    if n == 2:
-        return 3
-    if n == 1:
-        return 1
-    return 0
+    unique = {evidence_source_key(item) for item in evidence}
+    unique.discard(None)
+    unique.discard("")
+    return source_diversity_from_count(len(unique))
 
 
 # -----------------------------
 # JSON 증거 본문 전처리
 # -----------------------------
+# 증거 항목마다 호출되므로 패턴은 모듈 로드 시 한 번만 컴파일 (적용 순서가 결과에 영향을 주므로 순서 유지)
+# 각 패턴은 (매치에 반드시 필요한 문자열, 정규식) 쌍: 현재 본문에 그 문자열이 없으면 정규식 스캔을 건너뜀.
+# 앞 패턴의 삭제로 새 문자열이 이어 붙을 수 있으므로 검사는 매번 현재 본문에 대해 수행.
+# 대소문자 구분 없는 영문 패턴은 유니코드 대소문자 등가 때문에 None(항상 실행)
+_RE_HTML_TAG = re.compile(r'<[^>]+>')
+
+# 기자명 패턴 (다양한 패턴 지원)
+_EVIDENCE_REPORTER_RES = tuple((lit, re.compile(p, re.IGNORECASE)) for lit, p in (
+    ('기자', r'[가-힣]+\s*기자'),  # 한글 기자명
+    ('기자', r'[A-Za-z]+\s*기자'),  # 영문 기자명
+    ('기자', r'기자\s*[가-힣]+'),  # 기자 + 한글명
+    ('기자', r'기자\s*[A-Za-z]+'),  # 기자 + 영문명
+    ('기자', r'[가-힣]+\s*[A-Za-z]+\s*기자'),  # 한글+영문 기자명
+    ('기자', r'[A-Za-z]+\s*[가-힣]+\s*기자'),  # 영문+한글 기자명
+    ('기자', r'기자\s*[가-힣]+\s*[A-Za-z]+'),  # 기자 + 한글+영문명
+    ('기자', r'기자\s*[A-Za-z]+\s*[가-힣]+'),  # 기자 + 영문+한글명
+))
+
+# Copyright 관련 텍스트
+_EVIDENCE_COPYRIGHT_RES = tuple((lit, re.compile(p, re.IGNORECASE)) for lit, p in (
+    (None, r'Copyright\s*©?\s*\d{4}\s*[가-힣A-Za-z\s]+'),
+    ('©', r'©\s*\d{4}\s*[가-힣A-Za-z\s]+'),
+    ('저작권', r'저작권\s*©?\s*\d{4}\s*[가-힣A-Za-z\s]+'),
+    ('무단전재', r'무단전재\s*및\s*재배포\s*금지'),
+    ('무단복제', r'무단복제\s*금지'),
+    (None, r'All\s+rights\s+reserved'),
+    ('저작권자', r'저작권자\s*[가-힣A-Za-z\s]+'),
+    ('본사', r'본사\s*[가-힣A-Za-z\s]+'),
+    ('신문사', r'신문사\s*[가-힣A-Za-z\s]+'),
+    ('뉴스사', r'뉴스사\s*[가-힣A-Za-z\s]+'),
+))
+
+# 언론사 관련 텍스트
+# ~뉴스/~신문 등은 공백을 포함한 문자 구간의 시작에서만 매치를 시도 (?<!...): 구간 중간 위치마다
+# 끝까지 다시 훑는 O(n^2) 백트래킹을 막음. 매치는 항상 구간 시작에서 마지막 접미사까지라 결과는 같음
+_MEDIA_RUN = r'(?<![가-힣A-Za-z\s])[가-힣A-Za-z\s]+'
+_EVIDENCE_MEDIA_RES = tuple((lit, re.compile(p, re.IGNORECASE)) for lit, p in (
+    ('[', r'\[[가-힣A-Za-z\s]+\]'),  # 대괄호로 둘러싸인 언론사명
+    ('(', r'\([가-힣A-Za-z\s]+\)'),  # 괄호로 둘러싸인 언론사명
+    ('뉴스', _MEDIA_RUN + r'뉴스'),  # ~뉴스 패턴
+    ('신문', _MEDIA_RUN + r'신문'),  # ~신문 패턴
+    ('일보', _MEDIA_RUN + r'일보'),  # ~일보 패턴
+    ('경제', _MEDIA_RUN + r'경제'),  # ~경제 패턴
+))
+
+# 날짜/시간 관련 텍스트
+_EVIDENCE_DATE_RES = tuple((lit, re.compile(p)) for lit, p in (
+    ('년', r'\d{4}년\s*\d{1,2}월\s*\d{1,2}일'),
+    ('-', r'\d{4}-\d{1,2}-\d{1,2}'),
+    (':', r'\d{1,2}:\d{2}'),  # 시간
+    ('오전', r'오전\s*\d{1,2}:\d{2}'),
+    ('오후', r'오후\s*\d{1,2}:\d{2}'),
+))
+
+_EVIDENCE_STRIP_RES = _EVIDENCE_REPORTER_RES + _EVIDENCE_COPYRIGHT_RES + _EVIDENCE_MEDIA_RES + _EVIDENCE_DATE_RES
+
+_RE_HSPACE = re.compile(r'[ \t]+')
+_RE_BLANK_LINES = re.compile(r'\n\s*\n')
+
+
 def clean_evidence_content(content: str) -> str:
     """
     JSON 증거 본문에서 기자명, copyright, HTML 태그 등을 제거하는 전처리 함수
@@ -710,71 +1359,19 @@ def clean_evidence_content(content: str) -> str:
         return ""
     
     # HTML 태그 제거
-    content = re.sub(r'<[^>]+>', '', content)
+    content = _RE_HTML_TAG.sub('', content)
     
     # ** 제거
     content = content.replace("**", "")
     
-    # 기자명 패턴 제거 (다양한 패턴 지원)
-    reporter_patterns = [
-        r'[가-힣]+\s*기자',  # 한글 기자명
-        r'[A-Za-z]+\s*기자',  # 영문 기자명
-        r'기자\s*[가-힣]+',  # 기자 + 한글명
-        r'기자\s*[A-Za-z]+',  # 기자 + 영문명
-        r'[가-힣]+\s*[A-Za-z]+\s*기자',  # 한글+영문 기자명
-        r'[A-Za-z]+\s*[가-힣]+\s*기자',  # 영문+한글 기자명
-        r'기자\s*[가-힣]+\s*[A-Za-z]+',  # 기자 + 한글+영문명
-        r'기자\s*[A-Za-z]+\s*[가-힣]+',  # 기자 + 영문+한글명
-    ]
-    
-    for pattern in reporter_patterns:
-        content = re.sub(pattern, '', content, flags=re.IGNORECASE)
-    
-    # Copyright 관련 텍스트 제거
-    copyright_patterns = [
-        r'Copyright\s*©?\s*\d{4}\s*[가-힣A-Za-z\s]+',
-        r'©\s*\d{4}\s*[가-힣A-Za-z\s]+',
-        r'저작권\s*©?\s*\d{4}\s*[가-힣A-Za-z\s]+',
-        r'무단전재\s*및\s*재배포\s*금지',
-        r'무단복제\s*금지',
-        r'All\s+rights\s+reserved',
-        r'저작권자\s*[가-힣A-Za-z\s]+',
-        r'본사\s*[가-힣A-Za-z\s]+',
-        r'신문사\s*[가-힣A-Za-z\s]+',
-        r'뉴스사\s*[가-힣A-Za-z\s]+',
-    ]
-    
-    for pattern in copyright_patterns:
-        content = re.sub(pattern, '', content, flags=re.IGNORECASE)
-    
-    # 언론사 관련 텍스트 제거
-    media_patterns = [
-        r'\[[가-힣A-Za-z\s]+\]',  # 대괄호로 둘러싸인 언론사명
-        r'\([가-힣A-Za-z\s]+\)',  # 괄호로 둘러싸인 언론사명
-        r'[가-힣A-Za-z\s]+뉴스',  # ~뉴스 패턴
-        r'[가-힣A-Za-z\s]+신문',  # ~신문 패턴
-        r'[가-힣A-Za-z\s]+일보',  # ~일보 패턴
-        r'[가-힣A-Za-z\s]+경제',  # ~경제 패턴
-    ]
-    
-    for pattern in media_patterns:
-        content = re.sub(pattern, '', content, flags=re.IGNORECASE)
-    
-    # 날짜/시간 관련 텍스트 제거
-    date_patterns = [
-        r'\d{4}년\s*\d{1,2}월\s*\d{1,2}일',
-        r'\d{4}-\d{1,2}-\d{1,2}',
-        r'\d{1,2}:\d{2}',  # 시간
-        r'오전\s*\d{1,2}:\d{2}',
-        r'오후\s*\d{1,2}:\d{2}',
-    ]
-    
-    for pattern in date_patterns:
-        content = re.sub(pattern, '', content)
+    # 기자명 → Copyright → 언론사 → 날짜/시간 순으로 제거
+    for lit, rx in _EVIDENCE_STRIP_RES:
+        if lit is None or lit in content:
+            content = rx.sub('', content)
     
     # 불필요한 공백 정리 (문장 구조 보존)
-    content = re.sub(r'[ \t]+', ' ', content)  # 탭과 연속 공백만 단일 공백으로
-    content = re.sub(r'\n\s*\n', '\n', content)  # 연속 줄바꿈 정리
+    content = _RE_HSPACE.sub(' ', content)  # 탭과 연속 공백만 단일 공백으로
+    content = _RE_BLANK_LINES.sub('\n', content)  # 연속 줄바꿈 정리
     content = content.strip()
     
     # 너무 짧아진 경우 원본 반환
@@ -275,3 +275,27 @@ def build_three_line_summarizer_chain():
 세 번째 문장.
 """)
     return prompt | get_chat_llm()
+
+
+def build_keywords_and_summary_chain():
+    prompt = PromptTemplate.from_template("""
+[역할]
+당신은 주어진 텍스트에서 핵심 키워드를 추출하고, 내용을 세 문장으로 간결하게 요약하는 전문가입니다.
+
+[지시 사항]
+- "keywords": 주어진 텍스트에서 가장 중요하고 대표적인 키워드 9개를 추출하세요.
+  - 키워드는 명사 또는 명사구 형태여야 합니다.
+  - 광고성 내용(제품 홍보, 구매 유도 등)은 키워드에서 제외하세요.
+- "summary": 주어진 텍스트의 핵심 내용을 정확히 세 문장으로 요약하세요.
+  - 각 문장은 간결하고 명확해야 하며, 불필요한 서론이나 결론은 넣지 마세요.
+  - 광고성 내용(제품 홍보, 구매 유도 등)은 요약에 포함하지 마세요.
+- 출력은 반드시 아래 형식의 JSON 객체 하나여야 합니다.
+- 추가 텍스트, 코드 블록 표기(```), 접두/접미 문구 없이 JSON 객체만 출력하세요.
+
+[입력 텍스트]
+{text}
+
+[출력 형식]
+{{"keywords": ["키워드1", "키워드2", "키워드3", "키워드4", "키워드5", "키워드6", "키워드7", "키워드8", "키워드9"], "summary": ["첫 번째 문장.", "두 번째 문장.", "세 번째 문장."]}}
+""")
+    return prompt | get_chat_llm()
@@ -14,6 +14,7 @@ from dotenv import load_dotenv
 from services.fact_checker import run_fact_check
 from core.preload_s3_faiss import preload_faiss_from_existing_s3, CHUNK_CACHE_DIR
 from article_checker.router import create_router as create_article_router
+from core.lambdas import close_session, warm_driver_pool
 
 # .env 파일에서 환경 변수를 로드합니다.
 load_dotenv()
@@ -51,11 +52,12 @@ def _refresh_faiss_partition_dirs():
         except Exception:
             return -1
 
-    items = [
-        os.path.join(CHUNK_CACHE_DIR, item)
-        for item in os.listdir(CHUNK_CACHE_DIR)
-        if os.path.isdir(os.path.join(CHUNK_CACHE_DIR, item)) and item.startswith("partition_")
-    ]
+    with os.scandir(CHUNK_CACHE_DIR) as it:
+        items = [
+            entry.path
+            for entry in it
+            if entry.name.startswith("partition_") and entry.is_dir()
+        ]
     for item_path in sorted(items, key=partition_num, reverse=True):
         faiss_partition_dirs.append(item_path)
 
@@ -143,13 +145,19 @@ async def lifespan(app: FastAPI):
         logging.info(f"🕒 제목 프리로드 감시 시작(interval={watch_interval}s, include_p10={include_p10})")
         watch_task = asyncio.create_task(_watch_titles_preload_task(TITLE_FAISS_S3_PREFIX, watch_interval, include_p10))
 
+    # Chrome 기동은 수 초가 걸리므로 서버 시작을 막지 않고 백그라운드 스레드에서 드라이버 풀 예열
+    warm_task = asyncio.create_task(asyncio.to_thread(warm_driver_pool))
+
     try:
         yield
     finally:
+        if not warm_task.done():
+            warm_task.cancel()
         if watch_task:
             watch_task.cancel()
             with contextlib.suppress(Exception):
                 await watch_task
+        await close_session()
     # 서버 종료 시 실행될 코드
     logging.info("애플리케이션 종료...")
 
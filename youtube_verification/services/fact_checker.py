@@ -3,11 +3,7 @@ import re
 import asyncio
 import json
 import logging
-import shutil
-import hashlib
 import numpy as np
-import boto3
-from botocore.exceptions import ClientError
 from langchain_openai import OpenAIEmbeddings
 from langchain_community.vectorstores import FAISS
 from langchain.docstore.document import Document
@@ -34,10 +30,11 @@ from core.llm_chains import (
     build_keyword_extractor_chain,
     build_three_line_summarizer_chain
 )
-from core.faiss_manager import CHUNK_CACHE_DIR
+from core.faiss_manager import (
+    load_faiss_mmap, load_faiss_from_cache, bulk_load_faiss_from_cache, save_faiss_to_cache, get_hot_faiss,
+)
 
 # --- 설정값 ---
-S3_BUCKET_NAME = os.environ.get("S3_BUCKET_NAME", "factseeker-faiss-db")
 MAX_CLAIMS_TO_FACT_CHECK = 10
 MAX_ARTICLES_PER_CLAIM = 10  # ✨ 주장당 최대 검색 기사 수 (이 값을 조절하세요) ✨
 DISTANCE_THRESHOLD = 0.8
@@ -76,12 +73,6 @@ def _is_policy_refusal(text: str) -> bool:
             return True
     return False
 
-try:
-    s3 = boto3.client('s3')
-except Exception as e:
-    s3 = None
-    logging.error(f"S3 클라이언트 초기화 실패: {e}")
-
 embed_model = OpenAIEmbeddings(
     model="text-embedding-3-small", request_timeout=60, max_retries=5, chunk_size=500
 )
@@ -90,111 +81,64 @@ embed_model = OpenAIEmbeddings(
 url_locks = {}
 
 
-# --- URL 기반 캐시 경로 및 S3 동기화 ---
-def url_to_cache_key(url):
-    """Create a stable cache key from a URL-like value.
+# --- 기사 URL 기준 FAISS 생성/로드 (잠금 로직 적용) ---
+async def ensure_article_faiss(url, cache_checked=False):
+    """(잠금 기능 추가) 기사 본문을 벡터화하고 캐시(메모리/로컬/S3)에 저장/로드
 
-    Be defensive: metadata from external indices can sometimes contain
-    non-string values (e.g., float NaN). Convert to string to avoid
-    AttributeError from calling .encode() on non-strings.
+    캐시 키/경로와 S3 동기화는 core.faiss_manager가 담당합니다. (v2 키 우선, 없으면 v1 키를 찾아 이전)
+    cache_checked=True는 호출자가 이미 로컬/S3 캐시를 확인해 없음을 안 경우로, 메모리 핫 캐시만 다시 봅니다.
     """
-    if url is None:
-        raw = ""
-    elif not isinstance(url, str):
-        raw = str(url)
-    else:
-        raw = url
-    return hashlib.md5(raw.encode()).hexdigest()
-
-def get_article_faiss_path(url):
-    return os.path.join(CHUNK_CACHE_DIR, url_to_cache_key(url))
-
-def upload_to_s3(local_dir, s3_key):
-    if not s3:
-        logging.warning("S3 클라이언트가 없어 업로드를 건너뜁니다.")
-        return
-    for root, _, files in os.walk(local_dir):
-        for file in files:
-            local_path = os.path.join(root, file)
-            s3_path = os.path.join(s3_key, file)
-            try:
-                s3.upload_file(local_path, S3_BUCKET_NAME, s3_path)
-            except ClientError as e:
-                logging.error(f"S3 업로드 실패: {local_path} -> s3://{S3_BUCKET_NAME}/{s3_path} - {e}")
-                raise
-
-def download_from_s3(local_dir, s3_key):
-    if not s3:
-        logging.warning("S3 클라이언트가 없어 다운로드를 건너뜁니다.")
-        return False
-    try:
-        response = s3.list_objects_v2(Bucket=S3_BUCKET_NAME, Prefix=s3_key)
-        if 'Contents' not in response:
-            return False
-        os.makedirs(local_dir, exist_ok=True)
-        for obj in response['Contents']:
-            s3_path = obj['Key']
-            relative_path = os.path.relpath(s3_path, s3_key)
-            local_path = os.path.join(local_dir, relative_path)
-            os.makedirs(os.path.dirname(local_path), exist_ok=True)
-            s3.download_file(S3_BUCKET_NAME, s3_path, local_path)
-        return True
-    except ClientError as e:
-        if e.response['Error']['Code'] == '404':
-            return False
-        logging.error(f"S3 다운로드 중 오류 발생: s3://{S3_BUCKET_NAME}/{s3_key} - {e}")
-        return False
+    # 최근에 로드/생성한 기사는 잠금 없이 메모리 핫 캐시에서 바로 반환
+    faiss_db = get_hot_faiss(url)
+    if faiss_db is not None:
+        return faiss_db
 
-# --- 기사 URL 기준 FAISS 생성/로드 (잠금 로직 적용) ---
-async def ensure_article_faiss(url):
-    """(잠금 기능 추가) 기사 본문을 벡터화하고 캐시(S3/로컬)에 저장/로드"""
     lock = url_locks.setdefault(url, asyncio.Lock())
     async with lock:
-        cache_key = url_to_cache_key(url)
-        local_path = get_article_faiss_path(url)
-        faiss_path = os.path.join(local_path, "index.faiss")
-        pkl_path = os.path.join(local_path, "index.pkl")
-        s3_key = f"article_faiss_cache/{cache_key}"
+        # 잠금을 기다리는 동안 다른 요청이 만든 인덱스는 핫 캐시에 들어 있음
+        if cache_checked:
+            faiss_db = get_hot_faiss(url)
+        else:
+            faiss_db = await load_faiss_from_cache(url, embed_model)
+        if faiss_db is not None:
+            logging.info(f"캐시 재사용 (잠금 후 확인): {url}")
+            return faiss_db
 
-        if os.path.exists(faiss_path) and os.path.exists(pkl_path):
-            try:
-                logging.info(f"캐시 재사용 (잠금 후 확인): {url}")
-                return FAISS.load_local(local_path, embed_model, allow_dangerous_deserialization=True)
-            except Exception as e:
-                shutil.rmtree(local_path, ignore_errors=True)
-                logging.warning(f"로컬 캐시 손상, 재생성 시도: {e}")
-        
-        if s3 is not None and download_from_s3(local_path, s3_key):
-            try:
-                logging.info(f"S3 캐시 재사용 (잠금 후 확인): {url}")
-                return FAISS.load_local(local_path, embed_model, allow_dangerous_deserialization=True)
-            except Exception as e:
-                shutil.rmtree(local_path, ignore_errors=True)
-                logging.warning(f"S3 캐시 손상, 재생성 시도: {e}")
-        
         logging.info(f"캐시 없음, 신규 크롤링 시작: {url}")
         text = await get_article_text(url)
         if not text or len(text) < 200:
             return None
             
-        doc = Document(page_content=text, metadata={"url": url})
-        faiss_db = FAISS.from_documents([doc], embed_model)
-        faiss_db.save_local(local_path)
-        
-        if s3 is not None:
-            try:
-                upload_to_s3(local_path, s3_key)
-                logging.info(f"✅ S3 업로드 성공: {s3_key}")
-            except Exception as e:
-                logging.warning(f"S3 업로드 실패: {e}")
-                
-        return faiss_db
+        # 임베딩은 비동기 클라이언트로, 인덱스 저장/업로드는 스레드에서 수행해 이벤트 루프를 막지 않음
+        vectors = await embed_model.aembed_documents([text])
+        faiss_db = FAISS.from_embeddings([(text, vectors[0])], embed_model, metadatas=[{"url": url}])
+        return await save_faiss_to_cache(url, faiss_db)
 
 # --- CSE → FAISS에서 여러 기사, url 기준 중복 없는 문서만 수집 (한도 즉시 중단) ---
-async def search_and_retrieve_docs_once(claim, faiss_partition_dirs, seen_urls, use_google_cse=False):
-    def _is_valid_url(value) -> bool:
-        return isinstance(value, str) and value.strip().lower().startswith(("http://", "https://"))
-    summarizer = build_claim_summarizer()
+def _is_valid_url(value) -> bool:
+    return isinstance(value, str) and value.strip().lower().startswith(("http://", "https://"))
+
+# 파티션 디렉터리의 숫자가 클수록 우선 (최신)
+def _partition_num(path: str) -> int:
+    base = os.path.basename(path)
+    m = re.search(r'(\d+)', base)
+    return int(m.group(1)) if m else -1
+
+# 임베딩 호출 안정화: 소규모 재시도/예외 보호
+async def _embed_documents_with_retry(texts, retries=1):
+    delay = 0.5
+    for attempt in range(retries + 1):
+        try:
+            return await embed_model.aembed_documents(texts)
+        except Exception as e:
+            logging.warning(f"임베딩 실패(재시도 {attempt}/{retries}): {e}")
+            if attempt < retries:
+                await asyncio.sleep(delay)
+                delay *= 2
+    return []
+
+async def _search_titles_for_claim(summarizer, claim, use_google_cse):
+    """주장 요약 → 뉴스 검색 → (요약 검색어, 정제된 제목 목록, 원본 제목 목록)"""
     try:
         summary_result = await summarizer.ainvoke({"claim": claim})
         summarized_query = summary_result.content.strip()
@@ -203,194 +147,205 @@ async def search_and_retrieve_docs_once(claim, faiss_partition_dirs, seen_urls,
         logging.error(f"Claim 요약 실패: {e}, 원문으로 검색 진행")
         summarized_query = claim
 
-    # 파티션은 호출 시 전달된 목록을 그대로 사용 (최신 → 과거)
-
     # 신뢰도가 0일 경우 Google CSE 사용, 그렇지 않으면 네이버 API 사용
     if use_google_cse:
         logging.info("🔄 신뢰도 0으로 인한 Google CSE 재시도")
         search_results = await search_news_google_cs(summarized_query)
-        # Google CSE 결과를 네이버 API 형식으로 변환
-        cse_titles = []
-        cse_raw_titles = []
-        for item in search_results[:10]:
-            title = item.get('title', '')
-            snippet = item.get('snippet', '').replace("**", "")
-            cse_titles.append(clean_news_title(title))
-            cse_raw_titles.append(title)
     else:
         search_results = await search_news_naver_api(summarized_query)
-        # CSE 상위 10개만 사용
-        cse_titles = [clean_news_title(item.get('title', '')) for item in search_results[:10]]
-        cse_raw_titles = [item.get('title', '') for item in search_results[:10]]
-    
+    # 상위 10개만 사용
+    cse_raw_titles = [item.get('title', '') for item in search_results[:10]]
+    cse_titles = [clean_news_title(title) for title in cse_raw_titles]
+    return summarized_query, cse_titles, cse_raw_titles
+
+def _select_title_matches(title_faiss_db, D, I, state, seen_urls):
+    """한 파티션의 검색 결과(D, I: 해당 주장의 제목 행들)로 주장별 기사 URL을 채택합니다."""
+    # CSE 순서대로, 각 제목에서 첫 유효 URL만 채택 (후보를 안정 정렬 후 선택)
+    for j in range(len(D)):
+        if j in state["chosen"]:
+            continue
+        # 후보 수집: 임계값을 통과한 것만 모음
+        candidates = []
+        for i, dist in enumerate(D[j]):
+            if dist < DISTANCE_THRESHOLD:
+                faiss_idx = I[j][i]
+                docstore_id = title_faiss_db.index_to_docstore_id[faiss_idx]
+                doc = title_faiss_db.docstore._dict.get(docstore_id)
+                if not doc:
+                    continue
+                url = (doc.metadata or {}).get("url")
+                # 정렬을 위한 안전한 기본값
+                url_key = url if isinstance(url, str) else ""
+                candidates.append((float(dist), str(docstore_id), url_key, url))
+
+        # 안정 정렬: 거리 오름차순 → docstore_id → url 사전순
+        candidates.sort(key=lambda t: (t[0], t[1], t[2]))
+
+        # 정렬된 후보 중 첫 유효 URL 선택
+        for _dist, _doc_id, _url_key, url in candidates:
+            if _is_valid_url(url) and url not in seen_urls and url not in state["seen"]:
+                state["urls"].append(url)
+                state["meta"][url] = {
+                    "matched_cse_title": state["titles"][j],
+                    "raw_cse_title": state["raw_titles"][j]
+                }
+                state["seen"].add(url)
+                state["chosen"].add(j)
+                if len(state["urls"]) >= MAX_ARTICLES_PER_CLAIM:
+                    state["stop"] = True
+                break
+        if state["stop"]:
+            break
 
-    if not cse_titles:
-        logging.warning("네이버 검색 결과에서 제목을 찾을 수 없어 탐색을 종료합니다.")
+async def _collect_docs(state, seen_urls, preloaded):
+    docs = []
+    for url in state["urls"]:
+        # 일괄 캐시 로드에서 찾은 인덱스를 쓰고, 없는 기사만 개별 생성 (일괄 로드에서 확인한 캐시는 다시 보지 않음)
+        faiss_db = preloaded.get(url)
+        if faiss_db is None:
+            faiss_db = await ensure_article_faiss(url, cache_checked=url in preloaded)
+        if faiss_db:
+            for doc in faiss_db.docstore._dict.values():
+                actual_url = doc.metadata.get("url")
+                if _is_valid_url(actual_url) and actual_url not in seen_urls:
+                    meta = state["meta"].get(actual_url, {"matched_cse_title": "", "raw_cse_title": ""})
+                    docs.append(Document(
+                        page_content=doc.page_content,
+                        metadata={
+                            "url": actual_url,
+                            "matched_cse_title": meta["matched_cse_title"],
+                            "raw_cse_title": meta["raw_cse_title"]
+                        }
+                    ))
+                    break
+    return docs
+
+async def search_and_retrieve_docs_batch(claims, faiss_partition_dirs, seen_urls=None, use_google_cse=False):
+    """여러 주장의 근거 문서를 한 번의 파티션 순회로 찾습니다.
+
+    주장별 검색 제목 임베딩을 한 번에 요청하고, 각 파티션은 한 번만 열어 모든 주장의 제목 벡터를
+    하나의 행렬로 검색합니다. 주장별 채택/조기 종료 규칙은 search_and_retrieve_docs_once와 같습니다.
+    반환값은 claims와 같은 순서의 문서 리스트 목록입니다.
+    """
+    seen_urls = seen_urls if seen_urls is not None else set()
+    if not claims:
         return []
+    claim_semaphore = asyncio.Semaphore(MAX_CONCURRENT_CLAIMS)
+    summarizer = build_claim_summarizer()
 
-    # 임베딩 호출 안정화: 소규모 재시도/예외 보호
-    def _embed_docs_with_retry(texts, retries=1):
-        delay = 0.5
-        for attempt in range(retries + 1):
-            try:
-                return embed_model.embed_documents(texts)
-            except Exception as e:
-                logging.warning(f"임베딩 실패(재시도 {attempt}/{retries}): {e}")
-                if attempt < retries:
-                    import time as _t
-                    _t.sleep(delay)
-                    delay *= 2
-                else:
-                    return []
-
-    cse_title_embs = _embed_docs_with_retry(cse_titles, retries=1)
-    search_vectors = np.array(cse_title_embs, dtype=np.float32)
-    # 선착 글로벌 조기중단을 위해 즉시 누적
-    article_urls = []
-    matched_meta = {}
-    chosen_for_cse = set()
-    seen_tmp = set()
-
-    # 파티션 디렉터리의 숫자가 클수록 우선 (최신)
-    def partition_num(path: str) -> int:
-        import os, re
-        base = os.path.basename(path)
-        m = re.search(r'(\d+)', base)
-        return int(m.group(1)) if m else -1
-
-    stop = False
-    for faiss_dir in sorted(faiss_partition_dirs, key=partition_num, reverse=True):
-        if stop:
+    async def _limited_search(claim):
+        async with claim_semaphore:
+            return await _search_titles_for_claim(summarizer, claim, use_google_cse)
+
+    searched = await asyncio.gather(*[_limited_search(claim) for claim in claims])
+    states = [
+        {
+            "query": query, "titles": titles, "raw_titles": raw_titles, "vectors": None,
+            "urls": [], "meta": {}, "chosen": set(), "seen": set(), "stop": False,
+        }
+        for query, titles, raw_titles in searched
+    ]
+    for state in states:
+        if not state["titles"]:
+            logging.warning("네이버 검색 결과에서 제목을 찾을 수 없어 탐색을 종료합니다.")
+
+    # 모든 주장의 제목을 한 번에 임베딩한 뒤 주장별로 나눔
+    searchable = [state for state in states if state["titles"]]
+    all_titles = [title for state in searchable for title in state["titles"]]
+    if all_titles:
+        embs = await _embed_documents_with_retry(all_titles, retries=1)
+        if embs:
+            vectors = np.array(embs, dtype=np.float32)
+            offset = 0
+            for state in searchable:
+                n = len(state["titles"])
+                state["vectors"] = vectors[offset:offset + n]
+                offset += n
+
+    # 파티션은 호출 시 전달된 목록을 최신 → 과거 순으로 한 번씩만 로드
+    sorted_dirs = sorted(faiss_partition_dirs, key=_partition_num, reverse=True)
+    active = [state for state in searchable if state["vectors"] is not None]
+    for faiss_dir in sorted_dirs:
+        active = [state for state in active if not state["stop"]]
+        if not active:
             break
         try:
-            before_count = len(article_urls)
-            title_faiss_db = FAISS.load_local(
-                faiss_dir, embeddings=embed_model, allow_dangerous_deserialization=True
-            )
+            title_faiss_db = load_faiss_mmap(faiss_dir, embed_model)
             if title_faiss_db.index.ntotal == 0:
                 continue
 
-            D, I = title_faiss_db.index.search(search_vectors, k=3)
-            # CSE 순서대로, 각 제목에서 첫 유효 URL만 채택 (후보를 안정 정렬 후 선택)
-            for j in range(len(cse_title_embs)):
-                if j in chosen_for_cse:
-                    continue
-                # 후보 수집: 임계값을 통과한 것만 모음
-                candidates = []
-                for i, dist in enumerate(D[j]):
-                    if dist < DISTANCE_THRESHOLD:
-                        faiss_idx = I[j][i]
-                        docstore_id = title_faiss_db.index_to_docstore_id[faiss_idx]
-                        doc = title_faiss_db.docstore._dict.get(docstore_id)
-                        if not doc:
-                            continue
-                        url = (doc.metadata or {}).get("url")
-                        # 정렬을 위한 안전한 기본값
-                        url_key = url if isinstance(url, str) else ""
-                        candidates.append((float(dist), str(docstore_id), url_key, url))
-
-                # 안정 정렬: 거리 오름차순 → docstore_id → url 사전순
-                candidates.sort(key=lambda t: (t[0], t[1], t[2]))
-
-                # 정렬된 후보 중 첫 유효 URL 선택
-                for _dist, _doc_id, _url_key, url in candidates:
-                    if _is_valid_url(url) and url not in seen_urls and url not in seen_tmp:
-                        article_urls.append(url)
-                        matched_meta[url] = {
-                            "matched_cse_title": cse_titles[j],
-                            "raw_cse_title": cse_raw_titles[j]
-                        }
-                        seen_tmp.add(url)
-                        chosen_for_cse.add(j)
-                        if len(article_urls) >= MAX_ARTICLES_PER_CLAIM:
-                            stop = True
-                        break
-                if stop:
-                    break
-            # 최신 파티션에서 일정 수 이상 확보되었으면 다음 파티션으로 진행하지 않고 종료
-            if len(article_urls) - before_count >= PARTITION_STOP_HITS:
-                stop = True
+            D, I = title_faiss_db.index.search(np.vstack([state["vectors"] for state in active]), k=3)
+            offset = 0
+            for state in active:
+                n = len(state["vectors"])
+                before_count = len(state["urls"])
+                _select_title_matches(title_faiss_db, D[offset:offset + n], I[offset:offset + n], state, seen_urls)
+                offset += n
+                # 최신 파티션에서 일정 수 이상 확보되었으면 다음 파티션으로 진행하지 않고 종료
+                if len(state["urls"]) - before_count >= PARTITION_STOP_HITS:
+                    state["stop"] = True
         except Exception as e:
             logging.error(f"FAISS 검색 실패: {faiss_dir} → {e}")
 
     # Fallback: CSE 기반 매칭이 한 건도 없으면, 요약 키워드 자체로 제목 FAISS를 직접 검색
-    if not article_urls:
+    pending = [state for state in searchable if not state["urls"]]
+    if pending:
         try:
-            logging.info("네이버 검색 기반 매칭 결과 없음 → 키워드 직접 FAISS 검색 시도")
-            # 임베딩 쿼리도 재시도/예외 보호
-            def _embed_query_with_retry(q, retries=1):
-                delay = 0.5
-                for attempt in range(retries + 1):
+            logging.info(f"네이버 검색 기반 매칭 결과 없음({len(pending)}건) → 키워드 직접 FAISS 검색 시도")
+            embs = await _embed_documents_with_retry([state["query"] for state in pending], retries=1)
+            if embs:
+                query_np = np.array(embs, dtype=np.float32)
+                fallbacks = [{} for _ in pending]
+
+                # 최신 파티션 우선
+                for faiss_dir in sorted_dirs:
                     try:
-                        return embed_model.embed_query(q)
+                        title_faiss_db = load_faiss_mmap(faiss_dir, embed_model)
+                        if title_faiss_db.index.ntotal == 0:
+                            continue
+                        D, I = title_faiss_db.index.search(query_np, k=5)
+                        for row, fallback in enumerate(fallbacks):
+                            for i, dist in enumerate(D[row]):
+                                if dist < DISTANCE_THRESHOLD:
+                                    faiss_idx = I[row][i]
+                                    docstore_id = title_faiss_db.index_to_docstore_id[faiss_idx]
+                                    doc = title_faiss_db.docstore._dict[docstore_id]
+                                    url = doc.metadata.get("url")
+                                    if not _is_valid_url(url):
+                                        continue
+                                    cur = fallback.get(url)
+                                    if (cur is None) or (dist < cur["dist"]):
+                                        fallback[url] = {"dist": float(dist)}
                     except Exception as e:
-                        logging.warning(f"임베딩 쿼리 실패(재시도 {attempt}/{retries}): {e}")
-                        if attempt < retries:
-                            import time as _t
-                            _t.sleep(delay)
-                            delay *= 2
-                        else:
-                            return None
-
-            emb = _embed_query_with_retry(summarized_query, retries=1)
-            if emb is None:
-                return []
-            query_vec = emb
-            query_np = np.array([query_vec], dtype=np.float32)
-            fallback = {}
-
-            # 최신 파티션 우선
-            for faiss_dir in sorted(faiss_partition_dirs, key=partition_num, reverse=True):
-                try:
-                    title_faiss_db = FAISS.load_local(
-                        faiss_dir, embeddings=embed_model, allow_dangerous_deserialization=True
-                    )
-                    if title_faiss_db.index.ntotal == 0:
+                        logging.error(f"FAISS 키워드 검색 실패: {faiss_dir} → {e}")
+
+                for state, fallback in zip(pending, fallbacks):
+                    if not fallback:
                         continue
-                    D, I = title_faiss_db.index.search(query_np, k=5)
-                    for i, dist in enumerate(D[0]):
-                        if dist < DISTANCE_THRESHOLD:
-                            faiss_idx = I[0][i]
-                            docstore_id = title_faiss_db.index_to_docstore_id[faiss_idx]
-                            doc = title_faiss_db.docstore._dict[docstore_id]
-                            url = doc.metadata.get("url")
-                            if not _is_valid_url(url):
-                                continue
-                            cur = fallback.get(url)
-                            if (cur is None) or (dist < cur["dist"]):
-                                fallback[url] = {"dist": float(dist)}
-                except Exception as e:
-                    logging.error(f"FAISS 키워드 검색 실패: {faiss_dir} → {e}")
-
-            if fallback:
-                # 거리 오름차순, 동률 시 URL 사전순으로 정렬 후 상한 적용
-                article_urls = [u for u, _ in sorted(fallback.items(), key=lambda kv: (kv[1]["dist"], kv[0]))][:MAX_ARTICLES_PER_CLAIM]
-                # 메타데이터에는 요약 질의를 기록
-                for u in article_urls:
-                    matched_meta[u] = {
-                        "matched_cse_title": summarized_query,
-                        "raw_cse_title": summarized_query,
-                    }
+                    # 거리 오름차순, 동률 시 URL 사전순으로 정렬 후 상한 적용
+                    state["urls"] = [u for u, _ in sorted(fallback.items(), key=lambda kv: (kv[1]["dist"], kv[0]))][:MAX_ARTICLES_PER_CLAIM]
+                    # 메타데이터에는 요약 질의를 기록
+                    for u in state["urls"]:
+                        state["meta"][u] = {
+                            "matched_cse_title": state["query"],
+                            "raw_cse_title": state["query"],
+                        }
         except Exception as e:
             logging.error(f"키워드 직접 FAISS 검색 중 오류: {e}")
-    docs = []
-    for url in article_urls:
-        faiss_db = await ensure_article_faiss(url)
-        if faiss_db:
-            for doc in faiss_db.docstore._dict.values():
-                actual_url = doc.metadata.get("url")
-                if _is_valid_url(actual_url) and actual_url not in seen_urls:
-                    meta = matched_meta.get(actual_url, {"matched_cse_title": "", "raw_cse_title": ""})
-                    docs.append(Document(
-                        page_content=doc.page_content,
-                        metadata={
-                            "url": actual_url,
-                            "matched_cse_title": meta["matched_cse_title"],
-                            "raw_cse_title": meta["raw_cse_title"]
-                        }
-                    ))
-                    break
-    return docs
+
+    # 모든 주장의 후보 기사 캐시를 한 번에 확인 (S3 존재 여부를 URL마다 조회하지 않음)
+    candidate_urls = list(dict.fromkeys(url for state in states for url in state["urls"]))
+    preloaded = await bulk_load_faiss_from_cache(candidate_urls, embed_model) if candidate_urls else {}
+
+    async def _limited_collect(state):
+        async with claim_semaphore:
+            return await _collect_docs(state, seen_urls, preloaded)
+
+    return list(await asyncio.gather(*[_limited_collect(state) for state in states]))
+
+async def search_and_retrieve_docs_once(claim, faiss_partition_dirs, seen_urls, use_google_cse=False):
+    results = await search_and_retrieve_docs_batch([claim], faiss_partition_dirs, seen_urls, use_google_cse)
+    return results[0]
 
 # --- 본문 확보된 뉴스 15개가 될 때까지 반복 확보 ---
 async def search_and_retrieve_docs(claim, faiss_partition_dirs, use_google_cse=False):
@@ -428,7 +383,7 @@ async def run_fact_check(youtube_url, faiss_partition_dirs):
 
     logging.info(f"유튜브 분석 시작: {youtube_url}")
     try:
-        transcript = fetch_youtube_transcript(youtube_url)
+        transcript = await fetch_youtube_transcript(youtube_url)
         if not transcript:
             return {"error": "Failed to load transcript"}
 
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+언론사 선택자 본문 추출(_extract_article_content_with_selectors) 테스트 스크립트
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from bs4 import BeautifulSoup
+
+from core.lambdas import _extract_article_content_with_selectors, _NON_BODY_TAGS
+
+# selectolax 전환 이전 구현의 선택자와 문단 모드 도메인. 비교 기준으로 고정
+_BASELINE_SELECTORS = {
+    "hani.co.kr": "div.article-text p.text",
+    "khan.co.kr": "#articleBody p, div#articleBody p, #articleBody p.content_text",
+    "segye.com": "article.viewBox2",
+    "hankookilbo.com": "div.col-main p.read",
+    "asiatoday.co.kr": "div.news_bm",
+    "seoul.co.kr": "div.viewContent",
+    "donga.com": "section.news_view",
+    "naeil.com": "div.article-view p",
+}
+_BASELINE_PARAGRAPH_DOMAINS = ["hani.co.kr", "khan.co.kr", "hankookilbo.com", "naeil.com"]
+
+
+def _extract_baseline(html_content, domain):
+    """최적화 이전 구현: bs4 + html.parser"""
+    selector = _BASELINE_SELECTORS[domain]
+    soup = BeautifulSoup(html_content, 'html.parser')
+    article_elements = []
+    if domain in _BASELINE_PARAGRAPH_DOMAINS:
+        for p_tag in soup.select(selector):
+            for br in p_tag.find_all('br'):
+                br.replace_with('\n')
+            text = p_tag.get_text(separator=' ').strip()
+            if text:
+                article_elements.append(text)
+    else:
+        main_content_div = soup.select_one(selector)
+        if main_content_div:
+            for tag in main_content_div.find_all(_NON_BODY_TAGS):
+                tag.decompose()
+            for br in main_content_div.find_all('br'):
+                br.replace_with('\n')
+            paragraphs = []
+            for content in main_content_div.contents:
+                if getattr(content, "name", None) == 'p':
+                    text = content.get_text(separator=' ').strip()
+                    if text:
+                        paragraphs.append(text)
+                elif isinstance(content, str) and content.strip():
+                    paragraphs.append(content.strip())
+            article_elements = ['\n\n'.join(filter(None, paragraphs))]
+    return '\n\n'.join(filter(None, article_elements))
+
+
+# 문단 모드 언론사의 <p> 안에 들어갈 본문 조각 (광고 스크립트/스타일 포함)
+# html.parser는 <br> 뒤의 <br/>를 여는 태그로 보고 나머지 문단을 그 안에 넣어 버리므로 <br>만 사용
+_PARAGRAPHS = [
+    '정부는 오늘 발표했다.<script>googletag.cmd.push(function(){x()});</script> 이어서<style>.a{}</style> 말했다.',
+    '첫 줄<br>둘째 줄<br>셋째 <b>강조</b> 줄',
+    '본문 <a href="#">링크</a> 문장',
+    '<span>중첩된</span> <em>태그</em><script type="application/ld+json">{"a": 1}</script>',
+    '   ',
+]
+
+# 컨테이너 모드 언론사의 본문 컨테이너 안쪽 HTML
+_CONTAINER_BODY = (
+    '<p>첫 문단입니다.<br>줄바꿈 뒤</p>'
+    '직계 텍스트 노드'
+    '<script>var ad = 1;</script><style>.x{}</style>'
+    '<figure><img src="a.jpg"><figcaption>사진 설명</figcaption></figure>'
+    '<div><p>중첩된 div 안의 문단</p></div>'
+    '<p>둘째 문단 <strong>강조</strong> 끝</p>'
+    '<table><tr><td>표</td></tr></table>'
+)
+
+_PAGES = {
+    "hani.co.kr": ('<div class="article-text">{}</div>', '<p class="text">{}</p>'),
+    "khan.co.kr": ('<div id="articleBody">{}</div>', '<p class="content_text">{}</p>'),
+    "hankookilbo.com": ('<div class="col-main">{}</div>', '<p class="read">{}</p>'),
+    "naeil.com": ('<div class="article-view">{}</div>', '<p>{}</p>'),
+    "segye.com": ('<article class="viewBox2">{}</article>', None),
+    "asiatoday.co.kr": ('<div class="news_bm">{}</div>', None),
+    "seoul.co.kr": ('<div class="viewContent">{}</div>', None),
+    "donga.com": ('<section class="news_view">{}</section>', None),
+}
+
+
+def test_matches_bs4_baseline():
+    """selectolax 추출 결과가 bs4/html.parser 기반 이전 구현과 같은지 확인 (script/style 내용 제외 포함)"""
+    for domain, (container, paragraph) in _PAGES.items():
+        if paragraph:
+            body = "".join(paragraph.format(p) for p in _PARAGRAPHS)
+        else:
+            body = _CONTAINER_BODY
+        html = f"<html><head><title>t</title></head><body>{container.format(body)}<p>본문 밖</p></body></html>"
+        url = f"https://www.{domain}/article/1"
+        result = _extract_article_content_with_selectors(html, url)
+        assert result == _extract_baseline(html, domain), (domain, result)
+        assert "googletag" not in result and "var ad" not in result and ".a{}" not in result
+
+
+def test_drops_noscript_and_template():
+    """문단 안의 noscript/template 내용은 본문에 넣지 않음 (html.parser는 일반 텍스트로 남겼음)"""
+    html = (
+        '<div class="article-text"><p class="text">'
+        '<noscript>자바스크립트를 켜 주세요</noscript>본문 문장<template><b>템플릿</b></template>'
+        '</p></div>'
+    )
+    assert _extract_article_content_with_selectors(html, "https://www.hani.co.kr/arti/1") == "본문 문장"
+
+
+if __name__ == "__main__":
+    test_matches_bs4_baseline()
+    test_drops_noscript_and_template()
+    print("✅ 통과")
@@ -7,6 +7,9 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+import re
+import random
+
 from core.lambdas import clean_evidence_content, clean_evidence_json
 
 def test_evidence_cleaning():
@@ -83,6 +86,83 @@ def test_evidence_cleaning():
         print(f"  {i+1}. snippet: {evidence['snippet']}")
         print(f"     justification: {evidence['justification']}")
 
+# 사전 검사/패턴 결합 최적화 이전 clean_evidence_content의 패턴 (순서대로 re.sub 적용). 비교 기준으로 고정
+_BASELINE_PATTERNS = [
+    # 기자명
+    (r'[가-힣]+\s*기자', re.IGNORECASE),
+    (r'[A-Za-z]+\s*기자', re.IGNORECASE),
+    (r'기자\s*[가-힣]+', re.IGNORECASE),
+    (r'기자\s*[A-Za-z]+', re.IGNORECASE),
+    (r'[가-힣]+\s*[A-Za-z]+\s*기자', re.IGNORECASE),
+    (r'[A-Za-z]+\s*[가-힣]+\s*기자', re.IGNORECASE),
+    (r'기자\s*[가-힣]+\s*[A-Za-z]+', re.IGNORECASE),
+    (r'기자\s*[A-Za-z]+\s*[가-힣]+', re.IGNORECASE),
+    # Copyright
+    (r'Copyright\s*©?\s*\d{4}\s*[가-힣A-Za-z\s]+', re.IGNORECASE),
+    (r'©\s*\d{4}\s*[가-힣A-Za-z\s]+', re.IGNORECASE),
+    (r'저작권\s*©?\s*\d{4}\s*[가-힣A-Za-z\s]+', re.IGNORECASE),
+    (r'무단전재\s*및\s*재배포\s*금지', re.IGNORECASE),
+    (r'무단복제\s*금지', re.IGNORECASE),
+    (r'All\s+rights\s+reserved', re.IGNORECASE),
+    (r'저작권자\s*[가-힣A-Za-z\s]+', re.IGNORECASE),
+    (r'본사\s*[가-힣A-Za-z\s]+', re.IGNORECASE),
+    (r'신문사\s*[가-힣A-Za-z\s]+', re.IGNORECASE),
+    (r'뉴스사\s*[가-힣A-Za-z\s]+', re.IGNORECASE),
+    # 언론사
+    (r'\[[가-힣A-Za-z\s]+\]', re.IGNORECASE),
+    (r'\([가-힣A-Za-z\s]+\)', re.IGNORECASE),
+    (r'[가-힣A-Za-z\s]+뉴스', re.IGNORECASE),
+    (r'[가-힣A-Za-z\s]+신문', re.IGNORECASE),
+    (r'[가-힣A-Za-z\s]+일보', re.IGNORECASE),
+    (r'[가-힣A-Za-z\s]+경제', re.IGNORECASE),
+    # 날짜/시간
+    (r'\d{4}년\s*\d{1,2}월\s*\d{1,2}일', 0),
+    (r'\d{4}-\d{1,2}-\d{1,2}', 0),
+    (r'\d{1,2}:\d{2}', 0),
+    (r'오전\s*\d{1,2}:\d{2}', 0),
+    (r'오후\s*\d{1,2}:\d{2}', 0),
+]
+
+
+def _clean_baseline(content):
+    """최적화 이전 구현: 모든 패턴을 순서대로 적용"""
+    if not content:
+        return ""
+    content = re.sub(r'<[^>]+>', '', content)
+    content = content.replace("**", "")
+    for pattern, flags in _BASELINE_PATTERNS:
+        content = re.sub(pattern, '', content, flags=flags)
+    content = re.sub(r'[ \t]+', ' ', content)
+    content = re.sub(r'\n\s*\n', '\n', content)
+    return content.strip()
+
+
+def test_matches_baseline_patterns():
+    """clean_evidence_content가 최적화 이전 패턴을 순서대로 적용한 결과와 같은지 확인"""
+    corpus = [
+        "이번 사건은 매우 심각한 문제입니다. 김철수 기자가 현장에서 확인했습니다.",
+        "경제 뉴스입니다. Copyright © 2024 한국경제. All rights reserved.",
+        "<p>[연합뉴스] 이번 사건은 매우 심각한 문제입니다. 김철수 기자. Copyright © 2024 연합뉴스.</p>",
+        "정부는 2024년 3월 5일 오전 10:30 발표했다. 서울신문 홍길동 기자 hong@seoul.co.kr",
+        # 앞 패턴의 삭제로 뒤 패턴의 필수 문자열이 새로 생기는 경우
+        "한국뉴무단복제 금지스 속보입니다",
+        "(KBS무단전재 및 재배포 금지) 2024-01-02 **굵게** 처리",
+        "저작권자 ⓒ 무단복제금지\n\n\n다음 문단\t\t입니다",
+        "통계청 자료에 따르면 실업률은 전년 대비 0.3%p 하락했다.",
+        "",
+    ]
+    # 언론사/저작권 표기 조각을 섞은 무작위 문장 (시드 고정)
+    fragments = [
+        "뉴스", "신문", "일보", "경제", "기자", "김철수", "Kim", " ", "  ", "\t", "\n", "\n\n", "[", "]", "(", ")",
+        "Copyright", "©", "2024", "저작권", "저작권자", "무단복제", "금지", "무단전재 및 재배포 금지", "All rights reserved",
+        "본사", "신문사", "뉴스사", "오전 10:30", "2024년 3월 5일", "2024-01-02", "<b>", "</b>", "**", ".", "정부는", "발표했다",
+    ]
+    rng = random.Random(0)
+    corpus += ["".join(rng.choice(fragments) for _ in range(rng.randint(1, 12))) for _ in range(3000)]
+    for text in corpus:
+        assert clean_evidence_content(text) == _clean_baseline(text), repr(text)
+
+
 if __name__ == "__main__":
     test_evidence_cleaning()
 
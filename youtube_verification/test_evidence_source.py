@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+증거 출처 키(URL 도메인) 추출 테스트 스크립트
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import random
+from urllib.parse import urlparse
+
+from core.lambdas import evidence_source_key, calculate_source_diversity_score
+
+
+def _domain_baseline(url):
+    """기존 calculate_source_diversity_score의 도메인 추출 (urlparse 기준)"""
+    try:
+        dom = urlparse(url).netloc
+    except Exception:
+        return None
+    return dom.lower() if dom else None
+
+
+def test_url_domain_matches_urlparse():
+    """URL 도메인 추출이 urlparse(url).netloc과 같은지 확인"""
+    corpus = [
+        "https://www.chosun.com/politics/2024/01/01/ABC/",
+        "http://News.KBS.co.kr/news/view.do?ncd=1",
+        "https://a.com",
+        "https://a.com?x=1",
+        "https://a.com#frag",
+        "https://user:pw@a.com:8080/x",
+        "//c.com/x",
+        " https://a.com/",
+        "\thttps://a.com/ ",
+        "https://a.com \n",
+        "https://a.com\n",
+        "https://a. com/x",
+        "https://a.com/x y",
+        "https://a.\nb.com/",
+        "http://[::1]:80/x",
+        "http://[::1/x",
+        "mailto:someone@a.com",
+        "a.com/x",
+        "1http://a.com/",
+        "https:///x",
+        "",
+    ]
+    pieces = ["https", "http", "h1+x", "1x", ":", "//", "/", "a.com", "B.co.kr", "@", ":80", "?", "#", " ", "\t", "\n", "[", "]", "::1", "x"]
+    rng = random.Random(0)
+    corpus += ["".join(rng.choice(pieces) for _ in range(rng.randint(1, 8))) for _ in range(3000)]
+    for url in corpus:
+        assert evidence_source_key({"url": url}) == _domain_baseline(url), repr(url)
+
+
+def test_whitespace_urls_count_as_sources():
+    """앞뒤 공백이 있는 URL도 출처 하나로 집계되는지 확인"""
+    evidence = [{"url": " https://a.com/1"}, {"url": "https://b.com/2 "}, {"url": "//c.com/3"}]
+    assert calculate_source_diversity_score(evidence) == calculate_source_diversity_score(
+        [{"url": "https://a.com/1"}, {"url": "https://b.com/2"}, {"url": "https://c.com/3"}]
+    )
+
+
+if __name__ == "__main__":
+    test_url_domain_matches_urlparse()
+    test_whitespace_urls_count_as_sources()
+    print("✅ 통과")
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+팩트체크 체인 출력 파서 테스트 스크립트
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import re
+
+# 모듈 로드 시 OpenAI 클라이언트를 만들므로 키가 없으면 임시 값 사용 (이 테스트는 API를 호출하지 않음)
+os.environ.setdefault("OPENAI_API_KEY", "test")
+
+from article_checker.article_fact_checker import _parse_factcheck_output, _is_relevant
+
+
+def _parse_baseline(text):
+    """단일 패스 파서 도입 이전 factcheck_doc의 추출 방식 (필드마다 re.search). 비교 기준으로 고정"""
+    relevance = re.search(r"관련성: (.+)", text)
+    fact_check_result = re.search(r"사실 설명 여부: (.+)", text)
+    justification = re.search(r"간단한 설명: (.+)", text)
+    snippet = re.search(r"핵심 근거 문장: (.+)", text, re.DOTALL)
+    if not (relevance and fact_check_result and justification):
+        return None
+    return {
+        "relevant": "예" in relevance.group(1),
+        "fact_check_result": fact_check_result.group(1).strip(),
+        "justification": justification.group(1).strip(),
+        "snippet": snippet.group(1).strip() if snippet else "",
+    }
+
+
+def _parse_new(text):
+    parsed = _parse_factcheck_output(text)
+    if parsed is None:
+        return None
+    return {
+        "relevant": _is_relevant(parsed["relevance"]),
+        "fact_check_result": parsed["fact_check_result"],
+        "justification": parsed["justification"],
+        "snippet": parsed["snippet"],
+    }
+
+
+_CASES = [
+    # 정상 형식
+    (
+        "정상 형식",
+        "관련성: 예\n사실 설명 여부: 사실\n간단한 설명: 통계청 발표와 일치합니다.\n핵심 근거 문장: 실업률은 3.1%로 집계됐다.",
+    ),
+    (
+        "근거 문장 여러 줄",
+        "관련성: 예\n사실 설명 여부: 사실\n간단한 설명: 기사와 일치\n핵심 근거 문장: 첫 문장입니다.\n둘째 문장입니다.",
+    ),
+    (
+        "관련 없음",
+        "관련성: 아니오\n사실 설명 여부: 판단 불가\n간단한 설명: 다른 사건을 다룹니다.\n핵심 근거 문장: 없음",
+    ),
+    (
+        "마침표가 붙은 값",
+        "관련성: 예.\n사실 설명 여부: 거짓.\n간단한 설명: 수치가 다릅니다.\n핵심 근거 문장: 2.4%로 집계됐다.",
+    ),
+    (
+        "근거 문장 없음",
+        "관련성: 예\n사실 설명 여부: 사실\n간단한 설명: 일치합니다.",
+    ),
+    # 필드 누락 (두 파서 모두 채택하지 않아야 함)
+    ("관련성 누락", "사실 설명 여부: 사실\n간단한 설명: 일치합니다.\n핵심 근거 문장: 문장"),
+    ("사실 설명 여부 누락", "관련성: 예\n간단한 설명: 일치합니다.\n핵심 근거 문장: 문장"),
+    ("간단한 설명 누락", "관련성: 예\n사실 설명 여부: 사실\n핵심 근거 문장: 문장"),
+    ("빈 응답", ""),
+    ("라벨 없는 응답", "죄송하지만 판단할 수 없습니다."),
+    # 한국어 라벨 변형 (목록 기호/강조 표시/앞뒤 문장)
+    (
+        "목록 기호",
+        "- 관련성: 예\n- 사실 설명 여부: 사실\n- 간단한 설명: 보도 내용과 같습니다.\n- 핵심 근거 문장: 정부는 지원을 발표했다.",
+    ),
+    (
+        "앞에 설명 문장",
+        "검토 결과는 다음과 같습니다.\n\n관련성: 예\n사실 설명 여부: 대체로 사실\n간단한 설명: 세부 수치만 다릅니다.\n핵심 근거 문장: 약 30%가 증가했다.",
+    ),
+    (
+        "라벨 사이 빈 줄",
+        "관련성: 아니오\n\n사실 설명 여부: 판단 불가\n\n간단한 설명: 관련 내용이 없습니다.\n\n핵심 근거 문장: 해당 없음",
+    ),
+]
+
+
+def test_parser_matches_baseline():
+    """단일 패스 파서가 기존 필드별 정규식 추출과 같은 결과를 내는지 확인"""
+    for name, text in _CASES:
+        assert _parse_new(text) == _parse_baseline(text), name
+
+
+def test_relevance_suffix():
+    """관련성 값은 끝이 '예'인지로 판정 (공백/마침표/강조 표시 무시)"""
+    assert _is_relevant("예")
+    assert _is_relevant("예.")
+    assert _is_relevant("예**")
+    assert not _is_relevant("아니오")
+    assert not _is_relevant("아니요")
+
+
+if __name__ == "__main__":
+    test_parser_matches_baseline()
+    test_relevance_suffix()
+    print("✅ 통과")
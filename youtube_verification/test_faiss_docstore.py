@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+FAISS 캐시 직렬화(docstore 포맷) 테스트 스크립트
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import tempfile
+
+from langchain_community.embeddings import FakeEmbeddings
+from langchain_community.vectorstores import FAISS
+
+from core.faiss_manager import serialize_faiss, deserialize_faiss, save_faiss_local, load_faiss_local
+
+_EMBED = FakeEmbeddings(size=16)
+
+
+def _build_db(metadatas):
+    texts = [f"기사 본문 {i}번 문단입니다." for i in range(len(metadatas))]
+    return FAISS.from_texts(texts, _EMBED, metadatas=metadatas)
+
+
+def _snapshot(db):
+    """비교용: index→docstore id 매핑과 문서 내용/메타데이터, 인덱스 벡터"""
+    docs = {doc_id: (doc.page_content, doc.metadata) for doc_id, doc in db.docstore._dict.items()}
+    vectors = db.index.reconstruct_n(0, db.index.ntotal).tolist()
+    return dict(db.index_to_docstore_id), docs, vectors
+
+
+def test_serialize_round_trip():
+    """serialize_faiss → deserialize_faiss 후 문서/매핑/벡터가 같은지 확인 (orjson 포맷)"""
+    db = _build_db([{"url": f"https://news.example.com/{i}", "rank": i} for i in range(5)])
+    index_bytes, docstore_bytes = serialize_faiss(db)
+    assert docstore_bytes[:1] == b"\x01"
+    restored = deserialize_faiss(index_bytes, docstore_bytes, _EMBED)
+    assert _snapshot(restored) == _snapshot(db)
+
+
+def test_serialize_falls_back_to_pickle():
+    """orjson으로 직렬화할 수 없는 메타데이터는 pickle로 저장되고 그대로 복원되는지 확인"""
+    db = _build_db([{"url": "https://news.example.com/1", "tags": {"정치", "경제"}}])
+    index_bytes, docstore_bytes = serialize_faiss(db)
+    assert docstore_bytes[:1] == b"\x80"
+    restored = deserialize_faiss(index_bytes, docstore_bytes, _EMBED)
+    assert _snapshot(restored) == _snapshot(db)
+
+
+def test_load_legacy_save_local():
+    """기존 FAISS.save_local(pickle) 캐시와 save_faiss_local 캐시를 모두 load_faiss_local로 읽는지 확인"""
+    db = _build_db([{"url": f"https://news.example.com/{i}"} for i in range(3)])
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_dir = os.path.join(tmp, "legacy")
+        db.save_local(legacy_dir)
+        assert _snapshot(load_faiss_local(legacy_dir, _EMBED)) == _snapshot(db)
+
+        new_dir = os.path.join(tmp, "new")
+        save_faiss_local(db, new_dir)
+        with open(os.path.join(new_dir, "index.pkl"), "rb") as f:
+            assert f.read(1) == b"\x01"
+        assert _snapshot(load_faiss_local(new_dir, _EMBED)) == _snapshot(db)
+
+
+if __name__ == "__main__":
+    test_serialize_round_trip()
+    test_serialize_falls_back_to_pickle()
+    test_load_legacy_save_local()
+    print("✅ 통과")
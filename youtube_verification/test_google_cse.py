@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Google CSE 검색(캐시, Retry-After 재시도, 다운시프트 우선순위) 테스트 스크립트
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import json
+import asyncio
+
+# 키/엔진 ID가 없으면 검색을 시작하지 않으므로 임시 값 사용 (요청은 아래 가짜 세션이 받음)
+os.environ.setdefault("GOOGLE_API_KEY", "test-key")
+os.environ.setdefault("GOOGLE_CSE_ID", "test-cx")
+
+from core import lambdas
+from core.lambdas import search_news_google_cs, CSE_RETRY_AFTER_MAX_SEC
+
+
+class _StubRequest:
+    def __init__(self, handler, params):
+        self._handler = handler
+        self._params = params
+
+    async def __aenter__(self):
+        self.status, body, self.headers = await self._handler(self._params)
+        self._body = json.dumps(body).encode("utf-8")
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def read(self):
+        return self._body
+
+
+class _StubSession:
+    """aiohttp 세션 대신 handler(params) → (status, body, headers)로 응답하고 요청 파라미터를 기록"""
+    closed = False
+
+    def __init__(self, handler):
+        self._handler = handler
+        self.requests = []
+
+    def get(self, url, params=None, **kwargs):
+        self.requests.append(dict(params))
+        return _StubRequest(self._handler, params)
+
+
+def _search(handler, *queries):
+    """가짜 세션으로 search_news_google_cs를 차례로 호출하고 (결과 목록, 요청 목록)을 반환"""
+    session = _StubSession(handler)
+
+    async def _get_session():
+        return session
+
+    async def _run():
+        return [await search_news_google_cs(q) for q in queries]
+
+    original = lambdas.get_session
+    lambdas.get_session = _get_session
+    try:
+        return asyncio.run(_run()), session.requests
+    finally:
+        lambdas.get_session = original
+
+
+def _items(title):
+    return {"items": [{"title": title, "link": f"https://news.example.com/{title}"}]}
+
+
+def test_cache_hit_skips_request():
+    """같은 쿼리를 다시 검색하면 캐시된 결과를 쓰고 요청을 보내지 않는지 확인"""
+    async def handler(params):
+        return 200, _items("캐시 기사"), {}
+
+    (first, second), requests = _search(handler, "캐시 테스트 물가", "캐시 테스트 물가")
+    assert first == second == _items("캐시 기사")["items"]
+    assert len(requests) == 1
+
+
+def test_short_retry_after_is_retried():
+    """429 응답의 Retry-After가 짧으면 기다렸다가 재시도하는지 확인"""
+    calls = []
+
+    async def handler(params):
+        calls.append(params.get("start"))
+        if len(calls) == 1:
+            return 429, {"error": {"code": 429, "message": "Rate Limit Exceeded"}}, {"Retry-After": "0.05"}
+        return 200, _items("재시도 기사"), {}
+
+    (items,), requests = _search(handler, "재시도 테스트 환율")
+    assert items == _items("재시도 기사")["items"]
+    assert [r.get("start") for r in requests] == [None, None]
+
+
+def test_long_retry_after_gives_up():
+    """Retry-After가 CSE_RETRY_AFTER_MAX_SEC보다 길면 같은 요청을 재시도하지 않는지 확인"""
+    retry_after = str(CSE_RETRY_AFTER_MAX_SEC + 60)
+
+    async def handler(params):
+        return 429, {"error": {"code": 429, "message": "Quota exceeded"}}, {"Retry-After": retry_after}
+
+    (items,), requests = _search(handler, "포기 테스트 금리")
+    assert items == []
+    # 1페이지 1번, (1페이지가 0건이라) 2페이지 1번만 요청하고 재시도는 없음
+    assert [r.get("start") for r in requests] == [None, 11]
+
+
+def test_original_query_has_priority_over_speculative():
+    """긴 쿼리에서 먼저 끝난 다운시프트 결과보다 원 쿼리 결과가 우선하는지 확인"""
+    query = "국회 위원장 발언을 제지했다 있다 예산안 처리 과정 속기록 공개 요구"
+    assert len(query) >= lambdas.CSE_SPECULATIVE_MIN_QUERY_LEN
+
+    async def handler(params):
+        if params["q"] == query:
+            await asyncio.sleep(0.1)
+            return 200, _items("원 쿼리"), {}
+        return 200, _items("다운시프트"), {}
+
+    (items,), requests = _search(handler, query)
+    assert items == _items("원 쿼리")["items"]
+    # 순차 실행이었다면 원 쿼리에 결과가 있으므로 다운시프트(불용어 제거) 요청은 나가지 않음
+    assert {r["q"] for r in requests} == {query, "국회 예산안 처리 과정 속기록 공개 요구"}
+
+
+if __name__ == "__main__":
+    test_cache_hit_skips_request()
+    test_short_retry_after_is_retried()
+    test_long_retry_after_gives_up()
+    test_original_query_has_priority_over_speculative()
+    print("✅ 통과")